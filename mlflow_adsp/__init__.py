@@ -3,19 +3,26 @@
 from . import _version
 from .backend import ADSPProjectBackend, adsp_backend_builder
 from .common.adsp import create_session, get_project_id
+from .common.async_scheduler import AsyncScheduler
+from .common.cancellation_token import CancellationToken
+from .common.checkpoint_store import CheckpointStore
 from .common.log import set_log_level
 from .common.process import process_launch_wait
 from .common.scheduler import Scheduler
 from .common.tracking import create_unique_name, upsert_experiment
 from .contracts.dto.base_model import BaseModel
+from .contracts.dto.cached_submitted_run import CachedSubmittedRun
 from .contracts.dto.endpoint_manager_parameters import EndpointManagerParameters
 from .contracts.dto.job import Job
+from .contracts.dto.scheduler_options import SchedulerOptions
 from .contracts.dto.step import Step
 from .contracts.dto.target_metadata import TargetMetadata
 from .contracts.errors.plugin import ADSPMLFlowPluginError
 from .contracts.errors.subprocess_failure_error import SubprocessFailureError
+from .contracts.types.change_detection_type import ChangeDetectionType
 from .contracts.types.job_run_state import AEProjectJobRunStateType
 from .contracts.types.log_level import LogLevel
+from .contracts.types.reload_strategy_type import ReloadStrategyType
 from .contracts.types.reloadable_model_uri_type import ReloadableModelUriType
 from .serve import serve
 from .services.endpoint_manager import EndpointManager
@@ -1,7 +1,7 @@
 """ MLFlow Backend Plugin For Anaconda Data Science Platform Definition """
 
 import logging
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from mlflow.entities import Run
 from mlflow.projects._project_spec import Project
@@ -10,19 +10,22 @@ from mlflow.projects.utils import PROJECT_STORAGE_DIR, fetch_and_validate_projec
 
 from ae5_tools.api import AEUserSession
 
-from .common.adsp import create_session, get_project_id
+from .common.adsp import get_project_id, get_session, is_session_rejected, refresh_session
 from .contracts.dto.base_model import BaseModel
 from .submitted_run import ADSPSubmittedRun
 
 logger = logging.getLogger(__name__)
 
+# The `backend_config` options controlling how synchronous runs are waited on (see `ADSPSubmittedRun`).
+WAIT_CONFIG_KEYS: List[str] = ["wait_interval", "wait_interval_max", "wait_backoff_factor", "wait_timeout"]
+
 
 def adsp_backend_builder() -> AbstractBackend:
     """
     This function will act as our handler for setting up the plugin.
 
     This function is responsible for:
-    1. Creating an Anaconda Data Science Platform Session and Connecting.
+    1. Getting a connected Anaconda Data Science Platform Session (shared within the process).
     2. Instantiating an Anaconda Data Science Platform Backend with the created session.
 
     Returns
@@ -31,7 +34,7 @@ def adsp_backend_builder() -> AbstractBackend:
         An instance of the plugin.
     """
 
-    return ADSPProjectBackend(ae_session=create_session())
+    return ADSPProjectBackend(ae_session=get_session())
 
 
 class ADSPProjectBackend(AbstractBackend, BaseModel):
@@ -122,11 +125,15 @@ class ADSPProjectBackend(AbstractBackend, BaseModel):
             resource_profile=resource_profile,
         )
 
+        # Waiting behavior (used for synchronous runs) can be defined within backend_config.json
+        wait_config: Dict = {key: backend_config[key] for key in WAIT_CONFIG_KEYS if key in backend_config}
+
         return ADSPSubmittedRun(
             ae_session=self.ae_session,
             mlflow_run_id=active_run.info.run_id,
             adsp_job_id=job_create_response["id"],
             response=job_create_response,
+            **wait_config,
         )
 
     @staticmethod
@@ -159,6 +166,21 @@ class ADSPProjectBackend(AbstractBackend, BaseModel):
         """
 
         # Create a run-now job
+        try:
+            return self._create_job(mlflow_run_id=mlflow_run_id, resource_profile=resource_profile, variables=variables)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            if not is_session_rejected(error=error):
+                raise error
+
+        # The platform rejected the (pooled) session, retry once with a newly connected one.
+        self.ae_session = refresh_session(ae_session=self.ae_session)
+        return self._create_job(mlflow_run_id=mlflow_run_id, resource_profile=resource_profile, variables=variables)
+
+    def _create_job(
+        self, mlflow_run_id: str, resource_profile: Optional[str] = None, variables: Optional[Dict] = None
+    ) -> Dict:
+        """Creates (and runs) the `run-once` job, see `_submit_job`."""
+
         job_create_result: Dict = self.ae_session.job_create(
             ident=get_project_id(),
             name=mlflow_run_id,
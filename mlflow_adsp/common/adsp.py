@@ -1,12 +1,29 @@
 """ Authentication / Authorization Helper Functions """
 
+import logging
 import os
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple
 
-from ae5_tools import demand_env_var, load_ae5_user_secrets
+from ae5_tools import demand_env_var, get_env_var, load_ae5_user_secrets
 from ae5_tools.api import AEUserSession
 
 from ..contracts.errors.plugin import ADSPMLFlowPluginError
 
+logger = logging.getLogger(__name__)
+
+# The time (in seconds) a pooled session is used for before it is re-authenticated.
+DEFAULT_SESSION_MAX_AGE: float = 1800
+
+# Connected sessions (and when they last authenticated) shared within the process, keyed by hostname and username.
+_session_pool: Dict[Tuple[str, str], Tuple[AEUserSession, float]] = {}
+_session_pool_lock: threading.Lock = threading.Lock()
+
+# Set once the user secrets have been loaded into the environment for the pool (updated with the pool lock held).
+_session_secrets_loaded: threading.Event = threading.Event()
+
 
 def create_session() -> AEUserSession:
     """
@@ -22,6 +39,19 @@ def create_session() -> AEUserSession:
     # Load defined environmental variables
     load_ae5_user_secrets()
 
+    return _connect_session()
+
+
+def _connect_session() -> AEUserSession:
+    """
+    Creates and connects a session for the Anaconda Data Science Platform credentials in the environment.
+
+    Returns
+    -------
+    session: AEUserSession
+        An instance of an Anaconda Data Science Platform user session.
+    """
+
     # Create the session directly and provide the AE5 config and credentials:
     ae_session: AEUserSession = AEUserSession(
         hostname=demand_env_var(name="AE5_HOSTNAME"),
@@ -36,6 +66,118 @@ def create_session() -> AEUserSession:
     return ae_session
 
 
+def _get_session_key() -> Tuple[str, str]:
+    """
+    Gets the pool key of the credentials in the environment, loading the user secrets on first use.
+    Must be called with the pool lock held.
+    """
+
+    if not _session_secrets_loaded.is_set():
+        load_ae5_user_secrets()
+        _session_secrets_loaded.set()
+    return demand_env_var(name="AE5_HOSTNAME"), demand_env_var(name="AE5_USERNAME")
+
+
+def get_session(max_age: Optional[float] = None) -> AEUserSession:
+    """
+    Gets a connected session for the Anaconda Data Science Platform credentials in the environment, shared by every
+    caller within the process.  The session (and its pool of kept-alive HTTP connections) is created on first use, so
+    repeated backend invocations do not each log in again.
+
+    Sessions are replaced by a newly connected session once they are older than `max_age`, before their tokens
+    expire.  Sessions rejected by the platform before then are replaced with `refresh_session`.
+
+    Parameters
+    ----------
+    max_age: Optional[float] = None
+        The time (in seconds) a session is used for before it is re-authenticated.  If unset `ADSP_SESSION_MAX_AGE` is
+        used, falling back to 30 minutes.
+
+    Returns
+    -------
+    session: AEUserSession
+        An instance of an Anaconda Data Science Platform user session.
+    """
+
+    with _session_pool_lock:
+        key: Tuple[str, str] = _get_session_key()
+        if max_age is None:
+            max_age = float(get_env_var(name="ADSP_SESSION_MAX_AGE") or DEFAULT_SESSION_MAX_AGE)
+
+        if key in _session_pool:
+            ae_session, connected_at = _session_pool[key]
+            if time.monotonic() - connected_at < max_age:
+                return ae_session
+
+            message: str = f"Re-authenticating session for: {key[1]}@{key[0]}"
+            logger.debug(message)
+
+        # Sessions already handed out are left untouched, callers holding them keep working until they are rejected.
+        _session_pool[key] = (_connect_session(), time.monotonic())
+        return _session_pool[key][0]
+
+
+def refresh_session(ae_session: AEUserSession) -> AEUserSession:
+    """
+    Replaces a session rejected by the platform (e.g. its token was revoked) with a newly connected session.
+    Concurrent callers refreshing the same session share a single replacement.
+
+    Parameters
+    ----------
+    ae_session: AEUserSession
+        The rejected session.
+
+    Returns
+    -------
+    session: AEUserSession
+        The replacement session.
+    """
+
+    with _session_pool_lock:
+        key: Tuple[str, str] = _get_session_key()
+        if key not in _session_pool or _session_pool[key][0] is ae_session:
+            message: str = f"Session rejected, re-authenticating session for: {key[1]}@{key[0]}"
+            logger.debug(message)
+            _session_pool[key] = (_connect_session(), time.monotonic())
+        return _session_pool[key][0]
+
+
+def is_session_rejected(error: Exception) -> bool:
+    """
+    Determines whether a failed platform request was rejected because the session is no longer authenticated.
+
+    Parameters
+    ----------
+    error: Exception
+        The error raised by the request.
+
+    Returns
+    -------
+    rejected: bool
+        `True` if the platform responded with `401 Unauthorized`.
+    """
+
+    status_code: Optional[int] = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if status_code is None:
+        # ae5_tools reports unexpected responses within the error message.
+        match: Optional[re.Match] = re.search(r"Unexpected response: (\d{3})", str(error))
+        status_code = int(match.group(1)) if match else None
+    return status_code == 401
+
+
+def clear_sessions() -> None:
+    """
+    Removes every session from the process-wide pool (e.g. after credentials change), they are created again (and the
+    user secrets loaded again) on use.
+    """
+
+    with _session_pool_lock:
+        _session_pool.clear()
+        _session_secrets_loaded.clear()
+
+
 def get_project_id() -> str:
     """
     Inspected the run-time environment for the project Id.
@@ -0,0 +1,104 @@
+""" Asyncio Scheduler for MLFlow Workflow Steps On ADSP """
+
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+from ..contracts.dto.job import Job
+from ..contracts.dto.scheduler_options import SchedulerOptions
+from ..contracts.dto.step import Step
+from .cancellation_token import CancellationToken
+from .checkpoint_store import CheckpointStore
+from .scheduler import Scheduler
+
+
+class AsyncScheduler(Scheduler):
+    """
+    The AsyncScheduler processes work queues from asynchronous code, without blocking the event loop.
+
+    It shares the job limiting, retries, dependencies, cancellation and checkpointing of the `Scheduler`.
+    """
+
+    async def iter_work_queue_async(
+        self,
+        steps: List[Step],
+        *,
+        options: Optional[SchedulerOptions] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+    ) -> AsyncIterator[Job]:
+        """
+        Processing a list of execution requests without blocking the event loop, yielding each job as it completes.
+        See `iter_work_queue` for details and parameters.
+
+        Submissions and status reviews (which block on the platform and the tracking server) are offloaded to an
+        executor, and the waits between reviews are asyncio sleeps, so other coroutines keep running while the work
+        queue is processed.
+
+        Yields
+        ------
+        job: Job
+            Each job, as soon as it has completed (successfully or not).
+        """
+
+        self._reset(
+            failed_execution_retry_max=self.failed_execution_retry_max, max_workers=self.max_workers, options=options
+        )
+        self._build_jobs(steps=steps)
+        self._attach_checkpoint_store(checkpoint_store=checkpoint_store)
+        async for job in self._process_work_queue_async(
+            cancellation_token=cancellation_token, retain_jobs=self.options.retain_jobs
+        ):
+            yield job
+
+    async def process_work_queue_async(
+        self,
+        steps: List[Step],
+        *,
+        options: Optional[SchedulerOptions] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+    ) -> List[Job]:
+        """
+        Processing a list of execution requests without blocking the event loop.
+        See `iter_work_queue_async` for details and parameters.
+
+        Returns
+        -------
+        runs: List[Job]
+            A list of results from the work queue.
+        """
+
+        self._reset(
+            failed_execution_retry_max=self.failed_execution_retry_max, max_workers=self.max_workers, options=options
+        )
+        self._build_jobs(steps=steps)
+        self._attach_checkpoint_store(checkpoint_store=checkpoint_store)
+        async for _ in self._process_work_queue_async(cancellation_token=cancellation_token, retain_jobs=True):
+            pass
+        return list(self.jobs.values())
+
+    async def _process_work_queue_async(
+        self, cancellation_token: Optional[CancellationToken], retain_jobs: bool
+    ) -> AsyncIterator[Job]:
+        """
+        Processes the built work queue without blocking the event loop, yielding each job as soon as it completes.
+        """
+
+        token: CancellationToken = cancellation_token if cancellation_token is not None else CancellationToken()
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        retries: int = 0
+        while self._work_queue_in_progress():
+            jobs: List[Job] = await loop.run_in_executor(None, self._advance_work_queue, token)
+            for job in jobs:
+                yield job
+                self._release_job(job=job, token=token, retain_jobs=retain_jobs)
+
+            if token.cancelled:
+                continue
+
+            if self._work_queue_is_full():
+                await asyncio.sleep(pow(self.options.exponent, retries) * self.options.interval)  # exponential backoff
+                retries += 1
+            else:
+                retries = 0
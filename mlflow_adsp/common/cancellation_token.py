@@ -0,0 +1,58 @@
+""" Cooperative Cancellation """
+
+import threading
+import time
+from typing import Optional
+
+
+class CancellationToken:
+    """
+    A thread safe flag used to request that long-running work (such as a scheduler work queue) stops.
+
+    The token is cancelled explicitly through `cancel`, or implicitly once its (optional) wall-clock budget is spent.
+
+    Attributes
+    ----------
+    timeout: Optional[float] = None
+        The wall-clock budget (in seconds) from creation, after which the token is cancelled.
+    reason: Optional[str]
+        Why the token was cancelled, `None` if it has not been.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+        self.reason: Optional[str] = None
+
+        self._deadline: Optional[float] = time.monotonic() + timeout if timeout is not None else None
+        self._event: threading.Event = threading.Event()
+        self._lock: threading.Lock = threading.Lock()
+
+    def cancel(self, reason: str = "Cancellation requested") -> None:
+        """
+        Cancels the token.  Only the first reason is kept.
+
+        Parameters
+        ----------
+        reason: str = "Cancellation requested"
+            Why the token was cancelled.
+        """
+
+        with self._lock:
+            if not self._event.is_set():
+                self.reason = reason
+                self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        `cancelled` Property
+
+        Returns
+        -------
+        cancelled: bool
+            `True` if the token was cancelled or its budget is spent, `False` otherwise.
+        """
+
+        if not self._event.is_set() and self._deadline is not None and time.monotonic() >= self._deadline:
+            self.cancel(reason=f"Wall-clock budget of {self.timeout} seconds spent")
+        return self._event.is_set()
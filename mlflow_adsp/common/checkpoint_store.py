@@ -0,0 +1,290 @@
+""" Scheduler Checkpoint Store """
+
+import json
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+
+from ae5_tools.api import AEUserSession
+
+from ..contracts.dto.cached_submitted_run import CachedSubmittedRun
+from ..contracts.dto.job import Job
+from ..contracts.dto.step import Step
+from ..contracts.errors.plugin import ADSPMLFlowPluginError
+from ..submitted_run import ADSPSubmittedRun
+from .adsp import get_session
+from .work_queue import WorkQueue
+
+
+class CheckpointStore:
+    """
+    Persists scheduler job records to a local SQLite database, so that a work queue can be resumed (reattaching to
+    the runs in progress) after the driver fails.
+
+    Records are JSON documents keyed by job id, and are read back in the order they were first written.
+
+    Attributes
+    ----------
+    path: str
+        The path of the SQLite database file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self._lock: threading.Lock = threading.Lock()
+        # The scheduler may write from executor threads (see `AsyncScheduler.iter_work_queue_async`).
+        self._connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, record TEXT NOT NULL)")
+
+    def write(self, records: List[Dict]) -> None:
+        """
+        Inserts or updates job records in a single transaction.
+
+        Parameters
+        ----------
+        records: List[Dict]
+            The job records, each with an `id`.
+        """
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO jobs (id, record) VALUES (?, ?) ON CONFLICT (id) DO UPDATE SET record = excluded.record",
+                [(record["id"], json.dumps(record)) for record in records],
+            )
+
+    def read(self) -> List[Dict]:
+        """
+        Reads every job record.
+
+        Returns
+        -------
+        records: List[Dict]
+            The job records, in the order they were first written.
+        """
+
+        with self._lock:
+            rows: List = self._connection.execute("SELECT record FROM jobs ORDER BY rowid").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def clear(self) -> None:
+        """Removes every job record."""
+
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM jobs")
+
+    def close(self) -> None:
+        """Closes the database."""
+
+        with self._lock:
+            self._connection.close()
+
+
+def to_checkpoint_record(job: Job, state: str, waiting_on: Iterable[str]) -> Dict:
+    """
+    Builds the checkpoint record of a job.
+
+    Parameters
+    ----------
+    job: Job
+        The job to record.
+    state: str
+        The scheduling state of the job (`todo`, `inprogress`, `blocked` or `complete`).
+    waiting_on: Iterable[str]
+        The ids of the jobs it is still waiting on.
+
+    Returns
+    -------
+    record: Dict
+        The (JSON serializable) job record.
+    """
+
+    return {
+        "id": job.id,
+        "state": state,
+        "step": job.step.model_dump(mode="json"),
+        "runs": [
+            {
+                "mlflow_run_id": run.run_id,
+                "adsp_job_id": run.adsp_job_id if isinstance(run, ADSPSubmittedRun) else None,
+                "cached": isinstance(run, CachedSubmittedRun),
+            }
+            for run in job.runs
+        ],
+        "last_status": job.last_status,
+        "failed_submissions": job.failed_submissions,
+        "blocked_by": job.blocked_by,
+        "cancelled": job.cancelled,
+        "waiting_on": sorted(waiting_on),
+    }
+
+
+def from_checkpoint_record(record: Dict, ae_session: Optional[AEUserSession] = None) -> Job:
+    """
+    Rebuilds a job from its checkpoint record, reattaching to its ADSP runs and the finished runs it reused.
+    Runs of other backends (e.g. local runs) can not be reattached to, and are dropped.
+
+    Parameters
+    ----------
+    record: Dict
+        The job record.
+    ae_session: Optional[AEUserSession] = None
+        The session used to reattach to the runs.  If unset the shared session is used.
+
+    Returns
+    -------
+    job: Job
+        The rebuilt job.
+    """
+
+    job: Job = Job(
+        id=record["id"],
+        step=Step(**record["step"]),
+        failed_submissions=record["failed_submissions"],
+        blocked_by=record["blocked_by"],
+        cancelled=record["cancelled"],
+    )
+    job.last_status = record["last_status"]
+
+    for run in record["runs"]:
+        if run.get("cached", False):
+            job.runs.append(CachedSubmittedRun(mlflow_run_id=run["mlflow_run_id"]))
+        elif run["adsp_job_id"] is not None:
+            if ae_session is None:
+                ae_session = get_session()
+            job.runs.append(
+                ADSPSubmittedRun(
+                    ae_session=ae_session,
+                    mlflow_run_id=run["mlflow_run_id"],
+                    adsp_job_id=run["adsp_job_id"],
+                    response={},
+                )
+            )
+    return job
+
+
+def is_reattachable(run: Dict) -> bool:
+    """
+    Determines whether a run of a checkpoint record is rebuilt when the job is restored.
+
+    Parameters
+    ----------
+    run: Dict
+        The run record.
+
+    Returns
+    -------
+    reattachable: bool
+        `True` for ADSP runs and reused finished runs, `False` otherwise.
+    """
+
+    return run["adsp_job_id"] is not None or run.get("cached", False)
+
+
+class CheckpointWriter:
+    """
+    Records the changes made to a work queue to a checkpoint store (if any), in batches.
+
+    Attributes
+    ----------
+    store: Optional[CheckpointStore]
+        Where the work queue is recorded as it is processed.  Nothing is recorded if unset.
+    changed: Set[str]
+        The ids of the jobs changed since the last checkpoint.
+    """
+
+    def __init__(self, store: Optional[CheckpointStore] = None):
+        self.store = store
+        self.changed: Set[str] = set()
+
+    def mark(self, job_id: str) -> None:
+        """
+        Marks a job as changed, so that it is recorded on the next flush.
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the changed job.
+        """
+
+        self.changed.add(job_id)
+
+    def start(self, work_queue: WorkQueue) -> None:
+        """
+        Starts recording a (newly built) work queue, replacing anything recorded before.
+
+        Parameters
+        ----------
+        work_queue: WorkQueue
+            The work queue to record.
+        """
+
+        if self.store is None:
+            return
+
+        self.store.clear()
+        self.changed.update(work_queue.jobs.keys())
+        self.flush(work_queue=work_queue)
+
+    def restore(self, work_queue: WorkQueue, ae_session: Optional[AEUserSession] = None) -> None:
+        """
+        Rebuilds a work queue from the checkpoint store, reattaching to the ADSP runs in progress.
+
+        Parameters
+        ----------
+        work_queue: WorkQueue
+            The (empty) work queue to rebuild.
+        ae_session: Optional[AEUserSession] = None
+            The session used to reattach to the runs in progress.  If unset the shared session is used.
+        """
+
+        records: List[Dict] = self.store.read() if self.store is not None else []
+        if len(records) < 1:
+            raise ADSPMLFlowPluginError("Checkpoint store contains no jobs to resume")
+
+        for record in records:
+            job: Job = from_checkpoint_record(record=record, ae_session=ae_session)
+            work_queue.jobs[job.id] = job
+
+        for record in records:
+            job_id: str = record["id"]
+            if record["state"] == "complete":
+                work_queue.complete.add(job_id)
+            elif record["state"] == "blocked":
+                work_queue.blocked[job_id] = set(record["waiting_on"])
+                for parent_id in record["waiting_on"]:
+                    work_queue.dependents.setdefault(parent_id, []).append(job_id)
+            elif record["state"] == "inprogress" and is_reattachable(run=record["runs"][-1]):
+                work_queue.inprogress.append(job_id)
+            else:
+                work_queue.enqueue(job_id=job_id)
+                self.changed.add(job_id)
+
+        self.flush(work_queue=work_queue)
+
+    def flush(self, work_queue: WorkQueue) -> None:
+        """
+        Records the jobs changed since the last checkpoint (in a single write).
+
+        Parameters
+        ----------
+        work_queue: WorkQueue
+            The work queue being recorded.
+        """
+
+        if self.store is not None and len(self.changed) > 0:
+            inprogress: Set[str] = set(work_queue.inprogress)
+            # Written in submission order, which is the order records are read back in.
+            self.store.write(
+                records=[
+                    to_checkpoint_record(
+                        job=work_queue.jobs[job_id],
+                        state=work_queue.get_state(job_id=job_id, inprogress=inprogress),
+                        waiting_on=work_queue.blocked.get(job_id, []),
+                    )
+                    for job_id in work_queue.jobs
+                    if job_id in self.changed
+                ]
+            )
+        self.changed.clear()
@@ -0,0 +1,100 @@
+""" Priority Queue With Weighted Fair-Sharing """
+
+import heapq
+import itertools
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class FairShareQueue:
+    """
+    A priority queue with weighted fair-sharing between groups (e.g. tenants or teams).
+
+    Items with a higher priority are popped first.  Among the groups holding items of the highest pending priority,
+    the group which has been served the least (relative to its weight) is served next, so a group with a large backlog
+    can not starve the others.  Items of the same group and priority are popped first in, first out.
+
+    Attributes
+    ----------
+    weights: Dict[str, float]
+        The share weight of each group.  A group with twice the weight is served twice as often.
+    default_weight: float = 1.0
+        The share weight of groups without an explicit weight (including the `None` group).
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, default_weight: float = 1.0):
+        self.weights = dict(weights or {})
+        self.default_weight = default_weight
+
+        self._heaps: Dict[Optional[str], List[Tuple[int, int, str]]] = {}
+        self._virtual_time: Dict[Optional[str], float] = {}
+        self._sequence: Iterator[int] = itertools.count()
+        self._length: int = 0
+
+    def append(self, item: str, priority: int = 0, group: Optional[str] = None) -> None:
+        """
+        Adds an item to the queue.
+
+        Parameters
+        ----------
+        item: str
+            The item to add.
+        priority: int = 0
+            The item priority, higher priorities are popped first.
+        group: Optional[str] = None
+            The fair-share group of the item.
+        """
+
+        heap: List[Tuple[int, int, str]] = self._heaps.setdefault(group, [])
+        if len(heap) < 1:
+            # A group (re)joining the queue starts level with the active groups, rather than with credit for the
+            # time it was idle.
+            active: List[float] = [self._virtual_time[name] for name, items in self._heaps.items() if len(items) > 0]
+            self._virtual_time[group] = max([self._virtual_time.get(group, 0.0)] + ([min(active)] if active else []))
+
+        heapq.heappush(heap, (-priority, next(self._sequence), item))
+        self._length += 1
+
+    def popleft(self) -> str:
+        """
+        Removes and returns the next item.
+
+        Returns
+        -------
+        item: str
+            The next item.
+        """
+
+        if self._length < 1:
+            raise IndexError("pop from an empty queue")
+
+        candidates: List[Tuple[Optional[str], List[Tuple[int, int, str]]]] = [
+            (group, heap) for group, heap in self._heaps.items() if len(heap) > 0
+        ]
+        top: int = min(heap[0][0] for _, heap in candidates)
+        group, heap = min(
+            ((group, heap) for group, heap in candidates if heap[0][0] == top),
+            key=lambda candidate: (self._virtual_time[candidate[0]], candidate[1][0][1]),
+        )
+
+        _, _, item = heapq.heappop(heap)
+        self._virtual_time[group] += 1 / self.weights.get(group, self.default_weight)
+        self._length -= 1
+        return item
+
+    def clear(self) -> None:
+        """Removes every item (share accounting is kept)."""
+
+        for heap in self._heaps.values():
+            heap.clear()
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the items in the order they were added."""
+
+        entries: List[Tuple[int, int, str]] = sorted(
+            (entry for heap in self._heaps.values() for entry in heap), key=lambda entry: entry[1]
+        )
+        return iter([item for _, _, item in entries])
@@ -0,0 +1,146 @@
+""" Job Log Archival """
+
+import gzip
+import os
+import tempfile
+from typing import BinaryIO, Iterable, Optional, Tuple
+
+import mlflow
+
+# The run tags holding the size (in bytes) and line count of the full job log.
+JOB_LOG_SIZE_TAG: str = "mlflow_adsp.job_log_size"
+JOB_LOG_LINES_TAG: str = "mlflow_adsp.job_log_lines"
+
+
+def archive_log(
+    chunks: Iterable[str], path: str, compress: bool = False, max_bytes: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Writes a log (streamed in chunks) to a file, optionally gzip compressed and capped in size.
+
+    When the log exceeds the size cap only its head and tail (about half of the cap each) are kept, separated by a
+    line noting how much was left out.  Both are cut on character boundaries, so no multibyte character is split.
+    The log is never held in memory beyond the tail being kept.
+
+    Parameters
+    ----------
+    chunks: Iterable[str]
+        The log, in chunks.
+    path: str
+        The path of the file to write.
+    compress: bool = False
+        Controls whether the file is gzip compressed.
+    max_bytes: Optional[int] = None
+        The maximum number of (uncompressed) log bytes to keep.  The full log is kept if unset.
+
+    Returns
+    -------
+    size: int
+        The size (in bytes) of the full log.
+    line_count: int
+        The number of lines of the full log.
+    """
+
+    size: int = 0
+    line_count: int = 0
+    last_byte: bytes = b"\n"
+    head_max: Optional[int] = max_bytes // 2 if max_bytes is not None else None
+    head_size: int = 0
+    tail: bytearray = bytearray()
+
+    archive: BinaryIO
+    with gzip.open(path, mode="wb") if compress else open(path, mode="wb") as archive:
+        for chunk in chunks:
+            data: bytes = chunk.encode(encoding="utf-8")
+            if len(data) < 1:
+                continue
+            size += len(data)
+            line_count += data.count(b"\n")
+            last_byte = data[-1:]
+
+            if head_max is None:
+                archive.write(data)
+                continue
+
+            # Fill the head, anything beyond it is a candidate for the tail.
+            if head_size < head_max:
+                cut: int = _char_boundary(data=data, index=head_max - head_size)
+                archive.write(data[:cut])
+                head_size += cut
+                if cut < len(data):
+                    # The head is complete, a character it could not fit goes to the tail (which gains its room).
+                    head_max = head_size
+                data = data[cut:]
+            tail.extend(data)
+            if len(tail) > max_bytes - head_max:
+                del tail[: len(tail) - (max_bytes - head_max)]
+
+        if head_max is not None:
+            del tail[: _char_boundary(data=tail, index=0, forward=True)]
+            truncated: int = size - head_size - len(tail)
+            if truncated > 0:
+                archive.write(f"\n... {truncated} bytes truncated ...\n".encode(encoding="utf-8"))
+            archive.write(bytes(tail))
+
+    # A final line without a trailing newline is still a line.
+    if last_byte != b"\n":
+        line_count += 1
+
+    return size, line_count
+
+
+def _char_boundary(data: bytes, index: int, forward: bool = False) -> int:
+    """
+    Moves an offset into UTF-8 encoded data onto the nearest character boundary (backward unless `forward`).
+
+    Parameters
+    ----------
+    data: bytes
+        The UTF-8 encoded data.
+    index: int
+        The offset to move.
+    forward: bool = False
+        Controls whether the offset is moved forward (past the split character) instead of backward (before it).
+
+    Returns
+    -------
+    index: int
+        The offset of a character boundary (clamped to the data).
+    """
+
+    index = min(max(index, 0), len(data))
+    # UTF-8 continuation bytes are of the form 0b10xxxxxx.
+    if forward:
+        while index < len(data) and data[index] & 0xC0 == 0x80:
+            index += 1
+    else:
+        while 0 < index < len(data) and data[index] & 0xC0 == 0x80:
+            index -= 1
+    return index
+
+
+def upload_log(run_id: str, chunks: Iterable[str], compress: bool = False, max_bytes: Optional[int] = None) -> None:
+    """
+    Adds a log (streamed in chunks) to a run as an artifact.  The full log size and line count are added as run tags.
+
+    The log is streamed to disk and uploaded from there, rather than held (and uploaded) as one string.
+
+    Parameters
+    ----------
+    run_id: str
+        The MLFlow Run ID of the run to update.
+    chunks: Iterable[str]
+        The log, in chunks.
+    compress: bool = False
+        Controls whether the log is stored gzip compressed (as `job_log.txt.gz`).
+    max_bytes: Optional[int] = None
+        The size (in bytes) the log is capped to, keeping its head and tail.
+    """
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        log_path: str = os.path.join(log_dir, "job_log.txt.gz" if compress else "job_log.txt")
+        size, line_count = archive_log(chunks=chunks, path=log_path, compress=compress, max_bytes=max_bytes)
+
+        with mlflow.start_run(run_id=run_id, nested=True):
+            mlflow.log_artifact(local_path=log_path)
+            mlflow.set_tags({JOB_LOG_SIZE_TAG: size, JOB_LOG_LINES_TAG: line_count})
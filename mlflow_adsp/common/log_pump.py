@@ -0,0 +1,191 @@
+""" Subprocess Log Forwarding """
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import IO, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    A token bucket, allowing up to `rate` events per second (with an equal burst allowance).  It is not thread safe,
+    callers serialize access.
+
+    Attributes
+    ----------
+    rate: int
+        The maximum number of events allowed per second, 0 to disable the limit.
+    suppressed: int
+        The number of events not allowed since the count was last taken.
+    """
+
+    def __init__(self, rate: int):
+        self.rate = rate
+        self.suppressed: int = 0
+
+        self._tokens: float = float(rate)
+        self._updated: float = time.monotonic()
+
+    def acquire(self) -> bool:
+        """
+        Takes a token from the bucket.
+
+        Returns
+        -------
+        allowed: bool
+            Whether the event is allowed.
+        """
+
+        if self.rate <= 0:
+            return True
+
+        now: float = time.monotonic()
+        self._tokens = min(float(self.rate), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        self.suppressed += 1
+        return False
+
+    def take_suppressed(self) -> int:
+        """
+        Takes the count of events not allowed, resetting it.
+
+        Returns
+        -------
+        suppressed: int
+            The number of events not allowed since the count was last taken.
+        """
+
+        suppressed, self.suppressed = self.suppressed, 0
+        return suppressed
+
+
+class LogPump:
+    """
+    The LogPump forwards the output of a subprocess (captured through pipes) to Python logging line by line.
+
+    Each stream is read on its own thread.  Lines are tagged with the model name, model version, subprocess pid and
+    stream, both in the message prefix and as `extra` record attributes (`model`, `model_version`, `child_pid`,
+    `stream`) for structured handlers.  The most recent lines are kept in a bounded ring buffer, and forwarding is
+    rate limited so that an error storm in the subprocess can not flood the logs.  Suppressed lines are counted and
+    reported once forwarding resumes.
+
+    Attributes
+    ----------
+    process: subprocess.Popen
+        The subprocess to forward the output of.
+    metadata: dict
+        The per line record attributes.
+    buffer: deque[str]
+        The most recent lines.
+    limiter: RateLimiter
+        Limits the number of lines forwarded per second (`rate_limit`, 0 to disable the limit), counting the lines
+        suppressed since forwarding was last allowed.
+    """
+
+    def __init__(
+        self,
+        process: subprocess.Popen,
+        name: str,
+        version: Optional[str] = None,
+        buffer_size: int = 1000,
+        rate_limit: int = 100,
+    ):
+        self.process = process
+        self.metadata: dict = {"model": name, "model_version": version, "child_pid": process.pid}
+        self.buffer: deque[str] = deque(maxlen=buffer_size)
+        self.limiter: RateLimiter = RateLimiter(rate=rate_limit)
+
+        self._prefix: str = f"[{name}{':' + version if version else ''} pid={process.pid}]"
+        self._lock: threading.Lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        """Starts forwarding the captured streams."""
+
+        for stream_name, stream in (("stdout", self.process.stdout), ("stderr", self.process.stderr)):
+            if stream is None:
+                continue
+            thread = threading.Thread(
+                target=self._pump,
+                args=(stream_name, stream),
+                name=f"mlflow-adsp-log-{stream_name}-{self.process.pid}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits for the captured streams to close.
+
+        Parameters
+        ----------
+        timeout: Optional[float] = None
+            The maximum time (in seconds) to wait per stream.
+        """
+
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+
+    def tail(self, lines: int = 20) -> list[str]:
+        """
+        Gets the most recent lines.
+
+        Parameters
+        ----------
+        lines: int = 20
+            The number of lines.
+
+        Returns
+        -------
+        tail: list[str]
+            The most recent lines, oldest first.
+        """
+
+        with self._lock:
+            return list(self.buffer)[-lines:]
+
+    def _pump(self, stream_name: str, stream: IO[bytes]) -> None:
+        """Stream thread target."""
+
+        try:
+            for raw_line in iter(stream.readline, b""):
+                line: str = raw_line.decode("utf-8", errors="replace").rstrip()
+                if line:
+                    self._emit(stream_name=stream_name, line=line)
+        except (OSError, ValueError) as error:
+            # The stream was closed underneath us.
+            message: str = f"{self._prefix} Stopped reading {stream_name}: {str(error)}"
+            logger.debug(message)
+        finally:
+            self._report_suppressed()
+
+    def _emit(self, stream_name: str, line: str) -> None:
+        """Buffers a line, and forwards it if the rate limit allows."""
+
+        with self._lock:
+            self.buffer.append(line)
+            allowed: bool = self.limiter.acquire()
+        if not allowed:
+            return
+
+        self._report_suppressed()
+        logger.info("%s %s", self._prefix, line, extra={**self.metadata, "stream": stream_name})
+
+    def _report_suppressed(self) -> None:
+        """Reports the lines suppressed by the rate limit since the last report."""
+
+        with self._lock:
+            suppressed: int = self.limiter.take_suppressed()
+        if suppressed:
+            message: str = f"{self._prefix} Suppressed {suppressed} lines (rate limit: {self.limiter.rate} lines/s)"
+            logger.warning(message, extra=self.metadata)
@@ -0,0 +1,281 @@
+""" Prometheus Compatible Metrics """
+
+from __future__ import annotations
+
+import abc
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Tuple
+
+LabelValues = Tuple[str, ...]
+
+
+class Metric(abc.ABC):
+    """
+    Base definition of a labelled metric rendered in the Prometheus text exposition format.
+
+    Attributes
+    ----------
+    name: str
+        The metric name.
+    documentation: str
+        The metric help text.
+    label_names: tuple[str, ...]
+        The names of the metric labels.
+    """
+
+    type: str = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Optional[list[str]] = None):
+        self.name = name
+        self.documentation = documentation
+        self.label_names: tuple[str, ...] = tuple(label_names or [])
+        self._lock: threading.Lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        """Gets the label values of a sample in label name order."""
+
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"Metric ({self.name}) expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _format(self, suffix: str, key: LabelValues, value: float, extra: Optional[dict[str, str]] = None) -> str:
+        """Formats a single sample line."""
+
+        pairs: list[tuple[str, str]] = list(zip(self.label_names, key)) + list((extra or {}).items())
+        labels: str = ",".join(f'{name}="{Metric._escape(value=label)}"' for name, label in pairs)
+        if labels:
+            labels = f"{{{labels}}}"
+        return f"{self.name}{suffix}{labels} {Metric._format_value(value=value)}"
+
+    @abc.abstractmethod
+    def samples(self) -> list[str]:
+        """
+        Gets the sample lines of the metric.
+
+        Returns
+        -------
+        samples: list[str]
+            The formatted sample lines.
+        """
+
+    def render(self) -> str:
+        """
+        Renders the metric in the Prometheus text exposition format.
+
+        Returns
+        -------
+        text: str
+            The help, type and sample lines.
+        """
+
+        lines: list[str] = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        return "\n".join(lines + self.samples()) + "\n"
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(float(value))
+
+
+class Counter(Metric):
+    """A monotonically increasing metric.  By convention the name ends with `_total`."""
+
+    type: str = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Optional[list[str]] = None):
+        super().__init__(name=name, documentation=documentation, label_names=label_names)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Increments the counter.
+
+        Parameters
+        ----------
+        amount: float = 1
+            The (non-negative) amount to increment by.
+        labels: str
+            The sample labels.
+        """
+
+        key: LabelValues = self._key(labels=labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        """Gets the current value of a sample."""
+
+        with self._lock:
+            return self._values.get(self._key(labels=labels), 0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values: dict[LabelValues, float] = dict(self._values)
+        return [self._format(suffix="", key=key, value=value) for key, value in values.items()]
+
+
+class Gauge(Metric):
+    """A metric which can go up and down.  Samples may be set directly, or computed by a function when rendered."""
+
+    type: str = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: Optional[list[str]] = None):
+        super().__init__(name=name, documentation=documentation, label_names=label_names)
+        self._values: dict[LabelValues, float | Callable[[], Optional[float]]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Sets the value of a sample."""
+
+        key: LabelValues = self._key(labels=labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_function(self, function: Callable[[], Optional[float]], **labels: str) -> None:
+        """Sets the function computing the value of a sample when rendered.  `None` results are not rendered."""
+
+        key: LabelValues = self._key(labels=labels)
+        with self._lock:
+            self._values[key] = function
+
+    def remove(self, **labels: str) -> None:
+        """Removes a sample."""
+
+        key: LabelValues = self._key(labels=labels)
+        with self._lock:
+            self._values.pop(key, None)
+
+    def get(self, **labels: str) -> Optional[float]:
+        """Gets the current value of a sample."""
+
+        with self._lock:
+            value = self._values.get(self._key(labels=labels))
+        return value() if callable(value) else value
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values: dict[LabelValues, float | Callable[[], Optional[float]]] = dict(self._values)
+
+        lines: list[str] = []
+        for key, value in values.items():
+            value = value() if callable(value) else value
+            if value is not None:
+                lines.append(self._format(suffix="", key=key, value=value))
+        return lines
+
+
+class Histogram(Metric):
+    """A metric which counts observations into cumulative buckets."""
+
+    type: str = "histogram"
+    DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Optional[list[str]] = None,
+        buckets: Optional[tuple[float, ...]] = None,
+    ):
+        super().__init__(name=name, documentation=documentation, label_names=label_names)
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets or Histogram.DEFAULT_BUCKETS)) + (math.inf,)
+        self._values: dict[LabelValues, dict] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Records an observation."""
+
+        key: LabelValues = self._key(labels=labels)
+        with self._lock:
+            sample: dict = self._values.setdefault(key, {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0})
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    sample["buckets"][index] += 1
+            sample["sum"] += value
+            sample["count"] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[dict[str, str]]:
+        """
+        Observes the duration (in seconds) of the managed block.  Labels may be updated through the yielded dict
+        (e.g. to record the outcome), the observation is recorded even if the block raises.
+        """
+
+        labels = dict(labels)
+        start: float = time.monotonic()
+        try:
+            yield labels
+        finally:
+            self.observe(time.monotonic() - start, **labels)
+
+    def get_count(self, **labels: str) -> int:
+        """Gets the number of observations of a sample."""
+
+        with self._lock:
+            return self._values.get(self._key(labels=labels), {"count": 0})["count"]
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values: dict[LabelValues, dict] = {
+                key: {"buckets": list(sample["buckets"]), "sum": sample["sum"], "count": sample["count"]}
+                for key, sample in self._values.items()
+            }
+
+        lines: list[str] = []
+        for key, sample in values.items():
+            for bound, count in zip(self.buckets, sample["buckets"]):
+                le: str = "+Inf" if math.isinf(bound) else repr(float(bound))
+                lines.append(self._format(suffix="_bucket", key=key, value=count, extra={"le": le}))
+            lines.append(self._format(suffix="_sum", key=key, value=sample["sum"]))
+            lines.append(self._format(suffix="_count", key=key, value=sample["count"]))
+        return lines
+
+
+class MetricsRegistry:
+    """
+    A collection of metrics rendered together.
+
+    Attributes
+    ----------
+    metrics: list[Metric]
+        The registered metrics.
+    """
+
+    def __init__(self):
+        self.metrics: list[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """
+        Registers a metric.
+
+        Parameters
+        ----------
+        metric: Metric
+            The metric to register.
+
+        Returns
+        -------
+        metric: Metric
+            The registered metric.
+        """
+
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """
+        Renders all the metrics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        text: str
+            The exposition.
+        """
+
+        return "".join(metric.render() for metric in self.metrics)
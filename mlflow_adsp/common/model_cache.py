@@ -0,0 +1,414 @@
+""" Local Content Addressed Model Artifact Cache """
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Set
+
+from ..contracts.errors.plugin import ADSPMLFlowPluginError
+
+logger = logging.getLogger(__name__)
+
+
+class ModelCache:
+    """
+    The ModelCache holds downloaded model versions on local disk so that reloads (and rollbacks) do not download the
+    artifacts again.
+
+    Model trees are stored once per content digest under `objects/`, and each registered model version references
+    its tree from `refs/<registry>/<version>.json`.  Versions with identical artifacts share a single tree.  When the
+    cache grows beyond `max_size` the least recently used trees are evicted.
+
+    The cache directory can be shared between replicas (and between the models served by one process), all updates
+    are performed with atomic renames.  Each cache instance holds a lease (`leases/<digest>/<owner>`) on the trees it
+    resolves until they are released, renewing them every third of `lease_ttl` once started.  Trees with a live lease
+    of another instance are never evicted.
+
+    Attributes
+    ----------
+    root: str
+        The cache directory.
+    max_size: int
+        The maximum size (in bytes) of the cached model trees.
+    lease_ttl: float
+        The time (in seconds) after which a lease which was not renewed (e.g. of a failed replica) expires.
+    """
+
+    root: str
+    max_size: int
+    lease_ttl: float
+
+    def __init__(self, root: str, max_size: int, lease_ttl: float = 300):
+        self.root = root
+        self.max_size = max_size
+        self.lease_ttl = lease_ttl
+
+        self._owner: str = uuid.uuid4().hex
+        self._leased: Set[str] = set()
+        self._lock: threading.Lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._refs_dir, exist_ok=True)
+        os.makedirs(self._leases_dir, exist_ok=True)
+
+    def start(self) -> None:
+        """Starts renewing the held leases on a background thread."""
+
+        with self._lock:
+            self._timer = self._schedule()
+
+    def stop(self) -> None:
+        """Stops renewing the held leases, and releases them."""
+
+        with self._lock:
+            timer: Optional[threading.Timer] = self._timer
+            self._timer = None
+        if timer:
+            timer.cancel()
+            # A renewal in progress finishes before the leases are released.
+            timer.join()
+        with self._lock:
+            digests: List[str] = list(self._leased)
+        for digest in digests:
+            self.release(path=os.path.join(self._objects_dir, digest))
+
+    @property
+    def _objects_dir(self) -> str:
+        return os.path.join(self.root, "objects")
+
+    @property
+    def _refs_dir(self) -> str:
+        return os.path.join(self.root, "refs")
+
+    @property
+    def _leases_dir(self) -> str:
+        return os.path.join(self.root, "leases")
+
+    def resolve(
+        self,
+        registry: str,
+        version: str,
+        source: str,
+        download: Callable[[str], None],
+        pinned: Optional[Set[str]] = None,
+    ) -> str:
+        """
+        Gets the local path of a model version, downloading it on a cache miss.
+
+        Parameters
+        ----------
+        registry: str
+            The registered model name.
+        version: str
+            The registered model version.
+        source: str
+            The artifact source of the model version.  A cached entry is only used if the source matches.
+        download: Callable[[str], None]
+            Downloads the model version into the provided (empty) directory.
+        pinned: Optional[Set[str]] = None
+            Local paths which must not be evicted, e.g. the model currently being served.
+
+        Returns
+        -------
+        path: str
+            The local path of the model tree.  It is leased until released.
+        """
+
+        ref_path: str = os.path.join(self._refs_dir, registry, f"{version}.json")
+        digest: Optional[str] = self._read_ref(ref_path=ref_path, source=source)
+        if digest:
+            # The lease is taken before the tree is confirmed, so a concurrent eviction either sees it or has already
+            # moved the tree away.
+            self.lease(path=os.path.join(self._objects_dir, digest))
+            if not os.path.isdir(os.path.join(self._objects_dir, digest)):
+                self.release(path=os.path.join(self._objects_dir, digest))
+                digest = None
+
+        if digest:
+            message: str = f"Model cache hit for ({registry}/{version}), digest: {digest}"
+            logger.info(message)
+        else:
+            message: str = f"Model cache miss for ({registry}/{version}), downloading .."
+            logger.info(message)
+            digest = self._add(download=download)
+            self._write_ref(ref_path=ref_path, record={"digest": digest, "source": source})
+
+        path: str = os.path.join(self._objects_dir, digest)
+
+        # Mark the tree as most recently used.
+        os.utime(path)
+        self.evict(pinned={path} | (pinned or set()))
+        return path
+
+    def lease(self, path: str) -> None:
+        """
+        Takes (or renews) the lease of this cache instance on a model tree.
+
+        Parameters
+        ----------
+        path: str
+            The local path of the model tree.
+        """
+
+        digest: str = os.path.basename(path)
+        lease_dir: str = os.path.join(self._leases_dir, digest)
+        os.makedirs(lease_dir, exist_ok=True)
+        with open(os.path.join(lease_dir, self._owner), "a", encoding="utf-8"):
+            os.utime(os.path.join(lease_dir, self._owner))
+        with self._lock:
+            self._leased.add(digest)
+
+    def release(self, path: str) -> None:
+        """
+        Releases the lease of this cache instance on a model tree, e.g. once the model is no longer served.  Paths
+        which are not leased are ignored.
+
+        Parameters
+        ----------
+        path: str
+            The local path of the model tree.
+        """
+
+        digest: str = os.path.basename(path)
+        with self._lock:
+            if digest not in self._leased:
+                return
+            self._leased.discard(digest)
+        try:
+            os.remove(os.path.join(self._leases_dir, digest, self._owner))
+        except OSError:
+            pass
+
+    def renew(self) -> None:
+        """Renews the held leases."""
+
+        with self._lock:
+            digests: List[str] = list(self._leased)
+        for digest in digests:
+            self.lease(path=os.path.join(self._objects_dir, digest))
+
+    def evict(self, pinned: Optional[Set[str]] = None) -> None:
+        """
+        Removes the least recently used model trees until the cache fits within its size limit.  Trees with a live
+        lease of another cache instance are kept.
+
+        Parameters
+        ----------
+        pinned: Optional[Set[str]] = None
+            Local paths which must not be evicted.
+        """
+
+        pinned = pinned or set()
+        entries: List[Dict] = []
+        for digest in os.listdir(self._objects_dir):
+            path: str = os.path.join(self._objects_dir, digest)
+            # Staging directories belong to in progress downloads (or evictions).
+            if not os.path.isdir(path) or digest.startswith("."):
+                continue
+            try:
+                entries.append({"path": path, "size": ModelCache._tree_size(path), "used": os.stat(path).st_mtime})
+            except OSError:
+                # Evicted by another cache instance meanwhile.
+                continue
+
+        total_size: int = sum(entry["size"] for entry in entries)
+        for entry in sorted(entries, key=lambda item: item["used"]):
+            if total_size <= self.max_size:
+                break
+            if entry["path"] in pinned or self._is_leased(digest=os.path.basename(entry["path"])):
+                continue
+
+            if self._remove(path=entry["path"]):
+                total_size -= entry["size"]
+
+    def _remove(self, path: str) -> bool:
+        """
+        Removes a model tree unless another cache instance leased it meanwhile.  The tree is first moved aside, so it
+        is never seen partially removed, and the lease is checked again once it was moved.
+
+        Returns
+        -------
+        removed: bool
+            Whether the tree was removed.
+        """
+
+        evicting_path: str = os.path.join(self._objects_dir, f".evicting-{uuid.uuid4().hex}")
+        try:
+            os.rename(path, evicting_path)
+        except OSError:
+            return False
+
+        if self._is_leased(digest=os.path.basename(path)):
+            try:
+                os.rename(evicting_path, path)
+                return False
+            except OSError:
+                # The tree was added again meanwhile.
+                pass
+
+        message: str = f"Evicting model tree: {path}"
+        logger.info(message)
+        shutil.rmtree(evicting_path, ignore_errors=True)
+        return True
+
+    def _is_leased(self, digest: str) -> bool:
+        """
+        Checks whether another cache instance holds a live lease on a model tree.  Expired leases are removed.
+
+        Returns
+        -------
+        leased: bool
+            Whether the tree is leased.
+        """
+
+        lease_dir: str = os.path.join(self._leases_dir, digest)
+        try:
+            owners: List[str] = os.listdir(lease_dir)
+        except OSError:
+            return False
+
+        leased: bool = False
+        for owner in owners:
+            if owner == self._owner:
+                continue
+            lease_path: str = os.path.join(lease_dir, owner)
+            try:
+                if time.time() - os.stat(lease_path).st_mtime < self.lease_ttl:
+                    leased = True
+                else:
+                    os.remove(lease_path)
+            except OSError:
+                continue
+        return leased
+
+    def _schedule(self) -> threading.Timer:
+        """Schedules the next lease renewal."""
+
+        timer: threading.Timer = threading.Timer(interval=self.lease_ttl / 3, function=self._run)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def _run(self) -> None:
+        """Lease renewal timer target, renews the leases and schedules the next renewal unless stopped."""
+
+        self.renew()
+        with self._lock:
+            if self._timer is not None:
+                self._timer = self._schedule()
+
+    def _add(self, download: Callable[[str], None]) -> str:
+        """
+        Downloads a model tree into the cache.
+
+        Parameters
+        ----------
+        download: Callable[[str], None]
+            Downloads the model into the provided (empty) directory.
+
+        Returns
+        -------
+        digest: str
+            The content digest of the model tree.
+        """
+
+        # Download into a staging directory so a partial download is never mistaken for a cached tree.
+        staging_path: str = tempfile.mkdtemp(prefix=".staging-", dir=self._objects_dir)
+        try:
+            download(staging_path)
+            digest: str = ModelCache._tree_digest(staging_path)
+            path: str = os.path.join(self._objects_dir, digest)
+            # Leased before it is added, so no other cache instance can evict it in between.
+            self.lease(path=path)
+            try:
+                os.rename(staging_path, path)
+            except OSError:
+                if not os.path.isdir(path):
+                    raise
+                # Identical artifacts are already cached (e.g. a re-registered model, or another replica).
+                shutil.rmtree(staging_path, ignore_errors=True)
+            return digest
+        except Exception as error:
+            shutil.rmtree(staging_path, ignore_errors=True)
+            message: str = f"Unable to add model to cache: {str(error)}"
+            raise ADSPMLFlowPluginError(message) from error
+
+    def _read_ref(self, ref_path: str, source: str) -> Optional[str]:
+        """
+        Reads a model version reference.
+
+        Returns
+        -------
+        digest: Optional[str]
+            The digest of the referenced tree, `None` if the reference is missing, stale, or the tree was evicted.
+        """
+
+        try:
+            with open(ref_path, "r", encoding="utf-8") as ref_file:
+                record: Dict = json.load(ref_file)
+        except (OSError, ValueError):
+            return None
+
+        if record.get("source") != source:
+            return None
+        if not os.path.isdir(os.path.join(self._objects_dir, record["digest"])):
+            return None
+        return record["digest"]
+
+    @staticmethod
+    def _write_ref(ref_path: str, record: Dict) -> None:
+        """Atomically writes a model version reference."""
+
+        os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+        file_descriptor, staging_path = tempfile.mkstemp(dir=os.path.dirname(ref_path))
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as ref_file:
+            json.dump(record, ref_file)
+        os.replace(staging_path, ref_path)
+
+    @staticmethod
+    def _tree_digest(path: str) -> str:
+        """
+        Calculates the content digest of a directory tree from its relative file paths and file contents.
+
+        Returns
+        -------
+        digest: str
+            The hex encoded sha256 digest.
+        """
+
+        digest = hashlib.sha256()
+        for directory, subdirectories, files in os.walk(path):
+            subdirectories.sort()
+            for name in sorted(files):
+                file_path: str = os.path.join(directory, name)
+                relative_path: str = os.path.relpath(file_path, path).replace(os.sep, "/")
+                digest.update(f"{relative_path}\0{os.path.getsize(file_path)}\0".encode("utf-8"))
+                with open(file_path, "rb") as file:
+                    for block in iter(functools.partial(file.read, 1024 * 1024), b""):
+                        digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _tree_size(path: str) -> int:
+        """
+        Calculates the size (in bytes) of a directory tree.
+
+        Returns
+        -------
+        size: int
+            The sum of the file sizes.
+        """
+
+        size: int = 0
+        for directory, _, files in os.walk(path):
+            for name in files:
+                size += os.path.getsize(os.path.join(directory, name))
+        return size
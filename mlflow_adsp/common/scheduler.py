@@ -2,20 +2,31 @@
 
 import logging
 import time
-import uuid
-from typing import Dict, List, Optional, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import mlflow
 from mlflow.entities import RunStatus
 from mlflow.projects.submitted_run import LocalSubmittedRun
+from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID
 from tqdm import tqdm
 
 from ae5_tools import demand_env_var
+from ae5_tools.api import AEUserSession
 
+from ..contracts.dto.cached_submitted_run import CachedSubmittedRun
 from ..contracts.dto.job import Job
+from ..contracts.dto.scheduler_options import SchedulerOptions
 from ..contracts.dto.step import Step
 from ..contracts.errors.plugin import ADSPMLFlowPluginError
 from ..submitted_run import ADSPSubmittedRun
+from .cancellation_token import CancellationToken
+from .checkpoint_store import CheckpointStore, CheckpointWriter
+from .fair_share_queue import FairShareQueue
+from .log_archive import upload_log
+from .step_cache import launch_cached_step
+from .work_queue import WorkQueue
 
 logger = logging.getLogger(__name__)
 
@@ -29,34 +40,44 @@ class Scheduler:
 
     Attributes
     ----------
-    jobs: List[Job]
-        The List of jobs the user requested for processing.
-    todo: List[str]
-        The jobs marked as TODO but that are not yet under execution.
-    inprogress: List[str]
-        Jobs which have started put are not yet finished.
-    complete: List[str]
-        Jobs which have completed (successfully or not).
+    work_queue: WorkQueue
+        The jobs the user requested for processing, the queues they move through and their dependencies.  The
+        `jobs`, `todo`, `inprogress`, `complete`, `blocked` and `dependents` properties expose its state.
+    checkpoint: CheckpointWriter
+        Records the work queue as it is processed (if a checkpoint store is attached).
     max_workers: int
         The maximum number of parallel jobs to execute in parallel.
     failed_execution_retry_max: int
         The maximum number of retries for a job that failed.
+    options: SchedulerOptions
+        Controls step grouping, caching, log archival and how work queues are processed.
     """
 
-    jobs: List[Job]
-
-    # Used for tracking jobs in different states of execution.
-    todo: List[str]
-    inprogress: List[str]
-    complete: List[str]
+    work_queue: WorkQueue
+    checkpoint: CheckpointWriter
 
     max_workers: int
     failed_execution_retry_max: int
+    options: SchedulerOptions
+
+    # Step fields used by the scheduler, which are not passed on to `mlflow.projects.run`.
+    SCHEDULING_FIELDS: Set[str] = {"depends_on", "group", "name", "priority"}
 
-    def __init__(self, failed_execution_retry_max: int = 3, max_workers: Optional[int] = None):
+    def __init__(
+        self,
+        failed_execution_retry_max: int = 3,
+        max_workers: Optional[int] = None,
+        options: Optional[SchedulerOptions] = None,
+    ):
+        self.options = options if options is not None else SchedulerOptions()
         self._reset(failed_execution_retry_max=failed_execution_retry_max, max_workers=max_workers)
 
-    def _reset(self, failed_execution_retry_max: int, max_workers: Optional[int] = None) -> None:
+    def _reset(
+        self,
+        failed_execution_retry_max: int,
+        max_workers: Optional[int] = None,
+        options: Optional[SchedulerOptions] = None,
+    ) -> None:
         """
         Resets the internal class state.  This is used during initialization and on each work queue processing request.
 
@@ -66,17 +87,79 @@ class Scheduler:
             The maximum number of retries for a job that failed.
         max_workers: Optional[int] = None
             The maximum number of parallel jobs to execute in parallel.  If unset the default is used.
+        options: Optional[SchedulerOptions] = None
+            Replaces the scheduler options.  If unset the current options are kept.
         """
 
         # Reset internal state
 
+        if options is not None:
+            self.options = options
         self.failed_execution_retry_max = failed_execution_retry_max
         self.max_workers = max_workers if max_workers else int(demand_env_var(name="ADSP_WORKER_MAX"))
 
-        self.jobs = []
-        self.todo = []
-        self.inprogress = []
-        self.complete = []
+        self.work_queue = WorkQueue(group_weights=self.options.group_weights)
+        self.checkpoint = CheckpointWriter()
+
+        # The MLFlow active run is tracked per thread, so the run processing starts within is captured here (on the
+        # caller's thread) and attached to the steps launched from submission threads explicitly.
+        active_run: Optional[mlflow.ActiveRun] = mlflow.active_run()
+        self._parent_run_id: Optional[str] = active_run.info.run_id if active_run is not None else None
+
+        # Projects are fetched once per work queue (and version) to fingerprint cached steps.
+        self._work_dirs: Dict[Tuple[str, Optional[str]], str] = {}
+
+    @property
+    def jobs(self) -> Dict[str, Job]:
+        """The jobs the user requested for processing keyed by job id (in submission order)."""
+
+        return self.work_queue.jobs
+
+    @jobs.setter
+    def jobs(self, jobs: Dict[str, Job]) -> None:
+        self.work_queue.jobs = jobs
+
+    @property
+    def todo(self) -> FairShareQueue:
+        """The jobs marked as TODO but that are not yet under execution."""
+
+        return self.work_queue.todo
+
+    @todo.setter
+    def todo(self, todo: FairShareQueue) -> None:
+        self.work_queue.todo = todo
+
+    @property
+    def inprogress(self) -> Deque[str]:
+        """Jobs which have started put are not yet finished."""
+
+        return self.work_queue.inprogress
+
+    @inprogress.setter
+    def inprogress(self, inprogress: Deque[str]) -> None:
+        self.work_queue.inprogress = inprogress
+
+    @property
+    def complete(self) -> Set[str]:
+        """Jobs which have completed (successfully or not)."""
+
+        return self.work_queue.complete
+
+    @complete.setter
+    def complete(self, complete: Set[str]) -> None:
+        self.work_queue.complete = complete
+
+    @property
+    def blocked(self) -> Dict[str, Set[str]]:
+        """Jobs waiting on the steps they depend on, with the ids of the jobs they are still waiting on."""
+
+        return self.work_queue.blocked
+
+    @property
+    def dependents(self) -> Dict[str, List[str]]:
+        """The ids of the jobs depending on each job."""
+
+        return self.work_queue.dependents
 
     # We define a lot of parameters on this call.  It allows the caller to better control
     # how processing is handled.  This could be moved into a DTO but given that most
@@ -86,27 +169,46 @@ class Scheduler:
     def process_work_queue(
         self,
         steps: List[Step],
-        interval: float = 2.0,
-        exponent: float = 1.4,
+        interval: Optional[float] = None,
+        exponent: Optional[float] = None,
         retry_max: int = 3,
-        disable_progress_bar: bool = False,
+        disable_progress_bar: Optional[bool] = None,
+        *,
+        options: Optional[SchedulerOptions] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
     ) -> List[Job]:
         """
         Processing a list of execution requests.
         If the jobs are async the processing will occur in parallel, serial execution is used otherwise.
 
+        Steps may declare dependencies on other (named) steps of the request, in which case they are launched as soon
+        as every step they depend on has finished successfully.  If a step they depend on fails (after retries) they
+        are not run, and are reported with `blocked_by` set.
+
+        Processing can be stopped early through a cancellation token, or a condition evaluated against each completed
+        job (`SchedulerOptions.cancel_when`, e.g. a target metric being reached).  Once cancelled no further jobs are
+        launched, the runs in progress are cancelled, and every job which did not complete is reported with
+        `cancelled` set.
+
         Parameters
         ----------
         steps: List[Step]
             The list of execution requests to process.
-        interval: float
-            The wait internal to use during exponential backoff
-        exponent: float
-            The exponent used for calculated exponential backoff
+        interval: Optional[float] = None
+            The wait internal to use during exponential backoff.  If set it updates the scheduler options.
+        exponent: Optional[float] = None
+            The exponent used for calculated exponential backoff.  If set it updates the scheduler options.
         retry_max: int = 3
             The maximum number of retries for a job that failed.
-        disable_progress_bar: bool = False
-            Controls the display of the progress bar.
+        disable_progress_bar: Optional[bool] = None
+            Controls the display of the progress bar.  If set it updates the scheduler options.
+        options: Optional[SchedulerOptions] = None
+            Replaces the scheduler options (from this processing on), see `SchedulerOptions`.
+        cancellation_token: Optional[CancellationToken] = None
+            Cancels the processing when cancelled (or its wall-clock budget is spent).
+        checkpoint_store: Optional[CheckpointStore] = None
+            Records the work queue as it is processed, so that it can be resumed with `resume_work_queue`.
 
         Returns
         -------
@@ -114,42 +216,299 @@ class Scheduler:
             A list of results from the work queue.
         """
 
-        self._reset(failed_execution_retry_max=retry_max)
+        overrides: Dict[str, Union[float, bool]] = {
+            name: value
+            for name, value in (
+                ("interval", interval),
+                ("exponent", exponent),
+                ("disable_progress_bar", disable_progress_bar),
+            )
+            if value is not None
+        }
+        options = (options if options is not None else self.options).model_copy(update=overrides)
+
+        self._reset(failed_execution_retry_max=retry_max, max_workers=self.max_workers, options=options)
+        self._build_jobs(steps=steps)
+        self._attach_checkpoint_store(checkpoint_store=checkpoint_store)
+
+        for _ in self._process_work_queue(cancellation_token=cancellation_token, retain_jobs=True):
+            pass
+
+        # Returns job structure
+        return list(self.jobs.values())
+
+    def iter_work_queue(
+        self,
+        steps: List[Step],
+        *,
+        options: Optional[SchedulerOptions] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+    ) -> Iterator[Job]:
+        """
+        Processing a list of execution requests, yielding each job as soon as it completes.
+        See `process_work_queue` for details and parameters.
+
+        The caller may stop iterating at any point (e.g. once a target metric is reached), no further jobs are
+        launched after that.  Jobs which are already in progress are left to complete.  Completed jobs are released
+        from `jobs` once yielded unless `SchedulerOptions.retain_jobs` is set.
+
+        Yields
+        ------
+        job: Job
+            Each job, as soon as it has completed (successfully or not), with its final `last_status` and runs.
+        """
+
+        self._reset(
+            failed_execution_retry_max=self.failed_execution_retry_max, max_workers=self.max_workers, options=options
+        )
 
         # Build of internal job representation
-        for step in steps:
-            self.jobs.append(Job(id=str(uuid.uuid4()), step=step, runs=[]))
-        self.todo = [job.id for job in self.jobs]
+        self._build_jobs(steps=steps)
+        self._attach_checkpoint_store(checkpoint_store=checkpoint_store)
+
+        yield from self._process_work_queue(cancellation_token=cancellation_token, retain_jobs=self.options.retain_jobs)
+
+    def resume_work_queue(
+        self,
+        checkpoint_store: CheckpointStore,
+        *,
+        ae_session: Optional[AEUserSession] = None,
+        options: Optional[SchedulerOptions] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[Job]:
+        """
+        Resumes processing a work queue from its checkpoint (e.g. after the process driving it failed).
+        See `process_work_queue` for the remaining parameters.
+
+        Completed jobs are not run again, and ADSP runs which were in progress are reattached to rather than
+        resubmitted.  Runs of other backends can not be reattached to, so jobs they were in progress for are retried.
+
+        Parameters
+        ----------
+        checkpoint_store: CheckpointStore
+            The checkpoint store the work queue was recorded in.  It continues to be updated.
+        ae_session: Optional[AEUserSession] = None
+            The session used to reattach to the runs in progress.  If unset the shared session is used.
 
-        with tqdm(total=len(self.todo), disable=disable_progress_bar) as progress_bar:
+        Returns
+        -------
+        runs: List[Job]
+            A list of results from the work queue (including the jobs completed before the checkpoint).
+        """
+
+        self._reset(
+            failed_execution_retry_max=self.failed_execution_retry_max, max_workers=self.max_workers, options=options
+        )
+        self._restore(checkpoint_store=checkpoint_store, ae_session=ae_session)
+
+        for _ in self._process_work_queue(cancellation_token=cancellation_token, retain_jobs=True):
+            pass
+
+        # Returns job structure
+        return list(self.jobs.values())
+
+    def _process_work_queue(self, cancellation_token: Optional[CancellationToken], retain_jobs: bool) -> Iterator[Job]:
+        """
+        Processes the (built or restored) work queue, yielding each job as soon as it completes.
+        See `iter_work_queue` for details.
+        """
+
+        token: CancellationToken = cancellation_token if cancellation_token is not None else CancellationToken()
+
+        with tqdm(
+            total=len(self.jobs), initial=len(self.complete), disable=self.options.disable_progress_bar
+        ) as progress_bar:
             progress_bar.set_description(desc=self._stats_str())
 
             # Process jobs
             retries: int = 0
             while self._work_queue_in_progress():
-                # Fill our processing queue
-                self._fill_processing_queue()
-                progress_bar.set_description(desc=self._stats_str())
-
-                # review in progress jobs
-                old_complete: int = len(self.complete)
-                self._review_in_progress_jobs()
-
-                new_complete: int = len(self.complete)
-                delta: int = new_complete - old_complete
-                if delta > 0:
-                    progress_bar.update(n=delta)
+                # hand back completed jobs
+                for job in self._advance_work_queue(token=token):
+                    progress_bar.update(n=1)
                     progress_bar.set_description(desc=self._stats_str())
+                    yield job
+                    self._release_job(job=job, token=token, retain_jobs=retain_jobs)
+
+                # cancel without waiting
+                if token.cancelled:
+                    continue
 
                 # allow for processing time when the queue is full and there's work to do.
-                if self._wait_on_work_queue(interval=interval, exponent=exponent, retries=retries):
+                if self._wait_on_work_queue(
+                    interval=self.options.interval, exponent=self.options.exponent, retries=retries
+                ):
                     # Determine how we update retries.
                     retries += 1
                 else:
                     retries = 0
 
-        # Returns job structure
-        return self.jobs
+    def _advance_work_queue(self, token: CancellationToken) -> List[Job]:
+        """
+        Advances the work queue by one iteration: cancels it when requested, otherwise fills the processing queue
+        and reviews the jobs in progress.  Shared by the synchronous and asynchronous drivers.
+
+        Parameters
+        ----------
+        token: CancellationToken
+            The cancellation token of the processing.
+
+        Returns
+        -------
+        jobs: List[Job]
+            The jobs which completed during the iteration (not yet handed back).
+        """
+
+        if token.cancelled:
+            self._cancel_work_queue(reason=token.reason)
+        else:
+            # Fill our processing queue
+            self._fill_processing_queue()
+
+            # review in progress jobs
+            self._review_in_progress_jobs()
+
+        return self.work_queue.pop_unreported()
+
+    def _release_job(self, job: Job, token: CancellationToken, retain_jobs: bool) -> None:
+        """
+        Finalizes a job once it has been handed back, evaluating the cancellation predicate against it and
+        dropping it from the work queue when jobs are not retained.
+        """
+
+        Scheduler._evaluate_cancel_when(job=job, token=token, cancel_when=self.options.cancel_when)
+        if not retain_jobs:
+            self.work_queue.release(job_id=job.id)
+
+    def _build_jobs(self, steps: List[Step]) -> None:
+        """
+        Builds the internal job representation of the requested steps, queueing the jobs without dependencies.
+
+        Parameters
+        ----------
+        steps: List[Step]
+            The list of execution requests to process.
+        """
+
+        self.work_queue.build(steps=steps)
+
+    def _attach_checkpoint_store(self, checkpoint_store: Optional[CheckpointStore]) -> None:
+        """
+        Starts recording the (newly built) work queue to a checkpoint store, replacing anything recorded before.
+
+        Parameters
+        ----------
+        checkpoint_store: Optional[CheckpointStore]
+            The checkpoint store to record to.  Nothing is recorded if unset.
+        """
+
+        self.checkpoint = CheckpointWriter(store=checkpoint_store)
+        self.checkpoint.start(work_queue=self.work_queue)
+
+    def _restore(self, checkpoint_store: CheckpointStore, ae_session: Optional[AEUserSession] = None) -> None:
+        """
+        Rebuilds the internal job representation from a checkpoint store, reattaching to the ADSP runs in progress.
+
+        Parameters
+        ----------
+        checkpoint_store: CheckpointStore
+            The checkpoint store to restore from.
+        ae_session: Optional[AEUserSession] = None
+            The session used to reattach to the runs in progress.  If unset the shared session is used.
+        """
+
+        self.checkpoint = CheckpointWriter(store=checkpoint_store)
+        self.checkpoint.restore(work_queue=self.work_queue, ae_session=ae_session)
+
+        message: str = f"Resuming work queue: {self._stats_str()}"
+        logger.info(message)
+
+    def _cancel_work_queue(self, reason: Optional[str] = None) -> None:
+        """
+        Cancels the work queue.  In progress runs are cancelled (in parallel), and jobs which have not been launched
+        are completed without running.
+
+        Parameters
+        ----------
+        reason: Optional[str] = None
+            Why the work queue is being cancelled.
+        """
+
+        message: str = f"Cancelling work queue: {reason}"
+        logger.info(message)
+
+        inprogress, pending = self.work_queue.drain()
+
+        if len(inprogress) > 0:
+            with ThreadPoolExecutor(max_workers=len(inprogress), thread_name_prefix="mlflow-adsp-cancel") as executor:
+                futures: Dict[str, Future] = {
+                    job_id: executor.submit(self.jobs[job_id].runs[-1].cancel) for job_id in inprogress
+                }
+
+            for job_id in inprogress:
+                try:
+                    futures[job_id].result()
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    message: str = f"Job ID: {job_id}, Failed to cancel run: {str(error)}"
+                    logger.warning(message)
+                self.jobs[job_id].last_status = RunStatus.KILLED
+
+        for job_id in inprogress + pending:
+            self.jobs[job_id].cancelled = True
+            self.complete.add(job_id)
+            self.work_queue.unreported.append(job_id)
+            self.checkpoint.mark(job_id=job_id)
+
+        self.checkpoint.flush(work_queue=self.work_queue)
+
+    @staticmethod
+    def _evaluate_cancel_when(
+        job: Job, token: CancellationToken, cancel_when: Optional[Callable[[Job], bool]] = None
+    ) -> None:
+        """
+        Cancels the token if the cancellation condition is met by a completed job.
+
+        Parameters
+        ----------
+        job: Job
+            The completed job.
+        token: CancellationToken
+            The token to cancel.
+        cancel_when: Optional[Callable[[Job], bool]] = None
+            The cancellation condition.
+        """
+
+        if cancel_when is not None and not token.cancelled and not job.cancelled and cancel_when(job):
+            token.cancel(reason=f"Cancellation condition met by job: {job.id}")
+
+    def _enqueue(self, job_id: str) -> None:
+        """
+        Queues a job for launching, by the priority and group of its step.
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the job to queue.
+        """
+
+        self.work_queue.enqueue(job_id=job_id)
+        self.checkpoint.mark(job_id=job_id)
+
+    def _complete(self, job_id: str, succeeded: bool) -> None:
+        """
+        Marks a job as complete (see `WorkQueue.mark_complete`).
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the completed job.
+        succeeded: bool
+            Whether the job finished successfully.
+        """
+
+        for changed_id in self.work_queue.mark_complete(job_id=job_id, succeeded=succeeded):
+            self.checkpoint.mark(job_id=changed_id)
 
     @staticmethod
     def execute_step(step: Step) -> ADSPSubmittedRun:
@@ -166,12 +525,34 @@ class Scheduler:
             An instance of `SubmittedRun` for the requested workflow step run.
         """
 
-        step_dict: Dict = step.model_dump()
+        step_dict: Dict = step.model_dump(exclude=Scheduler.SCHEDULING_FIELDS)
         message: str = f"Launching new background job for: {step_dict}"
         logger.debug(message)
 
         return mlflow.projects.run(**step_dict)
 
+    @staticmethod
+    def execute_cached_step(
+        step: Step, work_dirs: Optional[Dict[Tuple[str, Optional[str]], str]] = None
+    ) -> Union[ADSPSubmittedRun, CachedSubmittedRun]:
+        """
+        Execute a MLFlow Workflow Step, unless an identical step already finished successfully (see
+        `launch_cached_step`).
+
+        Parameters
+        ----------
+        step: Step
+        work_dirs: Optional[Dict[Tuple[str, Optional[str]], str]] = None
+            The project work directories already fetched to fingerprint steps, keyed by project URI and version.
+
+        Returns
+        -------
+        submitted_job: Union[ADSPSubmittedRun, CachedSubmittedRun]
+            An instance of `SubmittedRun` for the requested workflow step run, or the finished run being reused.
+        """
+
+        return launch_cached_step(step=step, launch=Scheduler.execute_step, work_dirs=work_dirs)
+
     def _stats_str(self) -> str:
         """
         Builds a report of the current internal processing state.  The output is suitable for logging
@@ -191,37 +572,132 @@ class Scheduler:
         )
 
     def _fill_processing_queue(self) -> None:
-        """Fills the job processing queue."""
+        """
+        Fills the job processing queue.
+
+        Submissions are performed concurrently (up to `max_workers` at a time) since each one is a series of
+        blocking round trips to the tracking server and the platform.  A failed submission does not affect the
+        rest of the batch, the job is returned to the queue until it has exhausted its retries.
+        """
 
         logger.debug("Filling queue")
         logger.debug(self._stats_str())
-        while len(self.inprogress) < self.max_workers and len(self.todo) > 0:
-            job_id: str = self.todo.pop()
-            job: Job = [job for job in self.jobs if job.id == job_id][0]
 
-            new_run: ADSPSubmittedRun = Scheduler.execute_step(step=job.step)
+        batch: List[Job] = []
+        while len(self.inprogress) + len(batch) < self.max_workers and len(self.todo) > 0:
+            batch.append(self.jobs[self.todo.popleft()])
+
+        if len(batch) < 1:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(batch), thread_name_prefix="mlflow-adsp-submit") as executor:
+            futures: Dict[str, Future] = {job.id: executor.submit(self._submit_step, step=job.step) for job in batch}
+
+        # Results are reviewed in submission order so that queue ordering is deterministic.
+        for job in batch:
+            try:
+                new_run: ADSPSubmittedRun = futures[job.id].result()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self._handle_failed_submission(job=job, error=error)
+                continue
+
             job.runs.append(new_run)
-            self.inprogress.append(job_id)
+            self.inprogress.append(job.id)
+            self.checkpoint.mark(job_id=job.id)
+
+        self.checkpoint.flush(work_queue=self.work_queue)
+
+    def _submit_step(self, step: Step) -> Union[ADSPSubmittedRun, CachedSubmittedRun]:
+        """
+        Launches a workflow step (from a submission thread), nested under the run the work queue is processed within.
+
+        Parameters
+        ----------
+        step: Step
+
+        Returns
+        -------
+        submitted_job: Union[ADSPSubmittedRun, CachedSubmittedRun]
+            An instance of `SubmittedRun` for the requested workflow step run.
+        """
+
+        submitted_run: Union[ADSPSubmittedRun, CachedSubmittedRun] = (
+            Scheduler.execute_cached_step(step=step, work_dirs=self._work_dirs)
+            if self.options.cache_steps
+            else Scheduler.execute_step(step=step)
+        )
+
+        # Runs which existed before (requested or reused) keep their own parent.
+        if (
+            self._parent_run_id is not None
+            and step.run_id is None
+            and not isinstance(submitted_run, CachedSubmittedRun)
+        ):
+            mlflow.MlflowClient().set_tag(
+                run_id=submitted_run.run_id, key=MLFLOW_PARENT_RUN_ID, value=self._parent_run_id
+            )
+        return submitted_run
+
+    def _handle_failed_submission(self, job: Job, error: Exception) -> None:
+        """
+        Determines the retry behavior of a job whose submission failed.
+
+        Parameters
+        ----------
+        job: Job
+            The job which failed to submit.
+        error: Exception
+            The submission failure.
+        """
+
+        job.failed_submissions += 1
+        message: str = f"Job ID: {job.id}, Failed to submit step: {str(error)}"
+        logger.warning(message)
+
+        if len(job.runs) + job.failed_submissions < self.failed_execution_retry_max:
+            logger.debug("Job will be retried")
+            self._enqueue(job_id=job.id)
+        else:
+            logger.debug("Job will not be retried")
+            job.last_status = RunStatus.FAILED
+            self._complete(job_id=job.id, succeeded=False)
 
     def _review_in_progress_jobs(self) -> None:
         """
-        Review inprogress jobs for completion.  Move them to the completed list if processing is complete.
+        Review inprogress jobs for completion.  Move them to the completed set if processing is complete.
         """
 
         logger.debug("Reviewing in progress jobs")
         logger.debug(self._stats_str())
 
-        new_inprogress: List[str] = []
+        # One listing request per session, rather than one request per run.  Runs missing from the snapshot fall
+        # back to an individual status request.
+        statuses: Dict[str, RunStatus] = ADSPSubmittedRun.get_run_statuses(
+            runs=[
+                self.jobs[job_id].runs[-1]
+                for job_id in self.inprogress
+                if len(self.jobs[job_id].runs) > 0 and isinstance(self.jobs[job_id].runs[-1], ADSPSubmittedRun)
+            ]
+        )
+
+        new_inprogress: Deque[str] = deque()
         while len(self.inprogress) > 0:
-            job_id: str = self.inprogress.pop()
-            popped_job: Job = [job for job in self.jobs if job.id == job_id][0]
+            job_id: str = self.inprogress.popleft()
+            popped_job: Job = self.jobs[job_id]
 
             if len(popped_job.runs) < 1:
                 raise ADSPMLFlowPluginError("Unable to find job run to review")
 
-            latest_run: Union[ADSPSubmittedRun, LocalSubmittedRun] = popped_job.runs[-1]
-            job_status: Union[str, RunStatus] = latest_run.get_status()
+            latest_run: Union[ADSPSubmittedRun, LocalSubmittedRun, CachedSubmittedRun] = popped_job.runs[-1]
+            job_status: Union[str, RunStatus] = (
+                statuses[latest_run.adsp_job_id]
+                if isinstance(latest_run, ADSPSubmittedRun) and latest_run.adsp_job_id in statuses
+                else latest_run.get_status()
+            )
+            last_status: Optional[Union[int, RunStatus]] = popped_job.last_status
             popped_job.last_status = Scheduler._coerce_run_status(status=job_status)
+            if popped_job.last_status != last_status:
+                self.checkpoint.mark(job_id=job_id)
 
             job_status_msg: str = f"Job ID: {job_id}, Last seen status: {popped_job.last_status}"
             logger.debug(job_status_msg)
@@ -230,25 +706,31 @@ class Scheduler:
                 new_inprogress.append(job_id)
             elif popped_job.last_status == RunStatus.FINISHED:
                 logger.debug("Job completed")
-                Scheduler._add_log_to_run(run=latest_run)
-                self.complete.append(job_id)
+                Scheduler._add_log_to_run(
+                    run=latest_run, compress=self.options.compress_logs, max_bytes=self.options.max_log_bytes
+                )
+                self._complete(job_id=job_id, succeeded=True)
             else:
                 logger.debug("Determining retry behavior ...")
                 # job_status is either RunStatus.KILLED, or RunStatus.FAILED and retry logic kicks in.
 
                 # Explicitly mark the job failed.
-                Scheduler._add_log_to_run(run=latest_run)
+                Scheduler._add_log_to_run(
+                    run=latest_run, compress=self.options.compress_logs, max_bytes=self.options.max_log_bytes
+                )
                 Scheduler._mark_mlflow_run_as_failed(run_id=latest_run.mlflow_run_id)
 
                 if len(popped_job.runs) < self.failed_execution_retry_max:
                     # We are still under the try limit
                     logger.debug("Job will be retried")
-                    self.todo.append(job_id)
+                    self._enqueue(job_id=job_id)
                 else:
                     # Max retry count has been reached, mark as completed (though unsuccessful)
                     logger.debug("Job will not be retried")
-                    self.complete.append(job_id)
-        self.inprogress = new_inprogress
+                    self._complete(job_id=job_id, succeeded=False)
+        self.work_queue.inprogress = new_inprogress
+
+        self.checkpoint.flush(work_queue=self.work_queue)
 
     @staticmethod
     def _mark_mlflow_run_as_failed(run_id: str) -> None:
@@ -273,19 +755,25 @@ class Scheduler:
             pass
 
     @staticmethod
-    def _add_log_to_run(run: Union[ADSPSubmittedRun, LocalSubmittedRun]) -> None:
+    def _add_log_to_run(
+        run: Union[ADSPSubmittedRun, LocalSubmittedRun], compress: bool = False, max_bytes: Optional[int] = None
+    ) -> None:
         """
-        Adds background job log to the mlflow run as an artifact.
+        Adds background job log to the mlflow run as an artifact.  The full log size and line count are added as
+        run tags.
 
         Parameters
         ----------
         run: ADSPSubmittedRun
             Instance of the run to update.
+        compress: bool = False
+            Controls whether the log is stored gzip compressed.
+        max_bytes: Optional[int] = None
+            The size (in bytes) the log is capped to, keeping its head and tail.
         """
 
         if isinstance(run, ADSPSubmittedRun):
-            with mlflow.start_run(run_id=run.mlflow_run_id, nested=True):
-                mlflow.log_text(run.get_log(), artifact_file="job_log.txt")
+            upload_log(run_id=run.mlflow_run_id, chunks=run.iter_log(), compress=compress, max_bytes=max_bytes)
 
     @staticmethod
     def _coerce_run_status(status: Union[str, RunStatus]) -> Union[int, RunStatus]:
@@ -337,13 +825,25 @@ class Scheduler:
 
         logger.debug("Allowing for processing time when the queue is full")
         logger.debug(self._stats_str())
-        if (len(self.inprogress) >= self.max_workers) or (len(self.todo) <= 0 < len(self.inprogress)):
+        if self._work_queue_is_full():
             logger.debug("Queue is full (or only in progress work left), pausing before refilling the queue ...")
             time.sleep(pow(exponent, retries) * interval)  # exponential backoff
             logger.debug("done")
             return True
         return False
 
+    def _work_queue_is_full(self) -> bool:
+        """
+        Determines if there is nothing to do but wait on inprogress jobs.
+
+        Returns
+        -------
+        full: bool
+            `True` if the queue is full (or only in progress work is left), `False` otherwise.
+        """
+
+        return (len(self.inprogress) >= self.max_workers) or (len(self.todo) <= 0 < len(self.inprogress))
+
     def _work_queue_in_progress(self) -> bool:
         """
         Determines if the jobs in the work queue have completed.
@@ -0,0 +1,159 @@
+""" Workflow Step Result Caching """
+
+import hashlib
+import json
+import logging
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import git
+import mlflow
+from mlflow.entities import Run
+from mlflow.projects.submitted_run import SubmittedRun
+from mlflow.projects.utils import fetch_and_validate_project, get_git_commit
+
+from ..contracts.dto.cached_submitted_run import CachedSubmittedRun
+from ..contracts.dto.step import Step
+from .tracking import find_experiment
+
+logger = logging.getLogger(__name__)
+
+# The run tag holding the fingerprint of the step a run was launched for.
+STEP_FINGERPRINT_TAG: str = "mlflow_adsp.step_fingerprint"
+
+
+def fingerprint_step(step: Step, work_dirs: Optional[Dict[Tuple[str, Optional[str]], str]] = None) -> Optional[str]:
+    """
+    Generates a fingerprint of a workflow step, from its project, entry point, parameters and the git commit the
+    project version resolves to.
+
+    Parameters
+    ----------
+    step: Step
+        The workflow step to fingerprint.
+    work_dirs: Optional[Dict[Tuple[str, Optional[str]], str]] = None
+        The project work directories already fetched, keyed by project URI and version.  The project is fetched once
+        per URI and version, and added to it.
+
+    Returns
+    -------
+    fingerprint: Optional[str]
+        The step fingerprint, `None` if the project is not versioned with git or has uncommitted changes (its content
+        can not be pinned).
+    """
+
+    project: Tuple[str, Optional[str]] = (step.uri, step.version)
+    work_dir: Optional[Union[bytes, str]] = work_dirs.get(project) if work_dirs is not None else None
+    if work_dir is None:
+        work_dir = fetch_and_validate_project(step.uri, step.version, step.entry_point, step.parameters or {})
+        if work_dirs is not None:
+            work_dirs[project] = work_dir
+
+    commit: Optional[str] = get_git_commit(work_dir)
+    if commit is None:
+        message: str = f"Unable to resolve a git commit for project: ({step.uri}), step will not be cached"
+        logger.debug(message)
+        return None
+    if _has_uncommitted_changes(work_dir=work_dir):
+        message: str = f"Project has uncommitted changes: ({step.uri}), step will not be cached"
+        logger.debug(message)
+        return None
+
+    identity: Dict = {
+        "uri": step.uri,
+        "entry_point": step.entry_point,
+        "commit": commit,
+        "parameters": {str(key): str(value) for key, value in (step.parameters or {}).items()},
+    }
+    return hashlib.sha256(json.dumps(identity, sort_keys=True).encode(encoding="utf-8")).hexdigest()
+
+
+def _has_uncommitted_changes(work_dir: Union[bytes, str]) -> bool:
+    """
+    Checks whether the git working tree of a project differs from its commit (modified or untracked files).
+
+    Parameters
+    ----------
+    work_dir: Union[bytes, str]
+        The project work directory.
+
+    Returns
+    -------
+    dirty: bool
+        Whether the working tree has uncommitted changes.
+    """
+
+    return git.Repo(work_dir, search_parent_directories=True).is_dirty(untracked_files=True)
+
+
+def find_cached_run(step: Step, fingerprint: str) -> Optional[str]:
+    """
+    Searches the experiment of a workflow step for the latest finished run launched with the same fingerprint.
+
+    Parameters
+    ----------
+    step: Step
+        The workflow step.
+    fingerprint: str
+        The workflow step fingerprint.
+
+    Returns
+    -------
+    run_id: Optional[str]
+        The MLFlow Run ID of the finished run, `None` if there is not one.
+    """
+
+    # The experiment is not created here, a step without one has no finished runs to reuse.
+    experiment_id: Optional[str] = (
+        step.experiment_id if step.experiment_id is not None else find_experiment(name=step.experiment_name)
+    )
+    if experiment_id is None:
+        return None
+
+    runs: List[Run] = mlflow.search_runs(
+        experiment_ids=[experiment_id],
+        filter_string=f"tags.`{STEP_FINGERPRINT_TAG}` = '{fingerprint}' and attributes.status = 'FINISHED'",
+        max_results=1,
+        order_by=["attributes.start_time DESC"],
+        output_format="list",
+    )
+    return runs[0].info.run_id if len(runs) > 0 else None
+
+
+def launch_cached_step(
+    step: Step,
+    launch: Callable[..., SubmittedRun],
+    work_dirs: Optional[Dict[Tuple[str, Optional[str]], str]] = None,
+) -> Union[SubmittedRun, CachedSubmittedRun]:
+    """
+    Launches a workflow step, unless an identical step already finished successfully.
+
+    Launched runs are tagged with the step fingerprint, so that they can be reused once finished.
+
+    Parameters
+    ----------
+    step: Step
+        The workflow step.
+    launch: Callable[..., SubmittedRun]
+        Launches the workflow step (called with `step`).
+    work_dirs: Optional[Dict[Tuple[str, Optional[str]], str]] = None
+        The project work directories already fetched (see `fingerprint_step`).
+
+    Returns
+    -------
+    submitted_run: Union[SubmittedRun, CachedSubmittedRun]
+        The launched run, or the finished run being reused.
+    """
+
+    fingerprint: Optional[str] = fingerprint_step(step=step, work_dirs=work_dirs)
+    if fingerprint is None:
+        return launch(step=step)
+
+    cached_run_id: Optional[str] = find_cached_run(step=step, fingerprint=fingerprint)
+    if cached_run_id is not None:
+        message: str = f"Reusing finished run: {cached_run_id}, for step fingerprint: {fingerprint}"
+        logger.info(message)
+        return CachedSubmittedRun(mlflow_run_id=cached_run_id)
+
+    submitted_run: SubmittedRun = launch(step=step)
+    mlflow.MlflowClient().set_tag(run_id=submitted_run.run_id, key=STEP_FINGERPRINT_TAG, value=fingerprint)
+    return submitted_run
@@ -0,0 +1,121 @@
+""" Workflow Step Dependency Graph """
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from ..contracts.dto.job import Job
+from ..contracts.errors.plugin import ADSPMLFlowPluginError
+
+
+def link_steps(jobs: List[Job]) -> Tuple[Dict[str, Set[str]], Dict[str, List[str]]]:
+    """
+    Resolves the dependencies the steps of a work queue declare on each other (by step name).
+
+    Parameters
+    ----------
+    jobs: List[Job]
+        The jobs of the work queue.
+
+    Returns
+    -------
+    blocked: Dict[str, Set[str]]
+        The ids of the jobs each job depends on.  Jobs without dependencies are left out.
+    dependents: Dict[str, List[str]]
+        The ids of the jobs depending on each job.
+    """
+
+    names: Dict[str, str] = {}
+    for job in jobs:
+        if job.step.name is not None:
+            if job.step.name in names:
+                message: str = f"Step name is not unique: ({job.step.name})"
+                raise ADSPMLFlowPluginError(message)
+            names[job.step.name] = job.id
+
+    blocked: Dict[str, Set[str]] = {}
+    dependents: Dict[str, List[str]] = {}
+    for job in jobs:
+        # Duplicate declarations are ignored, order is preserved.
+        for name in dict.fromkeys(job.step.depends_on):
+            if name not in names:
+                message: str = f"Step ({job.step.name or job.id}) depends on an unknown step: ({name})"
+                raise ADSPMLFlowPluginError(message)
+            blocked.setdefault(job.id, set()).add(names[name])
+            dependents.setdefault(names[name], []).append(job.id)
+
+    # Every job must be reachable from the jobs without dependencies (Kahn's algorithm).
+    waiting: Dict[str, int] = {job_id: len(parents) for job_id, parents in blocked.items()}
+    ready: List[str] = [job.id for job in jobs if job.id not in blocked]
+    reachable: int = 0
+    while len(ready) > 0:
+        reachable += 1
+        for child_id in dependents.get(ready.pop(), []):
+            waiting[child_id] -= 1
+            if waiting[child_id] == 0:
+                ready.append(child_id)
+    if reachable < len(jobs):
+        raise ADSPMLFlowPluginError("Step dependencies contain a cycle")
+
+    return blocked, dependents
+
+
+def release_dependents(job_id: str, blocked: Dict[str, Set[str]], dependents: Dict[str, List[str]]) -> List[str]:
+    """
+    Removes a successfully finished job from the dependencies of the jobs depending on it.  Jobs left without pending
+    dependencies are removed from `blocked`.
+
+    Parameters
+    ----------
+    job_id: str
+        The id of the finished job.
+    blocked: Dict[str, Set[str]]
+        The ids of the jobs each blocked job depends on (updated in place).
+    dependents: Dict[str, List[str]]
+        The ids of the jobs depending on each job.
+
+    Returns
+    -------
+    released: List[str]
+        The ids of the blocked jobs which depended on the finished job.
+    """
+
+    released: List[str] = []
+    for child_id in dependents.get(job_id, []):
+        parents: Optional[Set[str]] = blocked.get(child_id)
+        if parents is None:
+            continue
+        parents.discard(job_id)
+        released.append(child_id)
+        if len(parents) < 1:
+            del blocked[child_id]
+    return released
+
+
+def skip_dependents(job_id: str, blocked: Dict[str, Set[str]], dependents: Dict[str, List[str]]) -> List[str]:
+    """
+    Removes every job (transitively) depending on a failed job from `blocked`, as they can no longer run.
+
+    Parameters
+    ----------
+    job_id: str
+        The id of the failed job.
+    blocked: Dict[str, Set[str]]
+        The ids of the jobs each blocked job depends on (updated in place).
+    dependents: Dict[str, List[str]]
+        The ids of the jobs depending on each job.
+
+    Returns
+    -------
+    skipped: List[str]
+        The ids of the jobs which will not run.
+    """
+
+    skipped: List[str] = []
+    failed: List[str] = [job_id]
+    while len(failed) > 0:
+        for child_id in dependents.get(failed.pop(), []):
+            if child_id not in blocked:
+                continue
+            del blocked[child_id]
+            skipped.append(child_id)
+            failed.append(child_id)
+    return skipped
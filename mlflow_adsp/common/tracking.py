@@ -63,6 +63,25 @@ def upsert_experiment(name: Optional[str] = None) -> str:
     return experiment_id
 
 
+def find_experiment(name: Optional[str] = None) -> Optional[str]:
+    """
+    This function returns the experiment id for the provided experiment name, without creating it.
+
+    Parameters
+    ----------
+    name: Optional[str]
+        The experiment name.
+
+    Returns
+    -------
+    experiment_id: Optional[str]
+        The experiment ID, `None` if the experiment does not exist.
+    """
+
+    experiment: Optional[Experiment] = mlflow.get_experiment_by_name(name=_resolve_experiment_name(name=name))
+    return experiment.experiment_id if experiment is not None else None
+
+
 def create_unique_name(name: str) -> str:
     """
     Given a name will generate unique suffix and return the updated name.
@@ -0,0 +1,201 @@
+""" Scheduler Work Queue State """
+
+import logging
+import uuid
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from ..contracts.dto.job import Job
+from ..contracts.dto.step import Step
+from .fair_share_queue import FairShareQueue
+from .step_graph import link_steps, release_dependents, skip_dependents
+
+logger = logging.getLogger(__name__)
+
+
+class WorkQueue:
+    """
+    The scheduling state of a work queue: its jobs, the queues they move through, and the dependencies between them.
+
+    Attributes
+    ----------
+    jobs: Dict[str, Job]
+        The jobs the user requested for processing keyed by job id (in submission order).
+    todo: FairShareQueue
+        The jobs marked as TODO but that are not yet under execution.  Higher priority steps are launched first, and
+        launches are shared fairly between step groups (first in, first out otherwise).
+    inprogress: Deque[str]
+        Jobs which have started put are not yet finished.
+    complete: Set[str]
+        Jobs which have completed (successfully or not).
+    blocked: Dict[str, Set[str]]
+        Jobs waiting on the steps they depend on, with the ids of the jobs they are still waiting on.
+    dependents: Dict[str, List[str]]
+        The ids of the jobs depending on each job.
+    unreported: Deque[str]
+        Completed jobs (in completion order) not yet handed back to the caller.
+    """
+
+    jobs: Dict[str, Job]
+
+    # Used for tracking jobs in different states of execution.
+    todo: FairShareQueue
+    inprogress: Deque[str]
+    complete: Set[str]
+
+    # Used for tracking step dependencies.
+    blocked: Dict[str, Set[str]]
+    dependents: Dict[str, List[str]]
+
+    unreported: Deque[str]
+
+    def __init__(self, group_weights: Optional[Dict[str, float]] = None):
+        self.jobs = {}
+        self.todo = FairShareQueue(weights=group_weights)
+        self.inprogress = deque()
+        self.complete = set()
+        self.blocked = {}
+        self.dependents = {}
+        self.unreported = deque()
+
+    def build(self, steps: List[Step]) -> None:
+        """
+        Builds the jobs of the requested steps, queueing the jobs without dependencies.
+
+        Parameters
+        ----------
+        steps: List[Step]
+            The list of execution requests to process.
+        """
+
+        for step in steps:
+            job: Job = Job(id=str(uuid.uuid4()), step=step, runs=[])
+            self.jobs[job.id] = job
+
+        self.blocked, self.dependents = link_steps(jobs=list(self.jobs.values()))
+        for job_id in self.jobs:
+            if job_id not in self.blocked:
+                self.enqueue(job_id=job_id)
+
+    def enqueue(self, job_id: str) -> None:
+        """
+        Queues a job for launching, by the priority and group of its step.
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the job to queue.
+        """
+
+        step: Step = self.jobs[job_id].step
+        self.todo.append(job_id, priority=step.priority, group=step.group)
+
+    def mark_complete(self, job_id: str, succeeded: bool) -> List[str]:
+        """
+        Marks a job as complete.  If it succeeded, dependent jobs with no other pending dependencies are queued.
+        Otherwise, every (transitively) dependent job is completed without being run.
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the completed job.
+        succeeded: bool
+            Whether the job finished successfully.
+
+        Returns
+        -------
+        changed: List[str]
+            The ids of the jobs whose state changed (the completed job first).
+        """
+
+        self.complete.add(job_id)
+        self.unreported.append(job_id)
+        changed: List[str] = [job_id]
+
+        if succeeded:
+            for child_id in release_dependents(job_id=job_id, blocked=self.blocked, dependents=self.dependents):
+                changed.append(child_id)
+                if child_id not in self.blocked:
+                    self.enqueue(job_id=child_id)
+            return changed
+
+        for child_id in skip_dependents(job_id=job_id, blocked=self.blocked, dependents=self.dependents):
+            self.jobs[child_id].blocked_by = job_id
+            message: str = f"Job ID: {child_id}, Skipped, depends on failed job: {job_id}"
+            logger.warning(message)
+            self.complete.add(child_id)
+            self.unreported.append(child_id)
+            changed.append(child_id)
+        return changed
+
+    def drain(self) -> Tuple[List[str], List[str]]:
+        """
+        Empties the queues, so that no further jobs are launched or reviewed.
+
+        Returns
+        -------
+        inprogress: List[str]
+            The ids of the jobs which were in progress.
+        pending: List[str]
+            The ids of the jobs which were queued or blocked.
+        """
+
+        inprogress: List[str] = list(self.inprogress)
+        pending: List[str] = list(self.todo) + list(self.blocked)
+        self.inprogress.clear()
+        self.todo.clear()
+        self.blocked.clear()
+        return inprogress, pending
+
+    def pop_unreported(self) -> List[Job]:
+        """
+        Hands back the completed jobs not yet reported.
+
+        Returns
+        -------
+        jobs: List[Job]
+            The completed jobs, in completion order.
+        """
+
+        completed: List[Job] = []
+        while len(self.unreported) > 0:
+            completed.append(self.jobs[self.unreported.popleft()])
+        return completed
+
+    def release(self, job_id: str) -> None:
+        """
+        Drops a completed job from the work queue.
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the job to drop.
+        """
+
+        del self.jobs[job_id]
+        self.dependents.pop(job_id, None)
+
+    def get_state(self, job_id: str, inprogress: Set[str]) -> str:
+        """
+        Determines the scheduling state of a job.
+
+        Parameters
+        ----------
+        job_id: str
+            The id of the job.
+        inprogress: Set[str]
+            The ids of the jobs in progress (`inprogress` is a queue, membership is checked against a set instead).
+
+        Returns
+        -------
+        state: str
+            The scheduling state of the job (`todo`, `inprogress`, `blocked` or `complete`).
+        """
+
+        if job_id in self.complete:
+            return "complete"
+        if job_id in self.blocked:
+            return "blocked"
+        if job_id in inprogress:
+            return "inprogress"
+        return "todo"
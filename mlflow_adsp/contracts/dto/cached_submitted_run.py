@@ -0,0 +1,45 @@
+""" Cached Submitted Run Definition """
+
+from mlflow.entities import RunStatus
+from mlflow.projects.submitted_run import SubmittedRun
+
+from .base_model import BaseModel
+
+
+class CachedSubmittedRun(SubmittedRun, BaseModel):
+    """
+    A previously finished run, reused in place of launching a workflow step again.
+
+    Attributes
+    ----------
+    mlflow_run_id: str
+        The MLFlow Run ID of the finished run.
+    """
+
+    mlflow_run_id: str
+
+    def wait(self) -> bool:
+        """The run has already finished successfully."""
+
+        return True
+
+    def get_status(self) -> RunStatus:
+        """The run has already finished successfully."""
+
+        return RunStatus.FINISHED
+
+    def cancel(self) -> None:
+        """The run has already finished, there is nothing to cancel."""
+
+    @property
+    def run_id(self):
+        """
+        `run_id` Property
+
+        Returns
+        -------
+        run_id: str
+            The MLFlow Run ID
+        """
+
+        return self.mlflow_run_id
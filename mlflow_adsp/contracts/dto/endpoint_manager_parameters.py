@@ -1,9 +1,13 @@
 """ Endpoint Manager Parameters Definition"""
 
+import os
+import tempfile
 from typing import Optional
 
 from ae5_tools import demand_env_var, demand_env_var_as_bool, get_env_var
 
+from ..types.change_detection_type import ChangeDetectionType
+from ..types.reload_strategy_type import ReloadStrategyType
 from .base_model import BaseModel
 
 
@@ -22,8 +26,31 @@ class EndpointManagerParameters(BaseModel):
         Port to bind server to.
     model_uri: str
         The model URI to load.
+    model_uris: Optional[list[str]] = None
+        The model URIs to serve side by side from a single endpoint, each optionally prefixed with its route name
+        (`<name>=<model URI>`).  The route name defaults to the registered model name.  Requests to
+        `/<name>/invocations` are routed to the model, and the endpoint proxy is always enabled.
     heart_beat: int = 5
         The internal (in seconds) to check for new model versions.
+    change_detection: ChangeDetectionType = ChangeDetectionType.POLL
+        How changes to the model version are detected.
+        `poll` checks the registry every `heart_beat` seconds.
+        `adaptive` backs off from `heart_beat` up to `max_heart_beat` seconds while the registry is unchanged.
+        `webhook` checks the registry when the webhook listener receives an event for the model, and at least every
+        `max_heart_beat` seconds.
+        `shared` looks up each registered model once every `heart_beat` seconds on behalf of all the served models,
+        and checks a model when its version changed (and at least every `max_heart_beat` seconds).
+        With `adaptive` and `webhook`, the registered model is fetched first and the version is only looked up if it
+        changed.
+    max_heart_beat: int = 60
+        The maximum interval (in seconds) between checks for new model versions with `adaptive`, `webhook` and
+        `shared` change detection.
+    webhook_host: str = "0.0.0.0"
+        Host to bind the webhook listener to.
+    webhook_port: int = 8085
+        Port to bind the webhook listener to.
+    webhook_token: Optional[str] = None
+        If set, registry events must provide it as a bearer token.
     enable_mlserver: bool = False
         Flag to control using mlserver rather than native MLflow serve.
     max_tries: int
@@ -31,17 +58,81 @@ class EndpointManagerParameters(BaseModel):
         this refers to the number of times the api endpoint is checked for health before giving up.
     timeout: int
         When attempting to read streams from `mlflow serve` this refers to the timeout of the operation.
+    metrics_host: str = "0.0.0.0"
+        Host to bind the metrics server to.
+    metrics_port: Optional[int] = None
+        Port to expose Prometheus metrics on (`/metrics`).  Metrics are not exposed if unset.
+    log_buffer_size: int = 1000
+        The number of recent output lines of the `mlflow serve` process kept in memory (e.g. for startup failures).
+    log_rate_limit: int = 100
+        The maximum number of output lines per second of the `mlflow serve` process forwarded to logging, 0 to
+        disable the limit.  Lines beyond the limit are counted and reported as suppressed.
+    enable_proxy: bool = False
+        Flag to front the `mlflow serve` process with the endpoint proxy.  Always enabled for blue-green reloads.
+    reload_strategy: ReloadStrategyType = ReloadStrategyType.RESTART
+        How the `mlflow serve` process is replaced when the model version changes.
+        `restart` stops the running process before launching the new one.
+        `blue-green` launches the new version on an internal port and switches traffic once it is healthy.
+    internal_host: str = "127.0.0.1"
+        Host the `mlflow serve` processes bind to when they sit behind the endpoint proxy.
+    internal_port: int = 8087
+        The first of the two internal ports the `mlflow serve` processes alternate between for blue-green reloads.
+    drain_timeout: int = 30
+        The maximum time (in seconds) to wait for in-flight requests to the previous process to finish before it is
+        stopped.
+    hold_timeout: int = 30
+        The maximum time (in seconds) the endpoint proxy holds a request while the `mlflow serve` process is replaced.
+    prefetch: bool = False
+        Flag to download (and for non `local` environment managers, prepare the environment of) a new model version
+        into the model cache before the running `mlflow serve` process is replaced, rather than after it stopped.
+    model_cache_dir: str
+        The local (content addressed) model cache directory reloadable model versions are downloaded to.
+        The directory can be shared between replicas, the model versions being served are leased against eviction.
+    model_cache_size: int = 10240
+        The size limit (in megabytes) of the model cache.  Least recently used model versions are evicted beyond it.
+    warm_up_requests: int = 0
+        The number of warm-up requests sent to a new `mlflow serve` process before traffic is routed to it.
+    warm_up_payload: Optional[str] = None
+        Path to the JSON request body used for warm-up requests.
+        Defaults to the `serving_input_example.json` of the prefetched model.
+    warm_up_timeout: int = 60
+        The timeout (in seconds) of each warm-up request.  Inference on a cold model can take far longer than a
+        health probe.
     """
 
     env_manager: str = demand_env_var(name="ENV_MANAGER") if get_env_var(name="ENV_MANAGER") else "local"
     host: str = demand_env_var(name="APP_SERVER_HOST") if get_env_var(name="APP_SERVER_HOST") else "0.0.0.0"
     port: int = int(demand_env_var(name="APP_SERVER_PORT")) if get_env_var(name="APP_SERVER_PORT") else 8086
     model_uri: Optional[str] = demand_env_var(name="MLFLOW_MODEL_URI") if get_env_var(name="MLFLOW_MODEL_URI") else None
+    model_uris: Optional[list[str]] = (
+        [model_uri.strip() for model_uri in demand_env_var(name="MLFLOW_MODEL_URIS").split(",") if model_uri.strip()]
+        if get_env_var(name="MLFLOW_MODEL_URIS")
+        else None
+    )
     heart_beat: int = (
         int(demand_env_var(name="APP_SERVER_TRACKING_HEART_BEAT"))
         if get_env_var(name="APP_SERVER_TRACKING_HEART_BEAT")
         else 5
     )
+    change_detection: ChangeDetectionType = (
+        ChangeDetectionType(demand_env_var(name="APP_SERVER_CHANGE_DETECTION"))
+        if get_env_var(name="APP_SERVER_CHANGE_DETECTION")
+        else ChangeDetectionType.POLL
+    )
+    max_heart_beat: int = (
+        int(demand_env_var(name="APP_SERVER_TRACKING_MAX_HEART_BEAT"))
+        if get_env_var(name="APP_SERVER_TRACKING_MAX_HEART_BEAT")
+        else 60
+    )
+    webhook_host: str = (
+        demand_env_var(name="APP_SERVER_WEBHOOK_HOST") if get_env_var(name="APP_SERVER_WEBHOOK_HOST") else "0.0.0.0"
+    )
+    webhook_port: int = (
+        int(demand_env_var(name="APP_SERVER_WEBHOOK_PORT")) if get_env_var(name="APP_SERVER_WEBHOOK_PORT") else 8085
+    )
+    webhook_token: Optional[str] = (
+        demand_env_var(name="MLFLOW_ADSP_WEBHOOK_TOKEN") if get_env_var(name="MLFLOW_ADSP_WEBHOOK_TOKEN") else None
+    )
     enable_mlserver: bool = (
         demand_env_var_as_bool(name="APP_SERVER_MLSERVER") if get_env_var(name="APP_SERVER_MLSERVER") else False
     )
@@ -56,3 +147,73 @@ class EndpointManagerParameters(BaseModel):
     timeout: int = (
         int(demand_env_var(name="MLFLOW_ADSP_SERVE_TIMEOUT")) if get_env_var(name="MLFLOW_ADSP_SERVE_TIMEOUT") else 5
     )
+    metrics_host: str = (
+        demand_env_var(name="APP_SERVER_METRICS_HOST") if get_env_var(name="APP_SERVER_METRICS_HOST") else "0.0.0.0"
+    )
+    metrics_port: Optional[int] = (
+        int(demand_env_var(name="APP_SERVER_METRICS_PORT")) if get_env_var(name="APP_SERVER_METRICS_PORT") else None
+    )
+    log_buffer_size: int = (
+        int(demand_env_var(name="MLFLOW_ADSP_SERVE_LOG_BUFFER_SIZE"))
+        if get_env_var(name="MLFLOW_ADSP_SERVE_LOG_BUFFER_SIZE")
+        else 1000
+    )
+    log_rate_limit: int = (
+        int(demand_env_var(name="MLFLOW_ADSP_SERVE_LOG_RATE_LIMIT"))
+        if get_env_var(name="MLFLOW_ADSP_SERVE_LOG_RATE_LIMIT")
+        else 100
+    )
+    enable_proxy: bool = (
+        demand_env_var_as_bool(name="APP_SERVER_PROXY") if get_env_var(name="APP_SERVER_PROXY") else False
+    )
+    reload_strategy: ReloadStrategyType = (
+        ReloadStrategyType(demand_env_var(name="APP_SERVER_RELOAD_STRATEGY"))
+        if get_env_var(name="APP_SERVER_RELOAD_STRATEGY")
+        else ReloadStrategyType.RESTART
+    )
+    internal_host: str = (
+        demand_env_var(name="APP_SERVER_INTERNAL_HOST") if get_env_var(name="APP_SERVER_INTERNAL_HOST") else "127.0.0.1"
+    )
+    internal_port: int = (
+        int(demand_env_var(name="APP_SERVER_INTERNAL_PORT")) if get_env_var(name="APP_SERVER_INTERNAL_PORT") else 8087
+    )
+    drain_timeout: int = (
+        int(demand_env_var(name="MLFLOW_ADSP_SERVE_DRAIN_TIMEOUT"))
+        if get_env_var(name="MLFLOW_ADSP_SERVE_DRAIN_TIMEOUT")
+        else 30
+    )
+    hold_timeout: int = (
+        int(demand_env_var(name="MLFLOW_ADSP_SERVE_HOLD_TIMEOUT"))
+        if get_env_var(name="MLFLOW_ADSP_SERVE_HOLD_TIMEOUT")
+        else 30
+    )
+    prefetch: bool = (
+        demand_env_var_as_bool(name="MLFLOW_ADSP_SERVE_PREFETCH")
+        if get_env_var(name="MLFLOW_ADSP_SERVE_PREFETCH")
+        else False
+    )
+    model_cache_dir: str = (
+        demand_env_var(name="MLFLOW_ADSP_MODEL_CACHE_DIR")
+        if get_env_var(name="MLFLOW_ADSP_MODEL_CACHE_DIR")
+        else os.path.join(tempfile.gettempdir(), "mlflow-adsp", "models")
+    )
+    model_cache_size: int = (
+        int(demand_env_var(name="MLFLOW_ADSP_MODEL_CACHE_SIZE"))
+        if get_env_var(name="MLFLOW_ADSP_MODEL_CACHE_SIZE")
+        else 10240
+    )
+    warm_up_requests: int = (
+        int(demand_env_var(name="MLFLOW_ADSP_SERVE_WARM_UP_REQUESTS"))
+        if get_env_var(name="MLFLOW_ADSP_SERVE_WARM_UP_REQUESTS")
+        else 0
+    )
+    warm_up_payload: Optional[str] = (
+        demand_env_var(name="MLFLOW_ADSP_SERVE_WARM_UP_PAYLOAD")
+        if get_env_var(name="MLFLOW_ADSP_SERVE_WARM_UP_PAYLOAD")
+        else None
+    )
+    warm_up_timeout: int = (
+        int(demand_env_var(name="MLFLOW_ADSP_SERVE_WARM_UP_TIMEOUT"))
+        if get_env_var(name="MLFLOW_ADSP_SERVE_WARM_UP_TIMEOUT")
+        else 60
+    )
@@ -7,6 +7,7 @@ from mlflow.projects.submitted_run import LocalSubmittedRun
 
 from ...submitted_run import ADSPSubmittedRun
 from .base_model import BaseModel
+from .cached_submitted_run import CachedSubmittedRun
 from .step import Step
 
 
@@ -20,13 +21,22 @@ class Job(BaseModel):
         A unique (uuid) for the job.
     step: Step
         The origination request
-    runs: List[Union[ADSPSubmittedRun, LocalSubmittedRun]] = []
+    runs: List[Union[ADSPSubmittedRun, LocalSubmittedRun, CachedSubmittedRun]] = []
         The runs associated with the job request
     last_status: Optional[RunStatus] = None
         The last seen mlflow status of the job.
+    failed_submissions: int = 0
+        The number of attempts to launch the job which failed before a run was created.
+    blocked_by: Optional[str] = None
+        The id of the failed job this job depends on (directly or not), if the job was skipped because of it.
+    cancelled: bool = False
+        Whether the job was cancelled (while in progress or before being launched).
     """
 
     id: str
     step: Step
-    runs: List[Union[ADSPSubmittedRun, LocalSubmittedRun]] = []
+    runs: List[Union[ADSPSubmittedRun, LocalSubmittedRun, CachedSubmittedRun]] = []
     last_status: Optional[RunStatus] = None
+    failed_submissions: int = 0
+    blocked_by: Optional[str] = None
+    cancelled: bool = False
@@ -0,0 +1,43 @@
+""" Scheduler Options Definition """
+
+from typing import Callable, Dict, Optional
+
+from .base_model import BaseModel
+from .job import Job
+
+
+class SchedulerOptions(BaseModel):
+    """
+    Scheduler Options DTO
+
+    group_weights: Dict[str, float] = {}
+        The fair-share weight of each step group (1.0 by default).
+    cache_steps: bool = False
+        Whether steps which already finished successfully (same project commit, entry point and parameters, within
+        the same experiment) reuse the finished run rather than being launched again.
+    compress_logs: bool = False
+        Whether job logs are stored gzip compressed (as `job_log.txt.gz`).
+    max_log_bytes: Optional[int] = None
+        The size (in bytes) job logs are capped to, keeping their head and tail.  Logs are kept in full if unset.
+    interval: float = 2.0
+        The wait internal to use during exponential backoff
+    exponent: float = 1.4
+        The exponent used for calculated exponential backoff
+    disable_progress_bar: bool = False
+        Controls the display of the progress bar.
+    retain_jobs: bool = True
+        Controls whether completed jobs are kept in `jobs` once yielded.  Disable to release them for long queues
+        (only applies when iterating the work queue).
+    cancel_when: Optional[Callable[[Job], bool]] = None
+        Cancels the processing when it returns `True` for a completed job.
+    """
+
+    group_weights: Dict[str, float] = {}
+    cache_steps: bool = False
+    compress_logs: bool = False
+    max_log_bytes: Optional[int] = None
+    interval: float = 2.0
+    exponent: float = 1.4
+    disable_progress_bar: bool = False
+    retain_jobs: bool = True
+    cancel_when: Optional[Callable[[Job], bool]] = None
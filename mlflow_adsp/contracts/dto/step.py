@@ -1,6 +1,6 @@
 """ Execute Step Definition """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from .base_model import BaseModel
 
@@ -13,6 +13,8 @@ class Step(BaseModel):
         The backend to leverage for the step execution. Default is `adsp`.
     backend_config: Dict
         The `adsp` backend configuration.
+    depends_on: List[str] = []
+        The names of the steps (within the same work queue) which must finish successfully before this step runs.
     entry_point: str
         The workflow step to execute. Default is `main`.
     env_manager: str
@@ -21,8 +23,14 @@ class Step(BaseModel):
         The experiment ID to use for the execution.
     experiment_name: Optional[str]
         The experiment name to use for the execution.
+    group: Optional[str] = None
+        The fair-share group (e.g. tenant or team) of the step.  Launches are shared between groups by weight.
+    name: Optional[str] = None
+        A name (unique within the work queue) other steps can declare a dependency on.
     parameters: Dict
         The dictionary of parameters to pass to the workflow step.
+    priority: int = 0
+        Steps with a higher priority are launched first.
     run_id: Optional[str] = None
         If provided it is supplied and used for reporting.
     run_name: Optional[str] = None
@@ -32,16 +40,23 @@ class Step(BaseModel):
         For parallel processing this should be `False`.
     uri: str
         The URI of the MLproject to process.
+    version: Optional[str] = None
+        For git-based projects, either a commit hash or a branch name.
     """
 
     backend: str = "adsp"
     backend_config: Optional[Dict] = None
+    depends_on: List[str] = []
     entry_point: str = "main"
     env_manager: str = "local"
     experiment_id: Optional[str] = None
     experiment_name: Optional[str] = None
+    group: Optional[str] = None
+    name: Optional[str] = None
     parameters: Optional[Dict] = None
+    priority: int = 0
     run_id: Optional[str] = None
     run_name: Optional[str] = None
     synchronous: bool = False
     uri: str = "."
+    version: Optional[str] = None
@@ -0,0 +1,19 @@
+"""
+Change Detection Type Definition
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+
+
+class ChangeDetectionType(str, Enum):
+    """
+    Change Detection Type
+    Controls how the endpoint manager detects changes to the tracked model version.
+    """
+
+    POLL = "poll"
+    ADAPTIVE = "adaptive"
+    WEBHOOK = "webhook"
+    SHARED = "shared"
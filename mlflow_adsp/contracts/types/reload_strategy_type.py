@@ -0,0 +1,17 @@
+"""
+Reload Strategy Type Definition
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+
+
+class ReloadStrategyType(str, Enum):
+    """
+    Reload Strategy Type
+    Controls how the endpoint manager replaces the `mlflow serve` process when the tracked model version changes.
+    """
+
+    RESTART = "restart"
+    BLUE_GREEN = "blue-green"
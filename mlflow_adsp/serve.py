@@ -3,16 +3,25 @@ Wraps `mlflow serve`. This is not meant to be executed directly, but called thro
 """
 
 import sys
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 import click
 
 from .common.log import set_log_level
 from .contracts.dto.endpoint_manager_parameters import EndpointManagerParameters
 from .contracts.errors.plugin import ADSPMLFlowPluginError
+from .contracts.types.change_detection_type import ChangeDetectionType
 from .contracts.types.log_level import LogLevel
+from .contracts.types.reload_strategy_type import ReloadStrategyType
 from .services.endpoint_manager import EndpointManager
 
+# Converts the command line options which do not map directly onto a parameter.
+OPTION_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "model_uris": lambda model_uris: [uri.strip() for uri in model_uris.split(",") if uri.strip()],
+    "change_detection": ChangeDetectionType,
+    "reload_strategy": ReloadStrategyType,
+}
+
 
 # pylint: disable=too-many-arguments
 @click.command(name="serve")
@@ -35,30 +44,75 @@ from .services.endpoint_manager import EndpointManager
         "All other types will run without updating."
     ),
 )
+@click.option(
+    "--model-uris",
+    type=str,
+    help=(
+        "A comma separated list of MLflow compliant model URIs to serve side by side. "
+        "Each may be prefixed with a route name (name=uri), which defaults to the registered model name. "
+        "Requests to /<name>/invocations are routed to the model."
+    ),
+)
 @click.option(
     "--heart-beat",
     type=int,
     help="The internal to poll the MLflow Tracking Server for model updates when running a reloadable model type.",
 )
+@click.option(
+    "--change-detection",
+    type=click.Choice(["poll", "adaptive", "webhook", "shared"]),
+    help=(
+        "How model version changes are detected. "
+        "`adaptive` backs off while the registry is unchanged, `webhook` listens for registry events, "
+        "`shared` looks up each registered model once for all served models."
+    ),
+)
 @click.option("--enable-mlserver", type=bool, help="Flag for mlserver functionality.")
+@click.option(
+    "--enable-proxy",
+    type=bool,
+    help="Flag to front the served model with a proxy which holds and drains requests while the model is reloaded.",
+)
+@click.option(
+    "--reload-strategy",
+    type=click.Choice(["restart", "blue-green"]),
+    help=(
+        "How the served model is replaced when the version changes. "
+        "`blue-green` launches the new version on an internal port and switches traffic once healthy."
+    ),
+)
+@click.option(
+    "--prefetch",
+    type=bool,
+    help="Flag to download and prepare new model versions before the running model is replaced.",
+)
+@click.option("--metrics-port", type=int, help="Port to expose Prometheus metrics on (/metrics).")
 @click.option(
     "--log-level",
     type=click.Choice(["notset", "info", "warn", "warning", "debug", "error", "critical"]),
     help="Log level.",
 )
 def serve(
+    *,
     env_manager: Optional[str] = None,
     host: Optional[str] = None,
     port: Optional[int] = None,
     model_uri: Optional[str] = None,
+    model_uris: Optional[str] = None,
     heart_beat: Optional[int] = None,
+    change_detection: Optional[str] = None,
     enable_mlserver: Optional[bool] = None,
     max_tries: Optional[int] = None,
     timeout: Optional[int] = None,
+    enable_proxy: Optional[bool] = None,
+    reload_strategy: Optional[str] = None,
+    prefetch: Optional[bool] = None,
+    metrics_port: Optional[int] = None,
     log_level: Optional[str] = None,
 ) -> None:
     """
     Wraps `MLflow serve` allowing for reloading of models defined with stages or aliases.
+    The options are passed by keyword (as click does).
 
     Attributes
     ----------
@@ -72,8 +126,13 @@ def serve(
     model_uri: Optional[str]
         The MLflow compliant model URI to load. Only models defined in a stage or an alias can be dynamically reloaded.
         All other types will run without updating.
+    model_uris: Optional[str]
+        A comma separated list of model URIs to serve side by side, each optionally prefixed with a route name
+        (name=uri).  Requests to `/<name>/invocations` are routed to the model.
     heart_beat: Optional[int]
         The internal to poll the MLflow Tracking Server for model updates when running a reloadable model type.
+    change_detection: Optional[str]
+        How model version changes are detected (poll, adaptive, webhook, shared).
     enable_mlserver: Optional[bool]
         Enables mlserver functionality.
     max_tries: Optional[int]
@@ -81,36 +140,67 @@ def serve(
         health before giving up.
     timeout: Optional[int]
         When attempting to read streams from `mlflow serve` this refers to the timeout of the operation.
+    enable_proxy: Optional[bool]
+        Fronts the served model with a proxy which holds and drains requests while the model is reloaded.
+    reload_strategy: Optional[str]
+        How the served model is replaced when the version changes (restart, blue-green).
+    prefetch: Optional[bool]
+        Downloads and prepares new model versions before the running model is replaced.
+    metrics_port: Optional[int]
+        Port to expose Prometheus metrics on (`/metrics`).
     log_level: Optional[str]
         Log level.
     """
 
     set_log_level(level=LogLevel(log_level) if log_level else None)
 
+    EndpointManager.serve(
+        _build_parameters(
+            env_manager=env_manager,
+            host=host,
+            port=port,
+            model_uri=model_uri,
+            model_uris=model_uris,
+            heart_beat=heart_beat,
+            change_detection=change_detection,
+            enable_mlserver=enable_mlserver,
+            max_tries=max_tries,
+            timeout=timeout,
+            enable_proxy=enable_proxy,
+            reload_strategy=reload_strategy,
+            prefetch=prefetch,
+            metrics_port=metrics_port,
+        )
+    )
+
+
+def _build_parameters(**options: Any) -> EndpointManagerParameters:
+    """
+    Builds the endpoint manager parameters from the command line options.  Options which are not set keep the
+    (environment) defaults.
+
+    Parameters
+    ----------
+    options: Any
+        The command line options, keyed by parameter name.
+
+    Returns
+    -------
+    params: EndpointManagerParameters
+        The endpoint manager parameters.
+    """
+
     params = EndpointManagerParameters()
-    if env_manager:
-        params.env_manager = env_manager
-    if host:
-        params.host = host
-    if port:
-        params.port = port
-    if model_uri:
-        params.model_uri = model_uri
-    if heart_beat:
-        params.heart_beat = heart_beat
-    if enable_mlserver:
-        params.enable_mlserver = enable_mlserver
-    if max_tries:
-        params.max_tries = max_tries
-    if timeout:
-        params.timeout = timeout
-
-    if params.model_uri is None:
+    for name, value in options.items():
+        if value:
+            setattr(params, name, OPTION_CONVERTERS[name](value) if name in OPTION_CONVERTERS else value)
+
+    if params.model_uri is None and not params.model_uris:
         raise ADSPMLFlowPluginError("Unable to determine model URI")
 
-    EndpointManager.serve(params)
+    return params
 
 
 if __name__ == "__main__":
-    # pylint: disable=no-value-for-parameter
+    # pylint: disable=no-value-for-parameter,too-many-function-args
     serve(sys.argv)
@@ -0,0 +1,123 @@
+"""
+This module holds the Change Detector definitions used for scheduling checks of the model registry for version changes.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+
+from ..contracts.dto.target_metadata import TargetMetadata
+from .registry_watcher import RegistryWatcher
+from .webhook_listener import WebhookListener
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeDetector:
+    """
+    The ChangeDetector schedules checks of the model registry at a fixed interval.
+
+    Attributes
+    ----------
+    interval: float
+        The time (in seconds) to wait between checks.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+
+    def wait(self) -> None:
+        """Blocks until the next check is due."""
+
+        time.sleep(self.interval)
+
+    def record(self, changed: bool) -> None:
+        """
+        Records the outcome of a check.
+
+        Parameters
+        ----------
+        changed: bool
+            Whether the check found (and reloaded) a new model version.
+        """
+
+
+class AdaptiveChangeDetector(ChangeDetector):
+    """
+    The AdaptiveChangeDetector backs off while the model registry is unchanged, and returns to the minimum interval
+    after a change.  Intervals are jittered so that many endpoints do not poll in lockstep.
+
+    Attributes
+    ----------
+    interval: float
+        The current time (in seconds) to wait between checks.
+    min_interval: float
+        The interval after a change.
+    max_interval: float
+        The interval limit while unchanged.
+    factor: float = 2
+        The interval multiplier applied after each unchanged check.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float, factor: float = 2):
+        super().__init__(interval=min_interval)
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.factor = factor
+
+    def wait(self) -> None:
+        time.sleep(self.interval * random.uniform(0.9, 1.1))
+
+    def record(self, changed: bool) -> None:
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.factor, self.max_interval)
+        message: str = f"Next version check in ~{self.interval} seconds"
+        logger.debug(message)
+
+
+class EventChangeDetector(ChangeDetector):
+    """
+    The EventChangeDetector checks the model registry when its event is set.  The registry is still checked every
+    `interval` seconds in case an event is missed.
+
+    Attributes
+    ----------
+    interval: float
+        The maximum time (in seconds) to wait between checks.
+    event: threading.Event
+        Set when the model version may have changed.
+    """
+
+    def __init__(self, event: threading.Event, interval: float):
+        super().__init__(interval=interval)
+        self.event = event
+
+    def wait(self) -> None:
+        if self.event.wait(timeout=self.interval):
+            logger.info("Change notification received, checking for version changes ..")
+        self.event.clear()
+
+
+class WebhookChangeDetector(EventChangeDetector):
+    """
+    The WebhookChangeDetector checks the model registry when the webhook listener receives an event for the
+    registered model.
+    """
+
+    def __init__(self, listener: WebhookListener, registry: str, interval: float):
+        super().__init__(event=listener.subscribe(registry=registry), interval=interval)
+
+
+class SharedChangeDetector(EventChangeDetector):
+    """
+    The SharedChangeDetector checks the model registry when the shared registry watcher sees the version of the
+    designation change.
+    """
+
+    def __init__(self, watcher: RegistryWatcher, metadata: TargetMetadata, interval: float):
+        super().__init__(event=watcher.subscribe(metadata=metadata), interval=interval)
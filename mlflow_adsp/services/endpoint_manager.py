@@ -7,30 +7,47 @@ from __future__ import annotations
 import logging
 import os
 import random
+import re
 import shlex
 import signal
 import subprocess
+import threading
 import time
 from subprocess import TimeoutExpired
 from typing import Optional
 
+import mlflow
 import psutil
 import requests
 from mlflow import MlflowClient
-from mlflow.entities.model_registry import ModelVersion
+from mlflow.entities.model_registry import ModelVersion, RegisteredModel
 from mlflow.exceptions import MlflowException
 from requests import Response
 
 from ae5_tools import load_ae5_user_secrets
 
+from ..common.log_pump import LogPump
+from ..common.metrics import Counter, Gauge, Histogram, MetricsRegistry
+from ..common.model_cache import ModelCache
+from ..common.process import process_launch_wait
 from ..contracts.dto.endpoint_manager_parameters import EndpointManagerParameters
 from ..contracts.dto.target_metadata import TargetMetadata
 from ..contracts.errors.plugin import ADSPMLFlowPluginError
+from ..contracts.types.change_detection_type import ChangeDetectionType
+from ..contracts.types.reload_strategy_type import ReloadStrategyType
 from ..contracts.types.reloadable_model_uri_type import ReloadableModelUriType
+from .change_detector import AdaptiveChangeDetector, ChangeDetector, SharedChangeDetector, WebhookChangeDetector
+from .metrics_server import MetricsServer
+from .proxy import EndpointProxy
+from .registry_watcher import RegistryWatcher
+from .webhook_listener import WebhookListener
 
 logger = logging.getLogger(__name__)
 
 
+# The served process, its proxy route and the registry state it was launched from are deliberately kept flat on the
+# manager, the reload strategies read and replace them together (see `_swap`).
+# pylint: disable=too-many-instance-attributes
 class EndpointManager:
     """
     The EndpointManager handles wrapping `mlflow serve` and monitoring changes to the designation model version.
@@ -43,23 +60,139 @@ class EndpointManager:
         Endpoint manager parameters
     metadata: TargetMetadata
         The calculated metadata about the model
+    name: str
+        The name of the model in logs and metrics (the route, registered model name, or model URI).
     version: Optional[str] = None
         The current (known) model version if reloadable.
+    proxy: Optional[EndpointProxy] = None
+        The proxy fronting the `mlflow serve` process.  When set the process is bound to an internal port.
+    route: Optional[str] = None
+        The proxy route of the model when serving several models.
+    watcher: Optional[RegistryWatcher] = None
+        The shared registry watcher the model version is read from when using `shared` change detection.
+    process: Optional[subprocess.Popen] = None
+        The active `mlflow serve` process.
+    log_pump: Optional[LogPump] = None
+        Forwards the output of the most recently launched `mlflow serve` process.
+    host: str
+        The host the active `mlflow serve` process is bound to.
+    port: int
+        The port the active `mlflow serve` process is bound to.
+    model_uri: str
+        The model URI the active `mlflow serve` process was launched with.  This is the local model cache path of
+        the version for reloadable models.
+    cache: Optional[ModelCache] = None
+        The local model cache reloadable model versions are staged in.
+    fingerprint: Optional[tuple] = None
+        The registered model state the current version was last checked against.
     """
 
     SUBPROCESSES: list[subprocess.Popen] = []
-
-    def __init__(self, client: MlflowClient, params: EndpointManagerParameters):
+    # The initial delay (in seconds) between startup health probes.
+    STARTUP_PROBE_DELAY: float = 0.25
+
+    METRICS: MetricsRegistry = MetricsRegistry()
+    STARTUP_DURATION: Histogram = METRICS.register(
+        Histogram(
+            name="mlflow_adsp_startup_duration_seconds",
+            documentation="Time for a launched mlflow serve process to become healthy (or fail to).",
+            label_names=["model", "outcome"],
+            buckets=(1, 2.5, 5, 10, 30, 60, 120, 300, 600, 900),
+        )
+    )
+    REGISTRY_LOOKUP_DURATION: Histogram = METRICS.register(
+        Histogram(
+            name="mlflow_adsp_registry_lookup_duration_seconds",
+            documentation="Latency of model registry version lookups.",
+            label_names=["model", "designation", "outcome"],
+        )
+    )
+    RELOADS: Counter = METRICS.register(
+        Counter(
+            name="mlflow_adsp_reloads_total",
+            documentation="Model version reloads.",
+            label_names=["model", "strategy"],
+        )
+    )
+    RETRIES: Counter = METRICS.register(
+        Counter(
+            name="mlflow_adsp_retries_total",
+            documentation="Retries of failed startups and reloads.",
+            label_names=["error"],
+        )
+    )
+    CHILD_RESTARTS: Counter = METRICS.register(
+        Counter(
+            name="mlflow_adsp_child_restarts_total",
+            documentation="Restarts of the mlflow serve process after a failure.",
+            label_names=["model"],
+        )
+    )
+    SERVED_VERSION: Gauge = METRICS.register(
+        Gauge(
+            name="mlflow_adsp_served_version",
+            documentation="The registered model version being served.",
+            label_names=["model"],
+        )
+    )
+    CHILD_RSS: Gauge = METRICS.register(
+        Gauge(
+            name="mlflow_adsp_child_rss_bytes",
+            documentation="Resident memory of the mlflow serve process and its children.",
+            label_names=["model"],
+        )
+    )
+    SUBPROCESSES_LOCK: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        client: MlflowClient,
+        params: EndpointManagerParameters,
+        proxy: Optional[EndpointProxy] = None,
+        route: Optional[str] = None,
+        watcher: Optional[RegistryWatcher] = None,
+    ):
         self.client = client
 
         self.params = params
+        self.proxy = proxy
+        self.route = route
+        self.watcher = watcher
+        self.process: Optional[subprocess.Popen] = None
+        self.log_pump: Optional[LogPump] = None
+        self.version: Optional[str] = None
+        if self.proxy:
+            self.host: str = self.params.internal_host
+            self.port: int = self.params.internal_port
+        else:
+            if self.params.reload_strategy == ReloadStrategyType.BLUE_GREEN:
+                raise ADSPMLFlowPluginError("Blue-green reloads require an endpoint proxy")
+            self.host: str = self.params.host
+            self.port: int = self.params.port
+
+        self.model_uri: str = self.params.model_uri
+        self.fingerprint: Optional[tuple] = None
+        self.cache: Optional[ModelCache] = None
         self.metadata = TargetMetadata(model_uri=self.params.model_uri)
         if self.metadata.reloadable:
-            self.version = self._get_latest_version()
-            message: str = f"Loaded model version ({self.version})"
-            logger.info(message)
+            self.cache = ModelCache(
+                root=self.params.model_cache_dir, max_size=self.params.model_cache_size * 1024 * 1024
+            )
+            self.cache.start()
+        self.name: str = EndpointManager._get_name(params=self.params, route=self.route)
+        try:
+            if self.metadata.reloadable:
+                self.version = self._get_latest_version()
+                message: str = f"Loaded model version ({self.version})"
+                logger.info(message)
+                self.model_uri = self._stage(version=self.version)
 
-        self._launch()
+            self._launch()
+        except Exception as error:
+            # The manager is never handed back, so its model cache leases are released here.
+            if self.cache:
+                self.cache.stop()
+            raise error
 
     def _process_launch(self, shell_out_cmd: str, cwd: str = ".") -> subprocess.Popen:
         logger.info(shell_out_cmd)
@@ -67,8 +200,15 @@ class EndpointManager:
 
         try:
             # pylint: disable=consider-using-with
-            process = subprocess.Popen(args=args, cwd=cwd)
-            EndpointManager._proc_comm(process=process, timeout=self.params.timeout)
+            process = subprocess.Popen(args=args, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            self.log_pump = LogPump(
+                process=process,
+                name=self.name,
+                version=self.version,
+                buffer_size=self.params.log_buffer_size,
+                rate_limit=self.params.log_rate_limit,
+            )
+            self.log_pump.start()
             return process
         except ADSPMLFlowPluginError as error:
             # Any failure here is a failed start up of the process.
@@ -83,15 +223,10 @@ class EndpointManager:
             logger.error(message)
             raise ADSPMLFlowPluginError(message) from error
 
-    def _poll_network_service(self, process: subprocess.Popen) -> bool:
+    def _poll_network_service(self) -> bool:
         """
         Polls the network service endpoint of the process and determines if its online.
 
-        Parameters
-        ----------
-        process: subprocess.POpen
-            The process for the network endpoint.
-
         Returns
         -------
         ready: bool
@@ -99,108 +234,378 @@ class EndpointManager:
         """
 
         try:
-            version_endpoint_url: str = f"http://{self.params.host}:{self.params.port}/version"
+            version_endpoint_url: str = f"http://{self.host}:{self.port}/version"
             response: Response = requests.get(url=version_endpoint_url, timeout=self.params.timeout)
             if response.status_code != 200:
                 logger.debug("Service not yet healthy, waiting ..")
-                EndpointManager._proc_comm(process=process, timeout=self.params.timeout)
             else:
                 logger.debug("Service healthy")
                 return True
 
         except requests.exceptions.ConnectionError:
             logger.debug("Unable to connect to service, waiting ..")
-            EndpointManager._proc_comm(process=process, timeout=self.params.timeout)
 
         return False
 
-    def _process_launch_wrapper(self, shell_out_cmd: str, cwd: str = ".") -> None:
+    def _process_launch_wrapper(self, shell_out_cmd: str, cwd: str = ".") -> subprocess.Popen:
         # Launch the process
         process: subprocess.Popen = self._process_launch(shell_out_cmd=shell_out_cmd, cwd=cwd)
+        start: float = time.monotonic()
 
-        # Monitor the service until its only, or we've failed to start up.
+        # Monitor the service until its online, or we've failed to start up.
+        # The service is probed on a short schedule which backs off (with jitter) up to the timeout, so readiness is
+        # seen as soon as the endpoint answers.  Between probes we wait on the process, returning early if it exits.
+        healthy: bool = False
+        delay: float = EndpointManager.STARTUP_PROBE_DELAY
         current_try: int = 0
         while current_try < self.params.max_tries:
             current_try += 1
             message: str = f"Wait cycle {current_try} of {self.params.max_tries}"
             logger.debug(message)
-            EndpointManager._proc_comm(process=process, timeout=self.params.timeout)
 
             # Ensure the process started up (and hasn't terminated)
             if process.poll():
                 # Then the process terminated unexpectedly,
-                EndpointManager._stop()
                 logger.error("Subprocess failed to start up successfully")
                 break
 
             # Determine if the network service is responding
-            if self._poll_network_service(process=process):
+            if self._poll_network_service():
+                healthy = True
                 break
 
-        # Provide the last output available before moving on.
-        EndpointManager._proc_comm(process=process, timeout=self.params.timeout)
+            EndpointManager._proc_wait(process=process, timeout=delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 2, self.params.timeout)
 
         # Check our failure (timout, terminated process) states.
 
-        if current_try >= self.params.max_tries:
-            EndpointManager._stop()
+        EndpointManager.STARTUP_DURATION.observe(
+            time.monotonic() - start, model=self.name, outcome="success" if healthy else "failure"
+        )
+        if not healthy:
+            terminated: bool = bool(process.poll())
+            EndpointManager._stop(processes=[process])
+            if self.log_pump and self.log_pump.tail():
+                message: str = "Last output of the process:\n" + "\n".join(self.log_pump.tail())
+                logger.error(message)
+            if terminated:
+                raise ADSPMLFlowPluginError("Subprocess failed to start up successfully")
             raise ADSPMLFlowPluginError("Unable to start process within timeframe")
 
-        if process.poll():
-            EndpointManager._stop()
-            raise ADSPMLFlowPluginError("Subprocess failed to start up successfully")
-
         # Add process to class level list for management.
-        EndpointManager.SUBPROCESSES.append(process)
+        with EndpointManager.SUBPROCESSES_LOCK:
+            EndpointManager.SUBPROCESSES.append(process)
 
         logger.info("Done monitoring startup, moving on ..")
+        return process
 
     @staticmethod
-    def _proc_comm(process: subprocess.Popen, timeout: int = 5):
+    def _proc_wait(process: subprocess.Popen, timeout: float = 5) -> None:
+        """Waits (up to the timeout) for the process to exit.  Its output is forwarded by the log pump."""
+
         try:
-            process.communicate(timeout=timeout)
-            (stdout, stderr) = process.communicate(timeout=timeout)
-            if stdout:
-                for line in iter(stdout.readline, b""):
-                    logger.info(line)
-            if stderr:
-                for line in iter(stderr.readline, b""):
-                    logger.info(line)
+            process.wait(timeout=timeout)
         except TimeoutExpired:
             pass
 
     def _launch(self) -> None:
-        """Launches the `mlflow serve` process."""
+        """Launches the `mlflow serve` process, and routes the proxy to it once healthy."""
 
         load_ae5_user_secrets()
         serve_cmd: str = (
             "mlflow models serve "
             f"--env-manager {self.params.env_manager} "
-            f"--host {self.params.host} "
-            f"--port {self.params.port} "
-            f"--model-uri {self.params.model_uri}"
+            f"--host {self.host} "
+            f"--port {self.port} "
+            f"--model-uri {self.model_uri}"
         )
         if self.params.enable_mlserver:
             serve_cmd += " --enable-mlserver"
-        self._process_launch_wrapper(shell_out_cmd=serve_cmd)
+        process: subprocess.Popen = self._process_launch_wrapper(shell_out_cmd=serve_cmd)
+        try:
+            self._warm_up()
+        except Exception as error:
+            EndpointManager._stop(processes=[process])
+            raise error
+        self.process = process
+
+        if self.proxy:
+            self.proxy.switch(backend_port=self.port, route=self.route)
+
+        if self.version and str(self.version).isdigit():
+            EndpointManager.SERVED_VERSION.set(float(self.version), model=self.name)
+        EndpointManager.CHILD_RSS.set_function(self._get_rss, model=self.name)
+
+    def _get_rss(self) -> Optional[float]:
+        """
+        Gets the resident memory of the active `mlflow serve` process and its children.
+
+        Returns
+        -------
+        rss: Optional[float]
+            The resident memory (in bytes), `None` if there is no running process.
+        """
+
+        if not self.process:
+            return None
+        try:
+            app_subprocess = psutil.Process(pid=self.process.pid)
+            processes: list[psutil.Process] = [app_subprocess, *app_subprocess.children(recursive=True)]
+            return float(sum(process.memory_info().rss for process in processes))
+        except psutil.Error:
+            return None
+
+    def update(self) -> bool:
+        """
+        (Re)starts the `mlflow serve` process if the model version changed.
 
-    def update(self) -> None:
-        """(Re)starts the `mlflow serve` process if the model version changed."""
+        Returns
+        -------
+        reloaded: bool
+            Whether a new model version was launched.
+        """
 
+        reloaded: bool = False
         if self.metadata.reloadable:
+            fingerprint: Optional[tuple] = None
+            if self.params.change_detection in (ChangeDetectionType.ADAPTIVE, ChangeDetectionType.WEBHOOK):
+                # Conditional check, the version is only looked up if the registered model changed.
+                fingerprint = self._get_fingerprint()
+                if fingerprint == self.fingerprint:
+                    return False
+
             latest_version: str = self._get_latest_version()
             if latest_version != self.version:
                 message: str = f"Current version: ({self.version}), Latest version: ({latest_version}), Reloading .."
                 logger.info(message)
-                EndpointManager._stop()
-                self.version: str = latest_version
-                self._launch()
+                if self.params.reload_strategy == ReloadStrategyType.BLUE_GREEN:
+                    self._swap(version=latest_version, model_uri=self._stage(version=latest_version))
+                else:
+                    # When prefetching, the new version is staged while the running process keeps serving.
+                    model_uri: Optional[str] = self._stage(version=latest_version) if self.params.prefetch else None
+                    self._restart(version=latest_version, model_uri=model_uri)
+                reloaded = True
+                EndpointManager.RELOADS.inc(
+                    model=self.name, strategy=ReloadStrategyType(self.params.reload_strategy).value
+                )
+
+            # Only recorded once the check (and any reload) succeeded so a failure is retried.
+            self.fingerprint = fingerprint
+        return reloaded
+
+    def _get_fingerprint(self) -> tuple:
+        """
+        Gets the state of the registered model.  This changes when a version is registered, transitioned or aliased.
+
+        Returns
+        -------
+        fingerprint: tuple
+            The last updated timestamp and aliases of the registered model.
+        """
+
+        try:
+            model: RegisteredModel = self.client.get_registered_model(name=self.metadata.registry)
+        except MlflowException as error:
+            message: str = f"Unable to find registered model: ({self.metadata.registry}), {str(error)}"
+            raise ADSPMLFlowPluginError(message) from error
+        return model.last_updated_timestamp, tuple(sorted((model.aliases or {}).items()))
+
+    def _stage(self, version: str) -> str:
+        """
+        Stages a model version for launch.  The version is resolved against (or downloaded into) the model cache, and
+        when prefetching its environment is prepared ahead of the launch.
+
+        Parameters
+        ----------
+        version: str
+            The model version to stage.
+
+        Returns
+        -------
+        model_uri: str
+            The model URI to launch `mlflow serve` with.
+        """
+
+        try:
+            source: str = self.client.get_model_version(name=self.metadata.registry, version=version).source
+        except MlflowException as error:
+            message: str = f"Unable to find model version: ({self.metadata.registry}/{version}), {str(error)}"
+            raise ADSPMLFlowPluginError(message) from error
+
+        model_path: str = self.cache.resolve(
+            registry=self.metadata.registry,
+            version=version,
+            source=source,
+            download=lambda path: mlflow.artifacts.download_artifacts(
+                artifact_uri=f"models:/{self.metadata.registry}/{version}", dst_path=path
+            ),
+            pinned={self.model_uri},
+        )
+
+        if self.params.prefetch and self.params.env_manager != "local":
+            logger.info("Preparing model environment ..")
+            process_launch_wait(
+                cwd=".",
+                shell_out_cmd=(
+                    "mlflow models prepare-env " f"--env-manager {self.params.env_manager} " f"--model-uri {model_path}"
+                ),
+            )
+
+        return model_path
+
+    def _warm_up(self) -> None:
+        """Sends the configured warm-up requests to the launched `mlflow serve` process."""
+
+        if self.params.warm_up_requests < 1:
+            return
+
+        payload_path: Optional[str] = self.params.warm_up_payload
+        if payload_path is None:
+            payload_path = os.path.join(self.model_uri, "serving_input_example.json")
+        if not os.path.isfile(payload_path):
+            message: str = f"Warm-up payload not found: ({payload_path}), skipping warm-up .."
+            logger.warning(message)
+            return
+
+        with open(payload_path, "rb") as payload_file:
+            payload: bytes = payload_file.read()
+
+        invocations_endpoint_url: str = f"http://{self.host}:{self.port}/invocations"
+        for _ in range(self.params.warm_up_requests):
+            try:
+                response: Response = requests.post(
+                    url=invocations_endpoint_url,
+                    data=payload,
+                    headers={"Content-Type": "application/json"},
+                    timeout=self.params.warm_up_timeout,
+                )
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as error:
+                # A slow (or refused) warm-up does not make the (healthy) process unusable.
+                message: str = f"Warm-up request failed: {error}"
+                logger.warning(message)
+                return
+            if response.status_code != 200:
+                message: str = f"Warm-up request failed with status ({response.status_code}): {response.text}"
+                logger.warning(message)
+                return
+        logger.info("Warm-up complete")
+
+    def _swap(self, version: str, model_uri: str) -> None:
+        """
+        Blue-green replacement of the `mlflow serve` process.
+        The new process is launched on the standby internal port and only once it is healthy is traffic switched
+        over, and the previous process drained and stopped.
+
+        Parameters
+        ----------
+        version: str
+            The model version being launched.
+        model_uri: str
+            The model URI to launch the version with.
+        """
+
+        previous_process: Optional[subprocess.Popen] = self.process
+        previous_port: int = self.port
+        previous_model_uri: str = self.model_uri
+        previous_version: Optional[str] = self.version
+
+        self.port = self._standby_port()
+        self.model_uri = model_uri
+        self.version = version
+        try:
+            self._launch()
+        except Exception as error:
+            # The previous process is left serving traffic.
+            self.port = previous_port
+            self.process = previous_process
+            self.model_uri = previous_model_uri
+            self.version = previous_version
+            self._release(model_uri=model_uri)
+            raise error
+
+        if not self.proxy.drain(backend_port=previous_port, timeout=self.params.drain_timeout):
+            message: str = f"Timed out draining connections to port ({previous_port}), stopping anyway .."
+            logger.warning(message)
+        if previous_process:
+            EndpointManager._stop(processes=[previous_process])
+        self._release(model_uri=previous_model_uri)
+
+    def _restart(self, version: str, model_uri: Optional[str] = None) -> None:
+        """
+        Rolling replacement of the `mlflow serve` process.
+        New requests are held (when proxied) while in-flight requests drain, then the previous process is stopped and
+        the new version launched in its place.  If the new version fails to stage or launch, the previous version is
+        relaunched and routed to again.
+
+        Parameters
+        ----------
+        version: str
+            The model version being launched.
+        model_uri: Optional[str] = None
+            The model URI to launch the version with.  If unset the version is staged once the process is stopped.
+        """
+
+        previous_model_uri: str = self.model_uri
+        previous_version: Optional[str] = self.version
+
+        if self.proxy:
+            # Hold new requests, and let in-flight requests complete before stopping the process.
+            self.proxy.switch(backend_port=None, route=self.route)
+            self.proxy.drain(backend_port=self.port, timeout=self.params.drain_timeout)
+        EndpointManager._stop(processes=[self.process] if self.process else [])
+        self.process = None
+
+        try:
+            self.model_uri = model_uri if model_uri is not None else self._stage(version=version)
+            self.version = version
+            self._launch()
+        except Exception as error:
+            # The previous version stays current (so the reload is retried), and serves traffic until then.
+            failed_model_uri: str = self.model_uri
+            self.model_uri = previous_model_uri
+            self.version = previous_version
+            self._release(model_uri=failed_model_uri)
+            message: str = f"Failed to launch version ({version}), relaunching version ({previous_version}) .."
+            logger.error(message)
+            self._launch()
+            raise error
+        self._release(model_uri=previous_model_uri)
+
+    def _release(self, model_uri: Optional[str]) -> None:
+        """Releases the model cache lease of a model URI which is no longer served (unless it is being served)."""
+
+        if self.cache and model_uri and model_uri != self.model_uri:
+            self.cache.release(path=model_uri)
+
+    def _standby_port(self) -> int:
+        """
+        Gets the internal port which is not in use by the active process.
+
+        Returns
+        -------
+        port: int
+            The standby port.
+        """
+
+        if self.port == self.params.internal_port:
+            return self.params.internal_port + 1
+        return self.params.internal_port
 
     @staticmethod
-    def _stop() -> None:
-        """Stops the `mlflow serve` process and children."""
+    def _stop(processes: Optional[list[subprocess.Popen]] = None) -> None:
+        """
+        Stops `mlflow serve` processes and children.
+
+        Parameters
+        ----------
+        processes: Optional[list[subprocess.Popen]] = None
+            The processes to stop.  All managed processes are stopped if not provided.
+        """
+
+        if processes is None:
+            processes = EndpointManager.SUBPROCESSES
 
-        for process in EndpointManager.SUBPROCESSES:
+        for process in processes:
             try:
                 app_subprocess = psutil.Process(pid=process.pid)
                 children = app_subprocess.children(recursive=True)
@@ -211,7 +616,10 @@ class EndpointManager:
             except psutil.NoSuchProcess:
                 # Allow for the cases where the subprocess died, or never started up.
                 pass
-        EndpointManager.SUBPROCESSES = []
+        with EndpointManager.SUBPROCESSES_LOCK:
+            EndpointManager.SUBPROCESSES = [
+                process for process in EndpointManager.SUBPROCESSES if process not in processes
+            ]
 
     def _get_latest_version(self) -> str:
         """
@@ -223,6 +631,11 @@ class EndpointManager:
             The model version.
         """
 
+        if self.watcher:
+            version: Optional[str] = self.watcher.get_version(metadata=self.metadata)
+            if version is not None:
+                return version
+
         if self.metadata.type == ReloadableModelUriType.STAGE:
             # Then attempt to load
             return self._get_version_by_stage()
@@ -244,15 +657,19 @@ class EndpointManager:
             The registered model version.
         """
 
-        try:
-            models: list[ModelVersion] = self.client.get_latest_versions(
-                name=self.metadata.registry, stages=[self.metadata.name]
-            )
-            assert len(models) == 1
-            return models[0].version
-        except (MlflowException, AssertionError) as error:
-            message: str = f"Unable to find model: ({self.params.model_uri}), {str(error)}"
-            raise ADSPMLFlowPluginError(message) from error
+        with EndpointManager.REGISTRY_LOOKUP_DURATION.time(
+            model=self.name, designation="stage", outcome="success"
+        ) as labels:
+            try:
+                models: list[ModelVersion] = self.client.get_latest_versions(
+                    name=self.metadata.registry, stages=[self.metadata.name]
+                )
+                assert len(models) == 1
+                return models[0].version
+            except (MlflowException, AssertionError) as error:
+                labels["outcome"] = "failure"
+                message: str = f"Unable to find model: ({self.params.model_uri}), {str(error)}"
+                raise ADSPMLFlowPluginError(message) from error
 
     def _get_version_by_alias(self) -> str:
         """
@@ -264,11 +681,17 @@ class EndpointManager:
             The registered model version.
         """
 
-        try:
-            return self.client.get_model_version_by_alias(name=self.metadata.registry, alias=self.metadata.name).version
-        except MlflowException as error:
-            message: str = f"Unable to find model: ({self.params.model_uri}), {str(error)}"
-            raise ADSPMLFlowPluginError(message) from error
+        with EndpointManager.REGISTRY_LOOKUP_DURATION.time(
+            model=self.name, designation="alias", outcome="success"
+        ) as labels:
+            try:
+                return self.client.get_model_version_by_alias(
+                    name=self.metadata.registry, alias=self.metadata.name
+                ).version
+            except MlflowException as error:
+                labels["outcome"] = "failure"
+                message: str = f"Unable to find model: ({self.params.model_uri}), {str(error)}"
+                raise ADSPMLFlowPluginError(message) from error
 
     @staticmethod
     def _exponential_backoff(attempt: int) -> float:
@@ -291,7 +714,7 @@ class EndpointManager:
     @staticmethod
     def serve(params: EndpointManagerParameters) -> None:
         """
-        Serves the designation marked model for REST API consumption.
+        Serves the designation marked model (or models) for REST API consumption.
         Reloads the model if changed.
 
         Parameters
@@ -300,37 +723,222 @@ class EndpointManager:
             Endpoint Manager Parameters DTO
         """
 
+        routes: Optional[dict[str, str]] = EndpointManager._get_routes(params=params) if params.model_uris else None
+
+        if params.metrics_port:
+            MetricsServer(registry=EndpointManager.METRICS, host=params.metrics_host, port=params.metrics_port).start()
+
+        listener: Optional[WebhookListener] = None
+        if params.change_detection == ChangeDetectionType.WEBHOOK:
+            listener = WebhookListener(host=params.webhook_host, port=params.webhook_port, token=params.webhook_token)
+            listener.start()
+
+        watcher: Optional[RegistryWatcher] = None
+        if params.change_detection == ChangeDetectionType.SHARED:
+            watcher = RegistryWatcher(client=MlflowClient(), interval=params.heart_beat)
+            watcher.start()
+
+        # The proxy holds the public port across manager restarts.
+        proxy: Optional[EndpointProxy] = None
+        if routes or params.enable_proxy or params.reload_strategy == ReloadStrategyType.BLUE_GREEN:
+            proxy = EndpointProxy(
+                host=params.host,
+                port=params.port,
+                backend_host=params.internal_host,
+                hold_timeout=params.hold_timeout,
+                routes=list(routes) if routes else None,
+            )
+            proxy.start()
+
+        if not routes:
+            EndpointManager._serve_model(params=params, proxy=proxy, listener=listener, watcher=watcher)
+            return
+
+        # Each model is managed (and reloaded) independently, on its own pair of internal ports.
+        workers: list[threading.Thread] = []
+        for index, (route, model_uri) in enumerate(routes.items()):
+            model_params: EndpointManagerParameters = params.model_copy(
+                update={"model_uri": model_uri, "internal_port": params.internal_port + 2 * index}
+            )
+            worker = threading.Thread(
+                target=EndpointManager._serve_model,
+                kwargs={
+                    "params": model_params,
+                    "proxy": proxy,
+                    "route": route,
+                    "listener": listener,
+                    "watcher": watcher,
+                },
+                name=f"mlflow-adsp-serve-{route}",
+                daemon=True,
+            )
+            worker.start()
+            workers.append(worker)
+
+        try:
+            for worker in workers:
+                worker.join()
+        finally:
+            EndpointManager._stop()
+
+    @staticmethod
+    def _serve_model(
+        params: EndpointManagerParameters,
+        proxy: Optional[EndpointProxy] = None,
+        route: Optional[str] = None,
+        listener: Optional[WebhookListener] = None,
+        watcher: Optional[RegistryWatcher] = None,
+    ) -> None:
+        """
+        Serves a single model, restarting its manager on failure.
+
+        Parameters
+        ----------
+        params: EndpointManagerParameters
+            Endpoint Manager Parameters DTO
+        proxy: Optional[EndpointProxy] = None
+            The proxy fronting the model.
+        route: Optional[str] = None
+            The proxy route of the model when serving several models.
+        listener: Optional[WebhookListener] = None
+            The webhook listener when using `webhook` change detection.
+        watcher: Optional[RegistryWatcher] = None
+            The shared registry watcher when using `shared` change detection.
+        """
+
+        name: str = EndpointManager._get_name(params=params, route=route)
         start_attempts: int = 0
+        started: bool = False
+        detector: ChangeDetector = EndpointManager._get_change_detector(
+            params=params, listener=listener, watcher=watcher
+        )
 
-        # pylint: disable=broad-exception-caught
         while True:
             manager: Optional[EndpointManager] = None
             try:
                 logger.info("Starting ..")
+                if started:
+                    EndpointManager.CHILD_RESTARTS.inc(model=name)
+                started = True
                 load_ae5_user_secrets()
-                manager = EndpointManager(client=MlflowClient(), params=params)
+                manager = EndpointManager(
+                    client=MlflowClient(), params=params, proxy=proxy, route=route, watcher=watcher
+                )
                 logger.info("Startup complete")
                 start_attempts = 0
 
                 if manager.metadata.reloadable:
                     logger.info("Watching for version changes ..")
                     while True:
-                        EndpointManager._replace(manager=manager)
-                        time.sleep(params.heart_beat)
+                        detector.record(changed=EndpointManager._replace(manager=manager))
+                        detector.wait()
                 else:
                     # https://docs.python.org/3/library/signal.html#signal.pause
                     signal.pause()
 
-            except Exception as error:
+            except Exception as error:  # pylint: disable=broad-exception-caught
                 start_attempts = EndpointManager._exception_handler(error=error, attempt=start_attempts)
             finally:
                 logger.info("Stopping ..")
-                if manager:
-                    EndpointManager._stop()
+                if proxy:
+                    proxy.switch(backend_port=None, route=route)
+                if manager and manager.process:
+                    EndpointManager._stop(processes=[manager.process])
+                if manager and manager.cache:
+                    manager.cache.stop()
+
+    @staticmethod
+    def _get_name(params: EndpointManagerParameters, route: Optional[str] = None) -> str:
+        """
+        Gets the name of a model in logs and metrics.
+
+        Parameters
+        ----------
+        params: EndpointManagerParameters
+            Endpoint Manager Parameters DTO
+        route: Optional[str] = None
+            The proxy route of the model when serving several models.
+
+        Returns
+        -------
+        name: str
+            The route, registered model name, or model URI.
+        """
+
+        return route or TargetMetadata(model_uri=params.model_uri).registry or params.model_uri
 
-    # pylint: disable=broad-exception-caught
     @staticmethod
-    def _replace(manager: EndpointManager) -> None:
+    def _get_change_detector(
+        params: EndpointManagerParameters,
+        listener: Optional[WebhookListener] = None,
+        watcher: Optional[RegistryWatcher] = None,
+    ) -> ChangeDetector:
+        """
+        Gets the change detector which schedules the version checks of a model.
+
+        Parameters
+        ----------
+        params: EndpointManagerParameters
+            Endpoint Manager Parameters DTO
+        listener: Optional[WebhookListener] = None
+            The webhook listener when using `webhook` change detection.
+        watcher: Optional[RegistryWatcher] = None
+            The shared registry watcher when using `shared` change detection.
+
+        Returns
+        -------
+        detector: ChangeDetector
+            The change detector.
+        """
+
+        if params.change_detection == ChangeDetectionType.ADAPTIVE:
+            return AdaptiveChangeDetector(min_interval=params.heart_beat, max_interval=params.max_heart_beat)
+        metadata: TargetMetadata = TargetMetadata(model_uri=params.model_uri)
+        if metadata.reloadable:
+            if params.change_detection == ChangeDetectionType.WEBHOOK and listener:
+                return WebhookChangeDetector(
+                    listener=listener, registry=metadata.registry, interval=params.max_heart_beat
+                )
+            if params.change_detection == ChangeDetectionType.SHARED and watcher:
+                return SharedChangeDetector(watcher=watcher, metadata=metadata, interval=params.max_heart_beat)
+        return ChangeDetector(interval=params.heart_beat)
+
+    @staticmethod
+    def _get_routes(params: EndpointManagerParameters) -> dict[str, str]:
+        """
+        Gets the proxy route name of each model URI.
+
+        Parameters
+        ----------
+        params: EndpointManagerParameters
+            Endpoint Manager Parameters DTO
+
+        Returns
+        -------
+        routes: dict[str, str]
+            The model URIs keyed by route name.
+        """
+
+        routes: dict[str, str] = {}
+        for model_uri in params.model_uris:
+            route, separator, uri = model_uri.partition("=")
+            if not separator or "/" in route:
+                # Then no route name was provided, default to the registered model name.
+                uri = model_uri
+                match: Optional[re.Match] = re.match(r"^models:/([\w.-]+)", uri)
+                if not match:
+                    message: str = f"Unable to determine route name for model URI ({uri}), use <name>=<model URI>"
+                    raise ADSPMLFlowPluginError(message)
+                route = match.group(1)
+
+            if route in routes:
+                message: str = f"Duplicate route name ({route}) for model URI ({uri})"
+                raise ADSPMLFlowPluginError(message)
+            routes[route] = uri
+        return routes
+
+    @staticmethod
+    def _replace(manager: EndpointManager) -> bool:
         """
         Endpoint Replacement Workflow
         This method is responsible for restarting the `mlflow serve` managed model.
@@ -339,16 +947,19 @@ class EndpointManager:
         ----------
         manager: EndpointManager
             An instance endpoint manager.
+
+        Returns
+        -------
+        reloaded: bool
+            Whether a new model version was launched.
         """
 
-        complete: bool = False
         update_attempts: int = 0
-        while not complete:
+        while True:
             try:
                 load_ae5_user_secrets()
-                manager.update()
-                complete = True
-            except Exception as error:
+                return manager.update()
+            except Exception as error:  # pylint: disable=broad-exception-caught
                 update_attempts = EndpointManager._exception_handler(error=error, attempt=update_attempts)
 
     @staticmethod
@@ -375,6 +986,7 @@ class EndpointManager:
 
         attempt += 1
         logger.error(str(error))
+        EndpointManager.RETRIES.inc(error=type(error).__name__)
 
         delay: float = EndpointManager._exponential_backoff(attempt=attempt)
         message: str = f"Retrying, attempt {attempt}, pausing for {delay} seconds .."
@@ -0,0 +1,120 @@
+"""
+This module holds the HTTP Service definition, the base of the small HTTP servers run alongside the endpoint.
+"""
+
+from __future__ import annotations
+
+import abc
+import logging
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from ..contracts.errors.plugin import ADSPMLFlowPluginError
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPService(abc.ABC):
+    """
+    The HTTPService is the base of the small HTTP servers (e.g. metrics, webhooks) which are served on a background
+    thread alongside the endpoint.  Sub-classes declare the HTTP methods they serve and handle each request.
+
+    Attributes
+    ----------
+    host: str
+        Host to bind the service to.
+    port: int
+        Port to bind the service to.
+    """
+
+    # The name of the service in logs and errors.
+    NAME: str = "HTTP service"
+    # The name of the thread serving requests.
+    THREAD_NAME: str = "mlflow-adsp-http"
+    # The HTTP methods served, others are answered with `501 Not Implemented`.
+    METHODS: tuple[str, ...] = ("GET",)
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @abc.abstractmethod
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        """
+        Handles a request, sending the response.
+
+        Parameters
+        ----------
+        request: BaseHTTPRequestHandler
+            The request (handler) to respond to.
+        """
+
+    def start(self) -> None:
+        """Binds the service and serves requests on a background thread."""
+
+        service: HTTPService = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """HTTP Service Request Handler"""
+
+            def dispatch(self) -> None:
+                """Hands a request to the service."""
+
+                if self.command not in service.METHODS:
+                    self.send_error(HTTPStatus.NOT_IMPLEMENTED)
+                    return
+                service.handle(request=self)
+
+            do_GET = do_POST = dispatch
+
+            def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+                logger.debug(format, *args)
+
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as error:
+            message: str = f"Failed to start {self.NAME}: {str(error)}"
+            raise ADSPMLFlowPluginError(message) from error
+
+        threading.Thread(target=self._server.serve_forever, name=self.THREAD_NAME, daemon=True).start()
+        message: str = f"{self.NAME.capitalize()} listening on {self.host}:{self.port}"
+        logger.info(message)
+
+    def stop(self) -> None:
+        """Stops the service."""
+
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @staticmethod
+    def respond(
+        request: BaseHTTPRequestHandler, status: HTTPStatus, body: bytes = b"", content_type: Optional[str] = None
+    ) -> None:
+        """
+        Sends a complete response.
+
+        Parameters
+        ----------
+        request: BaseHTTPRequestHandler
+            The request (handler) to respond to.
+        status: HTTPStatus
+            The response status.
+        body: bytes = b""
+            The response body.
+        content_type: Optional[str] = None
+            The content type of the body.
+        """
+
+        request.send_response(status)
+        if content_type:
+            request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        if body:
+            request.wfile.write(body)
@@ -0,0 +1,46 @@
+"""
+This module holds the Metrics Server definition used for exposing endpoint metrics to Prometheus.
+"""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+
+from ..common.metrics import MetricsRegistry
+from .http_service import HTTPService
+
+
+class MetricsServer(HTTPService):
+    """
+    The MetricsServer is a small HTTP server which exposes a metrics registry on `/metrics` in the Prometheus text
+    exposition format.  It listens on a side port so scrapes never compete with (or are routed to) model traffic.
+
+    Attributes
+    ----------
+    registry: MetricsRegistry
+        The metrics to expose.
+    host: str
+        Host to bind the server to.
+    port: int
+        Port to bind the server to.
+    """
+
+    NAME: str = "metrics server"
+    THREAD_NAME: str = "mlflow-adsp-metrics"
+    METHODS: tuple[str, ...] = ("GET",)
+    CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, registry: MetricsRegistry, host: str, port: int):
+        super().__init__(host=host, port=port)
+        self.registry = registry
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        """Handles a scrape."""
+
+        if request.path.split("?", 1)[0] != "/metrics":
+            HTTPService.respond(request=request, status=HTTPStatus.NOT_FOUND)
+            return
+
+        body: bytes = self.registry.render().encode("utf-8")
+        HTTPService.respond(request=request, status=HTTPStatus.OK, body=body, content_type=MetricsServer.CONTENT_TYPE)
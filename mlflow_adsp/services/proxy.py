@@ -0,0 +1,548 @@
+"""
+This module holds the Endpoint Proxy definition used for fronting the `mlflow serve` processes on the public port.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from http import HTTPStatus
+from typing import AsyncIterator, Optional
+
+from ..contracts.errors.plugin import ADSPMLFlowPluginError
+
+logger = logging.getLogger(__name__)
+
+# Errors which indicate a broken (or closed) connection on either side of the proxy.
+CONNECTION_ERRORS = (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError)
+
+# Methods which can safely be sent to the backend again if the first attempt may have reached it.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE", "PUT", "DELETE"})
+
+
+class NoResponseError(ConnectionResetError):
+    """Raised when a backend connection fails before any of the response is received."""
+
+
+# The routing configuration, and the state owned by the event loop thread, are deliberately kept flat on the proxy.
+# pylint: disable=too-many-instance-attributes
+class EndpointProxy:
+    """
+    The EndpointProxy is a lightweight HTTP/1.1 reverse proxy which listens on the public host and port and forwards
+    requests to the active `mlflow serve` process.
+
+    The proxy runs its own event loop on a background thread.  Connections to the backend are kept alive and pooled
+    where the backend allows it.  While no backend is routable (during a restart) requests are held for up to
+    `hold_timeout` seconds before being answered with a 503.  A request which fails before any response is received
+    is retried once, on a new connection, if it was never sent (the backend connection could not be opened), was sent
+    on a pooled connection the backend had already closed (e.g. after an idle timeout), or its method is idempotent.
+    Otherwise a request which may have reached the model (e.g. a POST to `/invocations`) is never run twice.
+    Switching the backend only affects new requests, requests already in flight complete against the previous backend
+    and can be waited on with `drain`.
+
+    When `routes` are provided several models are served side by side: the first path segment selects the route (and
+    is stripped before forwarding), e.g. `/<route>/invocations`.  Each route is switched, held and drained
+    independently, and requests for an unknown route are answered with a 404.
+
+    Attributes
+    ----------
+    host: str
+        Host to bind the proxy to.
+    port: int
+        Port to bind the proxy to.
+    backend_host: str
+        Host the `mlflow serve` processes are bound to.
+    hold_timeout: float = 30
+        The maximum time (in seconds) to hold a request while no backend is routable.
+    routes: Optional[list[str]] = None
+        The route names when serving several models, `None` to forward every request to a single backend.
+    backends: dict[Optional[str], Optional[int]]
+        Port of the active `mlflow serve` process keyed by route (`None` without routes).  Requests are held while
+        unset.
+    """
+
+    CHUNK_SIZE: int = 65536
+    POOL_SIZE: int = 16
+
+    def __init__(
+        self, host: str, port: int, backend_host: str, hold_timeout: float = 30, routes: Optional[list[str]] = None
+    ):
+        self.host = host
+        self.port = port
+        self.backend_host = backend_host
+        self.hold_timeout = hold_timeout
+        self.routes = routes
+        self.backends: dict[Optional[str], Optional[int]] = {route: None for route in routes or [None]}
+
+        # In-flight request counts and idle backend connections keyed by backend port.
+        # These are only mutated on the event loop thread.
+        self._inflight: dict[int, int] = {}
+        self._pool: dict[int, list[tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._routable: Optional[asyncio.Condition] = None
+        self._thread: Optional[threading.Thread] = None
+        self._started: threading.Event = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    def start(self) -> None:
+        """Starts the proxy event loop and blocks until the listening socket is bound."""
+
+        self._thread = threading.Thread(target=self._run, name="mlflow-adsp-proxy", daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+        if self._error:
+            message: str = f"Failed to start endpoint proxy: {str(self._error)}"
+            raise ADSPMLFlowPluginError(message) from self._error
+
+        message: str = f"Endpoint proxy listening on {self.host}:{self.port}"
+        logger.info(message)
+
+    def stop(self) -> None:
+        """Stops the proxy event loop, closing the listening socket and any open connections."""
+
+        if self._loop and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def switch(self, backend_port: Optional[int], route: Optional[str] = None) -> None:
+        """
+        Routes new requests to the provided backend port.
+
+        Parameters
+        ----------
+        backend_port: Optional[int]
+            The port of the `mlflow serve` process to route to.  If `None` new requests are held.
+        route: Optional[str] = None
+            The route to switch, `None` without routes.
+        """
+
+        if route not in self.backends:
+            message: str = f"Unknown proxy route: {route}"
+            raise ADSPMLFlowPluginError(message)
+
+        target: str = f" for route ({route})" if route else ""
+        if backend_port is None:
+            message: str = f"Holding traffic{target} .."
+        else:
+            message: str = f"Routing traffic{target} to backend port ({backend_port})"
+        logger.info(message)
+
+        self.backends[route] = backend_port
+        if self._loop and not self._loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._notify_routable(), self._loop)
+
+    def drain(self, backend_port: int, timeout: float) -> bool:
+        """
+        Waits for the in-flight requests to a backend to complete, then closes its pooled connections.
+
+        Parameters
+        ----------
+        backend_port: int
+            The port of the `mlflow serve` process to drain.
+        timeout: float
+            The maximum time (in seconds) to wait.
+
+        Returns
+        -------
+        drained: bool
+            `True` if all requests completed within the timeout, `False` otherwise.
+        """
+
+        deadline: float = time.monotonic() + timeout
+        drained: bool = True
+        while self._inflight.get(backend_port, 0) > 0:
+            if time.monotonic() >= deadline:
+                drained = False
+                break
+            time.sleep(0.1)
+
+        if self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._close_pool, backend_port)
+        return drained
+
+    def _run(self) -> None:
+        """Event loop thread target."""
+
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._routable = asyncio.Condition()
+
+        try:
+            server: asyncio.AbstractServer = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, host=self.host, port=self.port)
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self._error = error
+            self._started.set()
+            self._loop.close()
+            return
+
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            server.close()
+            for backend_port in list(self._pool):
+                self._close_pool(backend_port)
+            tasks = asyncio.all_tasks(loop=self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.close()
+
+    async def _notify_routable(self) -> None:
+        """Wakes held requests so they can re-check their backend.  Runs on the event loop thread."""
+
+        async with self._routable:
+            self._routable.notify_all()
+
+    def _close_pool(self, backend_port: int) -> None:
+        """Closes the idle connections to a backend.  Runs on the event loop thread."""
+
+        for _, writer in self._pool.pop(backend_port, []):
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serves the requests of a single client connection."""
+
+        try:
+            keep_alive: bool = True
+            while keep_alive:
+                head: Optional[bytes] = await EndpointProxy._read_head(reader=reader)
+                if head is None:
+                    break
+
+                start_line, headers = EndpointProxy._parse_head(head=head)
+                route, head = self._route(head=head, start_line=start_line)
+                if headers.get("expect", "").lower() == "100-continue":
+                    writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                    await writer.drain()
+                body: bytes = b"".join([chunk async for chunk in EndpointProxy._iter_body(reader, headers)])
+
+                if route not in self.backends:
+                    await EndpointProxy._respond(writer=writer, status=HTTPStatus.NOT_FOUND)
+                    break
+
+                keep_alive = await self._forward(
+                    payload=head + body, route=route, start_line=start_line, headers=headers, writer=writer
+                )
+        except CONNECTION_ERRORS as error:
+            message: str = f"Client connection closed: {str(error)}"
+            logger.debug(message)
+        finally:
+            writer.close()
+
+    async def _forward(
+        self,
+        payload: bytes,
+        route: Optional[str],
+        start_line: list[str],
+        headers: dict[str, str],
+        writer: asyncio.StreamWriter,
+    ) -> bool:
+        """
+        Forwards a request to the active backend and relays the response.
+
+        Parameters
+        ----------
+        payload: bytes
+            The raw request (head and body).
+        route: Optional[str]
+            The route of the request.
+        start_line: list[str]
+            The split request line.
+        headers: dict[str, str]
+            The request headers.
+        writer: asyncio.StreamWriter
+            The client stream to relay the response to.
+
+        Returns
+        -------
+        keep_alive: bool
+            Whether the client connection can serve another request.
+        """
+
+        method: str = start_line[0]
+
+        for attempt in range(2):
+            backend_port: Optional[int] = await self._wait_for_backend(route=route)
+            if backend_port is None:
+                await EndpointProxy._respond(writer=writer, status=HTTPStatus.SERVICE_UNAVAILABLE)
+                return False
+
+            self._inflight[backend_port] = self._inflight.get(backend_port, 0) + 1
+            try:
+                # Retries always use a new connection.
+                connection: Optional[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = (
+                    self._take_idle(backend_port=backend_port) if attempt == 0 else None
+                )
+                reused: bool = connection is not None
+                try:
+                    if connection is None:
+                        connection = await asyncio.open_connection(host=self.backend_host, port=backend_port)
+                    response_head: bytes = await EndpointProxy._exchange(connection=connection, payload=payload)
+                except CONNECTION_ERRORS as error:
+                    message: str = f"Request to backend port ({backend_port}) failed: {str(error)}"
+                    logger.warning(message)
+                    # Only retry requests which were never sent, which the backend closed a pooled connection on
+                    # without answering, or which are safe to send twice.
+                    if attempt == 0 and (
+                        connection is None
+                        or (reused and isinstance(error, NoResponseError))
+                        or method in IDEMPOTENT_METHODS
+                    ):
+                        continue
+                    await EndpointProxy._respond(writer=writer, status=HTTPStatus.BAD_GATEWAY)
+                    return False
+
+                reusable: bool = await self._relay(
+                    backend_port=backend_port,
+                    connection=connection,
+                    response_head=response_head,
+                    method=method,
+                    writer=writer,
+                )
+                return reusable and EndpointProxy._keep_alive(
+                    version=start_line[2] if len(start_line) > 2 else "HTTP/1.0", headers=headers
+                )
+            finally:
+                self._inflight[backend_port] -= 1
+
+        return False
+
+    async def _relay(
+        self,
+        backend_port: int,
+        connection: tuple[asyncio.StreamReader, asyncio.StreamWriter],
+        response_head: bytes,
+        method: str,
+        writer: asyncio.StreamWriter,
+    ) -> bool:
+        """
+        Relays a backend response to the client, then returns the backend connection to the pool if it persists.
+
+        Returns
+        -------
+        reusable: bool
+            Whether the backend connection persists after the response.
+        """
+
+        backend_reader, backend_writer = connection
+        status_line, response_headers = EndpointProxy._parse_head(head=response_head)
+        status: int = int(status_line[1])
+        try:
+            writer.write(response_head)
+            delimited: bool = True
+            if method != "HEAD" and status not in (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED):
+                delimited = "transfer-encoding" in response_headers or "content-length" in response_headers
+                async for chunk in EndpointProxy._iter_body(backend_reader, response_headers, until_close=True):
+                    writer.write(chunk)
+                    await writer.drain()
+            await writer.drain()
+        except CONNECTION_ERRORS:
+            backend_writer.close()
+            raise
+
+        reusable: bool = delimited and EndpointProxy._keep_alive(version=status_line[0], headers=response_headers)
+        if reusable and len(self._pool.get(backend_port, [])) < EndpointProxy.POOL_SIZE:
+            self._pool.setdefault(backend_port, []).append(connection)
+        else:
+            backend_writer.close()
+        return reusable
+
+    async def _wait_for_backend(self, route: Optional[str]) -> Optional[int]:
+        """
+        Waits (up to the hold timeout) for a routable backend.
+
+        Returns
+        -------
+        backend_port: Optional[int]
+            The backend port to route to, `None` if none became available.
+        """
+
+        async def routable() -> None:
+            async with self._routable:
+                await self._routable.wait_for(lambda: self.backends[route] is not None)
+
+        if self.backends[route] is None:
+            try:
+                await asyncio.wait_for(routable(), timeout=self.hold_timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self.backends[route]
+
+    def _route(self, head: bytes, start_line: list[str]) -> tuple[Optional[str], bytes]:
+        """
+        Selects the route of a request from the first path segment, and strips it from the request line.
+
+        Returns
+        -------
+        routed: tuple[Optional[str], bytes]
+            The route (`None` without routes), and the request head to forward.
+        """
+
+        if not self.routes or len(start_line) < 2:
+            return None, head
+
+        route, _, path = start_line[1].lstrip("/").partition("/")
+        request_line: str = " ".join([start_line[0], "/" + path, *start_line[2:]])
+        return route, request_line.encode("latin-1") + head[head.index(b"\r\n") :]
+
+    def _take_idle(self, backend_port: int) -> Optional[tuple[asyncio.StreamReader, asyncio.StreamWriter]]:
+        """
+        Takes an idle pooled connection to the backend.
+
+        Returns
+        -------
+        connection: Optional[tuple[asyncio.StreamReader, asyncio.StreamWriter]]
+            The backend connection, `None` if there is no open idle connection.
+        """
+
+        idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = self._pool.get(backend_port, [])
+        while idle:
+            reader, writer = idle.pop()
+            if reader.at_eof() or writer.is_closing():
+                writer.close()
+            else:
+                return reader, writer
+        return None
+
+    @staticmethod
+    async def _exchange(connection: tuple[asyncio.StreamReader, asyncio.StreamWriter], payload: bytes) -> bytes:
+        """
+        Sends the request to the backend and reads the response head.  Interim (1xx) responses are discarded.
+        A failure before any of the response is received is raised as a `NoResponseError`.
+
+        Returns
+        -------
+        response_head: bytes
+            The final response head.
+        """
+
+        reader, writer = connection
+        received: bool = False
+        try:
+            writer.write(payload)
+            await writer.drain()
+            while True:
+                head: Optional[bytes] = await EndpointProxy._read_head(reader=reader)
+                if head is None:
+                    raise ConnectionResetError("Backend closed the connection")
+                received = True
+                status: int = int(EndpointProxy._parse_head(head=head)[0][1])
+                if not HTTPStatus.CONTINUE <= status < HTTPStatus.OK or status == HTTPStatus.SWITCHING_PROTOCOLS:
+                    return head
+        except CONNECTION_ERRORS as error:
+            writer.close()
+            if received or (isinstance(error, asyncio.IncompleteReadError) and error.partial):
+                raise
+            raise NoResponseError(str(error)) from error
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: HTTPStatus) -> None:
+        """Writes an empty response generated by the proxy."""
+
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\nContent-Length: 0\r\nConnection: close\r\n\r\n".encode()
+        )
+        await writer.drain()
+
+    @staticmethod
+    async def _read_head(reader: asyncio.StreamReader) -> Optional[bytes]:
+        """
+        Reads the start line and headers of a message.
+
+        Returns
+        -------
+        head: Optional[bytes]
+            The raw message head, `None` if the connection closed cleanly before a message started.
+        """
+
+        try:
+            return await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as error:
+            if error.partial:
+                raise error
+            return None
+
+    @staticmethod
+    def _parse_head(head: bytes) -> tuple[list[str], dict[str, str]]:
+        """
+        Parses a message head.
+
+        Returns
+        -------
+        parsed: tuple[list[str], dict[str, str]]
+            The split start line, and the headers keyed by lower case name.
+        """
+
+        lines: list[str] = head.decode("latin-1").split("\r\n")
+        headers: dict[str, str] = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        return lines[0].split(" ", 2), headers
+
+    @staticmethod
+    def _keep_alive(version: str, headers: dict[str, str]) -> bool:
+        """Determines if the connection persists after the message."""
+
+        connection: str = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            return "keep-alive" in connection
+        return "close" not in connection
+
+    @staticmethod
+    async def _iter_body(
+        reader: asyncio.StreamReader, headers: dict[str, str], until_close: bool = False
+    ) -> AsyncIterator[bytes]:
+        """
+        Yields the raw (still framed) message body.
+
+        Parameters
+        ----------
+        reader: asyncio.StreamReader
+            The stream to read the body from.
+        headers: dict[str, str]
+            The message headers.
+        until_close: bool = False
+            Without a content length or chunked encoding the body is read until the connection closes if set
+            (responses), and is empty otherwise (requests).
+        """
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            while True:
+                size_line: bytes = await reader.readuntil(b"\r\n")
+                yield size_line
+                size: int = int(size_line.split(b";")[0].strip(), 16)
+                if size == 0:
+                    # Trailers are terminated by an empty line.
+                    while True:
+                        line: bytes = await reader.readuntil(b"\r\n")
+                        yield line
+                        if line == b"\r\n":
+                            return
+                remaining: int = size + 2
+                while remaining > 0:
+                    chunk: bytes = await reader.readexactly(min(remaining, EndpointProxy.CHUNK_SIZE))
+                    remaining -= len(chunk)
+                    yield chunk
+        elif "content-length" in headers:
+            remaining: int = int(headers["content-length"])
+            while remaining > 0:
+                chunk: bytes = await reader.readexactly(min(remaining, EndpointProxy.CHUNK_SIZE))
+                remaining -= len(chunk)
+                yield chunk
+        elif until_close:
+            while True:
+                chunk: bytes = await reader.read(EndpointProxy.CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
@@ -0,0 +1,170 @@
+"""
+This module holds the Registry Watcher definition used for sharing model registry lookups between endpoints.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Optional
+
+from mlflow import MlflowClient
+from mlflow.entities.model_registry import RegisteredModel
+
+from ae5_tools import load_ae5_user_secrets
+
+from ..contracts.dto.target_metadata import TargetMetadata
+from ..contracts.types.reloadable_model_uri_type import ReloadableModelUriType
+
+logger = logging.getLogger(__name__)
+
+
+class RegistryWatcher:
+    """
+    The RegistryWatcher tracks the model versions of every watched (registry, type, name) designation with a single
+    lookup per registered model per interval, and wakes the subscribers of a designation when its version changes.
+
+    Endpoints serving models of the same registered model share the lookup, so the tracking server sees one request
+    per registered model rather than one per endpoint.
+
+    Attributes
+    ----------
+    client: MlflowClient
+        MLflow client
+    interval: float
+        The time (in seconds) between lookups.
+    versions: dict[tuple[str, str, str], str]
+        The last known model version keyed by designation.
+    """
+
+    def __init__(self, client: MlflowClient, interval: float):
+        self.client = client
+        self.interval = interval
+        self.versions: dict[tuple[str, str, str], str] = {}
+
+        self._subscribers: dict[tuple[str, str, str], list[threading.Event]] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._stopped: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts the lookups on a background thread."""
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="mlflow-adsp-registry-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the lookups."""
+
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def subscribe(self, metadata: TargetMetadata) -> threading.Event:
+        """
+        Watches a designation.
+
+        Parameters
+        ----------
+        metadata: TargetMetadata
+            The metadata of the reloadable model.
+
+        Returns
+        -------
+        event: threading.Event
+            Set when the model version of the designation changes.
+        """
+
+        event: threading.Event = threading.Event()
+        with self._lock:
+            self._subscribers.setdefault(RegistryWatcher._get_key(metadata=metadata), []).append(event)
+        return event
+
+    def get_version(self, metadata: TargetMetadata) -> Optional[str]:
+        """
+        Gets the last known model version of a designation.
+
+        Parameters
+        ----------
+        metadata: TargetMetadata
+            The metadata of the reloadable model.
+
+        Returns
+        -------
+        version: Optional[str]
+            The model version, `None` if not (yet) known or the designation is no longer assigned.
+        """
+
+        with self._lock:
+            return self.versions.get(RegistryWatcher._get_key(metadata=metadata))
+
+    def poll(self) -> None:
+        """Looks up each watched registered model once, and wakes the subscribers of changed designations."""
+
+        with self._lock:
+            keys: list[tuple[str, str, str]] = list(self._subscribers)
+
+        registries: dict[str, list[tuple[str, str, str]]] = {}
+        for key in keys:
+            registries.setdefault(key[0], []).append(key)
+
+        for registry, registry_keys in registries.items():
+            try:
+                load_ae5_user_secrets()
+                model: RegisteredModel = self.client.get_registered_model(name=registry)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                # The previous versions are kept, and the remaining registered models are still looked up.
+                message: str = f"Unable to look up registered model: ({registry}), {str(error)}"
+                logger.warning(message)
+                continue
+
+            for key in registry_keys:
+                version: Optional[str] = RegistryWatcher._resolve(model=model, key=key)
+                with self._lock:
+                    if version is None:
+                        # The designation was removed (e.g. its alias was deleted), so its last version is forgotten.
+                        self.versions.pop(key, None)
+                    changed: bool = version is not None and self.versions.get(key) != version
+                    if changed:
+                        self.versions[key] = version
+                    events: list[threading.Event] = list(self._subscribers.get(key, []))
+                if changed:
+                    message: str = f"Version of ({registry}{key[1]}{key[2]}) is now ({version})"
+                    logger.info(message)
+                    for event in events:
+                        event.set()
+
+    def _run(self) -> None:
+        """Lookup thread target."""
+
+        while not self._stopped.wait(timeout=self.interval):
+            self.poll()
+
+    @staticmethod
+    def _get_key(metadata: TargetMetadata) -> tuple[str, str, str]:
+        """Gets the designation key of a reloadable model."""
+
+        return metadata.registry, ReloadableModelUriType(metadata.type).value, metadata.name
+
+    @staticmethod
+    def _resolve(model: RegisteredModel, key: tuple[str, str, str]) -> Optional[str]:
+        """
+        Resolves the model version of a designation from its registered model.
+
+        Returns
+        -------
+        version: Optional[str]
+            The model version, `None` if the designation is not assigned.
+        """
+
+        _, designation_type, name = key
+        if designation_type == ReloadableModelUriType.ALIAS.value:
+            version = (model.aliases or {}).get(name)
+            return str(version) if version is not None else None
+
+        for model_version in model.latest_versions or []:
+            if (model_version.current_stage or "").lower() == name.lower():
+                return str(model_version.version)
+        return None
@@ -0,0 +1,121 @@
+"""
+This module holds the Webhook Listener definition used for receiving model registry events.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from typing import Optional
+
+from .http_service import HTTPService
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookListener(HTTPService):
+    """
+    The WebhookListener is a small HTTP server which receives model registry events (e.g. a stage transition or alias
+    change) and wakes the change detectors subscribed to the registered model.
+
+    Events are POSTed as JSON, the registered model name is read from `data.name`, `name` or `model_name`.  An event
+    without a name wakes every subscriber.
+
+    Attributes
+    ----------
+    host: str
+        Host to bind the listener to.
+    port: int
+        Port to bind the listener to.
+    token: Optional[str] = None
+        If set, events must provide it as a bearer token in the `Authorization` header.
+    """
+
+    NAME: str = "webhook listener"
+    THREAD_NAME: str = "mlflow-adsp-webhook"
+    METHODS: tuple[str, ...] = ("POST",)
+
+    def __init__(self, host: str, port: int, token: Optional[str] = None):
+        super().__init__(host=host, port=port)
+        self.token = token
+
+        self._subscribers: dict[str, list[threading.Event]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        """Handles a registry event."""
+
+        if self.token and request.headers.get("Authorization") != f"Bearer {self.token}":
+            HTTPService.respond(request=request, status=HTTPStatus.UNAUTHORIZED)
+            return
+
+        body: bytes = request.rfile.read(int(request.headers.get("Content-Length", 0)))
+        self.notify(registry=WebhookListener.get_registry(body=body))
+        HTTPService.respond(request=request, status=HTTPStatus.ACCEPTED)
+
+    def subscribe(self, registry: str) -> threading.Event:
+        """
+        Subscribes to the events of a registered model.
+
+        Parameters
+        ----------
+        registry: str
+            The registered model name.
+
+        Returns
+        -------
+        event: threading.Event
+            Set when an event for the registered model is received.
+        """
+
+        event: threading.Event = threading.Event()
+        with self._lock:
+            self._subscribers.setdefault(registry, []).append(event)
+        return event
+
+    def notify(self, registry: Optional[str] = None) -> None:
+        """
+        Wakes the subscribers of a registered model.
+
+        Parameters
+        ----------
+        registry: Optional[str] = None
+            The registered model name.  All subscribers are woken if not provided.
+        """
+
+        message: str = f"Received registry event for ({registry or 'all registered models'})"
+        logger.info(message)
+
+        with self._lock:
+            if registry is None:
+                events: list[threading.Event] = [event for events in self._subscribers.values() for event in events]
+            else:
+                events: list[threading.Event] = list(self._subscribers.get(registry, []))
+        for event in events:
+            event.set()
+
+    @staticmethod
+    def get_registry(body: bytes) -> Optional[str]:
+        """
+        Reads the registered model name from an event.
+
+        Returns
+        -------
+        registry: Optional[str]
+            The registered model name, `None` if the event does not name one.
+        """
+
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return None
+        if not isinstance(payload, dict):
+            return None
+
+        data = payload.get("data")
+        if isinstance(data, dict) and data.get("name"):
+            return data["name"]
+        return payload.get("name") or payload.get("model_name")
@@ -1,20 +1,29 @@
 """ Anaconda Data Science Platform Submitted Run Definition """
 
 import logging
+import random
 import time
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from mlflow.entities import RunStatus
 from mlflow.projects.submitted_run import SubmittedRun
 
 from ae5_tools.api import AEUserSession
 
+from .common.adsp import get_project_id, is_session_rejected, refresh_session
 from .contracts.dto.base_model import BaseModel
 from .contracts.errors.plugin import ADSPMLFlowPluginError
 from .contracts.types.job_run_state import AEProjectJobRunStateType
 
 logger = logging.getLogger(__name__)
 
+# Run states which will not change again.
+TERMINAL_RUN_STATES: Set[str] = {
+    AEProjectJobRunStateType.FAILED,
+    AEProjectJobRunStateType.STOPPED,
+    AEProjectJobRunStateType.COMPLETED,
+}
+
 
 class ADSPSubmittedRun(SubmittedRun, BaseModel):
     """
@@ -31,13 +40,32 @@ class ADSPSubmittedRun(SubmittedRun, BaseModel):
         The Anaconda Data Science Platform Job ID
     response: Dict
         A dictionary response of the job creation request.
+    wait_interval: float = 2
+        The time (in seconds) to wait between the first status checks while waiting on the run.
+    wait_interval_max: float = 60
+        The limit the wait between status checks backs off to.
+    wait_backoff_factor: float = 1.5
+        The multiplier applied to the wait after each status check.
+    wait_timeout: Optional[float] = None
+        The time (in seconds) to wait on the run before giving up.  Waits indefinitely if unset.
+    status_ttl: float = 5
+        The time (in seconds) a run status lookup is reused for.  Once the run has finished it is reused indefinitely.
     """
 
     ae_session: AEUserSession
     mlflow_run_id: str
     adsp_job_id: str
     response: Dict
-    wait_interval: int = 15  # 15 seconds
+    wait_interval: float = 2
+    wait_interval_max: float = 60
+    wait_backoff_factor: float = 1.5
+    wait_timeout: Optional[float] = None
+    status_ttl: float = 5
+
+    # The last job runs response (and when it was received), and the log of the finished run.
+    _runs_status: Optional[List[Dict]] = None
+    _runs_status_time: float = 0.0
+    _log: Optional[str] = None
 
     def get_log(self) -> str:
         """
@@ -49,11 +77,95 @@ class ADSPSubmittedRun(SubmittedRun, BaseModel):
             A string representation of the run output.
         """
 
-        runs_status: List[Dict] = self.ae_session.job_runs(ident=self.adsp_job_id)
-        ADSPSubmittedRun._validate_response(runs_status=runs_status)
+        if self._log is not None:
+            return self._log
+
+        runs_status: List[Dict] = self._get_runs_status()
 
         run_id: str = runs_status[0]["id"]
-        return self.ae_session.run_log(ident=run_id)
+        log: str = self.ae_session.run_log(ident=run_id)
+        if runs_status[0].get("state") in TERMINAL_RUN_STATES:
+            self._log = log
+        return log
+
+    def iter_log(self, offset: int = 0, follow: bool = False, chunk_size: int = 1024 * 1024) -> Iterator[str]:
+        """
+        Iterates over the logs of the job run in chunks, from an offset (so that a caller can resume from what it has
+        already read).
+
+        In follow mode the run is watched until it finishes, yielding new output as it appears.  It is checked on the
+        same schedule as `wait`, returning to `wait_interval` whenever new output is seen.
+
+        Parameters
+        ----------
+        offset: int = 0
+            The number of characters of the log already read.
+        follow: bool = False
+            Controls whether new output is yielded until the run finishes.
+        chunk_size: int = 1048576
+            The maximum number of characters yielded at a time.
+
+        Yields
+        ------
+        chunk: str
+            The next chunk of the log.
+        """
+
+        interval: float = self.wait_interval
+        while True:
+            runs_status: List[Dict] = self._get_runs_status(refresh=follow)
+            finished: bool = runs_status[0].get("state") in TERMINAL_RUN_STATES
+            log: str = self._log if self._log is not None else self.ae_session.run_log(ident=runs_status[0]["id"])
+
+            new_output: bool = len(log) > offset
+            while offset < len(log):
+                yield log[offset : offset + chunk_size]
+                offset = min(offset + chunk_size, len(log))
+            del log
+
+            if finished or not follow:
+                return
+
+            interval = (
+                self.wait_interval if new_output else min(interval * self.wait_backoff_factor, self.wait_interval_max)
+            )
+            time.sleep(interval * random.uniform(0.9, 1.1))
+
+    def _get_runs_status(self, refresh: bool = False) -> List[Dict]:
+        """
+        Gets the job runs of the job, reusing the last response for `status_ttl` seconds (or indefinitely once the
+        run has finished).
+
+        Parameters
+        ----------
+        refresh: bool = False
+            Controls whether a response which is still fresh is requested again (finished runs are never requested).
+
+        Returns
+        -------
+        runs_status: List[Dict]
+            The job runs of the job.
+        """
+
+        if self._runs_status is not None:
+            if self._runs_status[0].get("state") in TERMINAL_RUN_STATES:
+                return self._runs_status
+            if not refresh and time.monotonic() - self._runs_status_time < self.status_ttl:
+                return self._runs_status
+
+        try:
+            runs_status: List[Dict] = self.ae_session.job_runs(ident=self.adsp_job_id)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            if not is_session_rejected(error=error):
+                raise error
+            # The platform rejected the (pooled) session, retry once with a newly connected one.
+            self.ae_session = refresh_session(ae_session=self.ae_session)
+            runs_status = self.ae_session.job_runs(ident=self.adsp_job_id)
+        ADSPSubmittedRun._validate_response(runs_status=runs_status)
+
+        self._runs_status = runs_status
+        self._runs_status_time = time.monotonic()
+        return runs_status
 
     @staticmethod
     def _validate_response(runs_status: List[Dict]) -> None:
@@ -82,8 +194,7 @@ class ADSPSubmittedRun(SubmittedRun, BaseModel):
 
         self._wait_on_job_run()
 
-        runs_status: List[Dict] = self.ae_session.job_runs(ident=self.adsp_job_id)
-        ADSPSubmittedRun._validate_response(runs_status=runs_status)
+        runs_status: List[Dict] = self._get_runs_status()
 
         run_state: str = runs_status[0]["state"]
         if run_state == AEProjectJobRunStateType.COMPLETED:
@@ -91,23 +202,34 @@ class ADSPSubmittedRun(SubmittedRun, BaseModel):
         return False
 
     def _wait_on_job_run(self) -> None:
-        """Blocks while the run is still in active execution."""
+        """
+        Blocks while the run is still in active execution.
+
+        The run is checked on a short interval at first (so that short runs are reported promptly), which backs off
+        up to `wait_interval_max` (so that long runs are not checked needlessly).  Intervals are jittered so that
+        many runs do not poll in lockstep.
+        """
 
-        completed: bool = False
+        interval: float = self.wait_interval
+        deadline: Optional[float] = time.monotonic() + self.wait_timeout if self.wait_timeout is not None else None
 
-        while not completed:
-            runs_status: List[Dict] = self.ae_session.job_runs(ident=self.adsp_job_id)
-            ADSPSubmittedRun._validate_response(runs_status=runs_status)
+        while True:
+            runs_status: List[Dict] = self._get_runs_status(refresh=True)
 
             run_state: str = runs_status[0]["state"]
-            if run_state in [
-                AEProjectJobRunStateType.FAILED,
-                AEProjectJobRunStateType.STOPPED,
-                AEProjectJobRunStateType.COMPLETED,
-            ]:
-                completed = True
-            else:
-                time.sleep(self.wait_interval)
+            if run_state in TERMINAL_RUN_STATES:
+                return
+
+            delay: float = interval * random.uniform(0.9, 1.1)
+            if deadline is not None:
+                remaining: float = deadline - time.monotonic()
+                if remaining <= 0:
+                    message: str = f"Timed out after {self.wait_timeout} seconds waiting on job: ({self.adsp_job_id})"
+                    raise ADSPMLFlowPluginError(message)
+                delay = min(delay, remaining)
+
+            time.sleep(delay)
+            interval = min(interval * self.wait_backoff_factor, self.wait_interval_max)
 
     def get_status(self) -> RunStatus:
         """
@@ -119,10 +241,86 @@ class ADSPSubmittedRun(SubmittedRun, BaseModel):
             Returns an MLFlow run status for the Anaconda Data Science Platform run status.
         """
 
-        runs_status: List[Dict] = self.ae_session.job_runs(ident=self.adsp_job_id)
-        ADSPSubmittedRun._validate_response(runs_status=runs_status)
+        runs_status: List[Dict] = self._get_runs_status()
 
-        run_state: str = runs_status[0]["state"]
+        return ADSPSubmittedRun.to_run_status(run_state=runs_status[0]["state"])
+
+    @staticmethod
+    def get_statuses(ae_session: AEUserSession, adsp_job_ids: List[str]) -> Dict[str, RunStatus]:
+        """
+        Gets the current status of many runs with a single listing request (scoped to the project).
+
+        Parameters
+        ----------
+        ae_session: AEUserSession
+            The session the jobs were created with.
+        adsp_job_ids: List[str]
+            The Anaconda Data Science Platform Job IDs to report on.
+
+        Returns
+        -------
+        statuses: Dict[str, RunStatus]
+            The MLFlow run status keyed by job id.  Jobs without exactly one run in the listing are omitted.
+        """
+
+        wanted: Set[str] = set(adsp_job_ids)
+        job_runs: Dict[str, List[Dict]] = {}
+        # Jobs are created within the project of the runtime context, only its runs are listed.
+        for record in ae_session.run_list(filter=f"project_id={get_project_id()}"):
+            if record.get("job_id") in wanted:
+                job_runs.setdefault(record["job_id"], []).append(record)
+
+        return {
+            job_id: ADSPSubmittedRun.to_run_status(run_state=runs[0]["state"])
+            for job_id, runs in job_runs.items()
+            if len(runs) == 1
+        }
+
+    @staticmethod
+    def get_run_statuses(runs: List["ADSPSubmittedRun"]) -> Dict[str, RunStatus]:
+        """
+        Gets the current status of many runs from a single listing request per session.  A failed listing is logged
+        and its runs are omitted, so that their status can be requested individually instead.
+
+        Parameters
+        ----------
+        runs: List[ADSPSubmittedRun]
+            The runs to report on.
+
+        Returns
+        -------
+        statuses: Dict[str, RunStatus]
+            The MLFlow run status keyed by Anaconda Data Science Platform job id.
+        """
+
+        sessions: Dict[int, Tuple[AEUserSession, List[str]]] = {}
+        for run in runs:
+            sessions.setdefault(id(run.ae_session), (run.ae_session, []))[1].append(run.adsp_job_id)
+
+        statuses: Dict[str, RunStatus] = {}
+        for ae_session, adsp_job_ids in sessions.values():
+            try:
+                statuses.update(ADSPSubmittedRun.get_statuses(ae_session=ae_session, adsp_job_ids=adsp_job_ids))
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                message: str = f"Unable to list job runs, falling back to individual status requests: {str(error)}"
+                logger.warning(message)
+        return statuses
+
+    @staticmethod
+    def to_run_status(run_state: str) -> RunStatus:
+        """
+        Converts an Anaconda Data Science Platform run state into an MLFlow run status.
+
+        Parameters
+        ----------
+        run_state: str
+            The Anaconda Data Science Platform run state.
+
+        Returns
+        -------
+        status: RunStatus
+            The MLFlow run status.
+        """
 
         if run_state == AEProjectJobRunStateType.INITIAL:
             return RunStatus.RUNNING
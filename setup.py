@@ -12,6 +12,7 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "mlflow>=2.3.0",
+        "gitpython",
         "ae5-tools>=0.7,<1.0",
         "psutil",
         "pydantic>=2.0,<3",
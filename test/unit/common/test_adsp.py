@@ -1,10 +1,17 @@
 import os
+import threading
+import time
 import warnings
+from typing import List
+from unittest.mock import MagicMock
 
 import pytest
+import requests
 
+import mlflow_adsp
 from ae5_tools.api import AEUserSession
 from mlflow_adsp import ADSPMLFlowPluginError, create_session, get_project_id
+from mlflow_adsp.common.adsp import clear_sessions, get_session, is_session_rejected, refresh_session
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
@@ -42,6 +49,122 @@ def test_create_session(monkeypatch):
     assert session.password == generated_session.password == os.environ["AE5_PASSWORD"]
 
 
+###############################################################################
+# get_session Tests
+###############################################################################
+
+
+@pytest.fixture(scope="function")
+def mock_create_session(monkeypatch):
+    clear_sessions()
+    mock: MagicMock = MagicMock(side_effect=lambda: MagicMock())
+    monkeypatch.setattr(mlflow_adsp.common.adsp, "_connect_session", mock)
+    yield mock
+    clear_sessions()
+
+
+def test_get_session_is_shared(mock_create_session):
+    # Execute Test
+    sessions: List[AEUserSession] = []
+    threads: List[threading.Thread] = [
+        threading.Thread(target=lambda: sessions.append(get_session())) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Review Test Outcome
+    mock_create_session.assert_called_once_with()
+    assert all(session is sessions[0] for session in sessions)
+
+
+def test_get_session_per_user(monkeypatch, mock_create_session):
+    # Setup Test
+    session: AEUserSession = get_session()
+
+    # Execute Test
+    monkeypatch.setenv("AE5_USERNAME", "another-mock-user")
+    other_session: AEUserSession = get_session()
+
+    # Review Test Outcome
+    assert session is not other_session
+    assert mock_create_session.call_count == 2
+
+
+def test_get_session_loads_secrets_once(monkeypatch, mock_create_session):
+    # Setup Test
+    mock_load_secrets: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.common.adsp, "load_ae5_user_secrets", mock_load_secrets)
+
+    # Execute Test
+    for _ in range(3):
+        get_session()
+
+    # Review Test Outcome
+    mock_load_secrets.assert_called_once_with()
+
+
+def test_get_session_reauthenticates(monkeypatch, mock_create_session):
+    # Setup Test
+    clock: List[float] = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    session: AEUserSession = get_session(max_age=60)
+
+    # Execute Test
+    clock[0] += 59
+    assert get_session(max_age=60) is session
+    clock[0] += 1
+    renewed_session: AEUserSession = get_session(max_age=60)
+
+    # Review Test Outcome
+    # The expired session is swapped for a newly connected one, rather than re-connected while shared.
+    assert renewed_session is not session
+    assert get_session(max_age=60) is renewed_session
+    assert mock_create_session.call_count == 2
+    session._connect.assert_not_called()
+
+
+def test_refresh_session(mock_create_session):
+    # Setup Test
+    session: AEUserSession = get_session()
+
+    # Execute Test
+    renewed_session: AEUserSession = refresh_session(ae_session=session)
+
+    # Review Test Outcome
+    assert renewed_session is not session
+    assert get_session() is renewed_session
+    # A session which was already replaced is not replaced again.
+    assert refresh_session(ae_session=session) is renewed_session
+    assert mock_create_session.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "error, rejected",
+    [
+        (ADSPMLFlowPluginError("Unexpected response: 401 Unauthorized"), True),
+        (ADSPMLFlowPluginError("Unexpected response: 500 Internal Server Error"), False),
+        (requests.HTTPError(response=MagicMock(status_code=401)), True),
+        (requests.HTTPError(response=MagicMock(status_code=404)), False),
+        (ADSPMLFlowPluginError("Boom!"), False),
+    ],
+)
+def test_is_session_rejected(error, rejected):
+    assert is_session_rejected(error=error) == rejected
+
+
+def test_clear_sessions(mock_create_session):
+    # Setup Test
+    session: AEUserSession = get_session()
+
+    # Execute Test
+    clear_sessions()
+
+    # Review Test Outcome
+    assert get_session() is not session
+
+
 ###############################################################################
 # _get_project_id Tests
 ###############################################################################
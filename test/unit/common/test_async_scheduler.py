@@ -0,0 +1,162 @@
+import asyncio
+import threading
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import mlflow
+from mlflow.entities import RunStatus
+from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID
+
+import mlflow_adsp
+from mlflow_adsp import AsyncScheduler, CancellationToken, Job, SchedulerOptions, Step
+
+###############################################################################
+# iter_work_queue_async Tests
+###############################################################################
+
+
+def test_iter_work_queue_async(monkeypatch):
+    # Scenario:
+    # 2 jobs, the second one completes first
+
+    # Set up the test
+    steps: List[Step] = [Step(name="slow"), Step(name="fast")]
+    statuses = {
+        "slow": [RunStatus.RUNNING, RunStatus.RUNNING, RunStatus.FINISHED],
+        "fast": [RunStatus.FINISHED],
+    }
+
+    def mock_execute_step(step: Step):
+        mock_run: MagicMock = MagicMock()
+        mock_run.get_status = MagicMock(side_effect=statuses[step.name])
+        return mock_run
+
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+    options: SchedulerOptions = SchedulerOptions(interval=0)
+
+    async def consume() -> List[str]:
+        ticks: List[int] = []
+
+        async def tick():
+            # Runs alongside the scheduler, which must not block the event loop.
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        ticker = asyncio.create_task(tick())
+        names: List[str] = [
+            job.step.name async for job in AsyncScheduler().iter_work_queue_async(steps=steps, options=options)
+        ]
+        ticker.cancel()
+        assert len(ticks) > 0
+        return names
+
+    # Execute the test
+    names: List[str] = asyncio.run(consume())
+
+    # Review the results
+    assert names == ["fast", "slow"]
+
+
+def test_process_work_queue_async(monkeypatch):
+    # Set up the test
+    steps: List[Step] = [Step(), Step()]
+
+    def mock_execute_step(step: Step):
+        mock_run: MagicMock = MagicMock()
+        mock_run.get_status = MagicMock(return_value=RunStatus.FINISHED)
+        return mock_run
+
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+
+    # Execute the test
+    results: List[Job] = asyncio.run(
+        AsyncScheduler().process_work_queue_async(steps=steps, options=SchedulerOptions(interval=0))
+    )
+
+    # Review the results
+    assert [result.step for result in results] == steps
+    assert all(result.last_status == RunStatus.FINISHED for result in results)
+
+
+def test_iter_work_queue_async_nests_runs_under_active_run_and_releases_jobs(monkeypatch):
+    # Scenario:
+    # 2 jobs launched from the executor while the event loop thread has an active run, completed jobs not retained
+
+    # Set up the test
+    loop_thread: int = threading.get_ident()
+    parent_run: MagicMock = MagicMock()
+    parent_run.info.run_id = "parent-run"
+    # MLFlow tracks the active run per thread.
+    monkeypatch.setattr(mlflow, "active_run", lambda: parent_run if threading.get_ident() == loop_thread else None)
+
+    run_tags: Dict[str, Dict[str, str]] = {}
+
+    def mock_execute_step(step: Step):
+        assert threading.get_ident() != loop_thread
+        run_tags[f"{step.name}-run"] = {}
+        mock_run: MagicMock = MagicMock()
+        mock_run.run_id = f"{step.name}-run"
+        mock_run.get_status = MagicMock(return_value=RunStatus.FINISHED)
+        return mock_run
+
+    mock_client: MagicMock = MagicMock()
+    mock_client.set_tag = MagicMock(side_effect=lambda run_id, key, value: run_tags[run_id].update({key: value}))
+    monkeypatch.setattr(mlflow, "MlflowClient", MagicMock(return_value=mock_client))
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+
+    scheduler: AsyncScheduler = AsyncScheduler()
+    steps: List[Step] = [Step(name="one"), Step(name="two")]
+
+    options: SchedulerOptions = SchedulerOptions(interval=0, retain_jobs=False)
+
+    async def consume() -> List[str]:
+        return [job.step.name async for job in scheduler.iter_work_queue_async(steps=steps, options=options)]
+
+    # Execute the test
+    names: List[str] = asyncio.run(consume())
+
+    # Review the results
+    assert sorted(names) == ["one", "two"]
+    assert run_tags == {
+        "one-run": {MLFLOW_PARENT_RUN_ID: "parent-run"},
+        "two-run": {MLFLOW_PARENT_RUN_ID: "parent-run"},
+    }
+    assert scheduler.jobs == {}
+    assert scheduler.dependents == {}
+
+
+def test_iter_work_queue_async_with_cancellation_token(monkeypatch):
+    # Set up the test
+    token: CancellationToken = CancellationToken()
+    statuses = {"one": [RunStatus.RUNNING, RunStatus.RUNNING]}
+    reported = {name: iter(step_statuses) for name, step_statuses in statuses.items()}
+
+    def mock_execute_step(step: Step):
+        mock_run: MagicMock = MagicMock()
+        mock_run.get_status = MagicMock(side_effect=lambda: next(reported[step.name]))
+        return mock_run
+
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+
+    async def consume() -> List[Job]:
+        async def cancel():
+            await asyncio.sleep(0.05)
+            token.cancel()
+
+        canceller = asyncio.create_task(cancel())
+        results: List[Job] = await AsyncScheduler().process_work_queue_async(
+            steps=[Step(name="one")], options=SchedulerOptions(interval=0.05, exponent=1), cancellation_token=token
+        )
+        await canceller
+        return results
+
+    # Execute the test
+    (result,) = asyncio.run(consume())
+
+    # Review the results
+    assert result.cancelled
+    assert result.last_status == RunStatus.KILLED
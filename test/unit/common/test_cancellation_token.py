@@ -0,0 +1,36 @@
+import time
+from unittest.mock import MagicMock
+
+from mlflow_adsp import CancellationToken
+
+
+def test_cancel():
+    # Set up the test
+    token: CancellationToken = CancellationToken()
+    assert not token.cancelled
+    assert token.reason is None
+
+    # Execute the test
+    token.cancel(reason="first")
+    token.cancel(reason="second")
+
+    # Review the results
+    assert token.cancelled
+    assert token.reason == "first"
+
+
+def test_timeout(monkeypatch):
+    # Set up the test
+    mock_monotonic = MagicMock(return_value=100.0)
+    monkeypatch.setattr(time, "monotonic", mock_monotonic)
+    token: CancellationToken = CancellationToken(timeout=10)
+
+    # Execute the test
+    mock_monotonic.return_value = 109.0
+    assert not token.cancelled
+
+    mock_monotonic.return_value = 110.0
+    assert token.cancelled
+
+    # Review the results
+    assert token.reason == "Wall-clock budget of 10 seconds spent"
@@ -0,0 +1,127 @@
+import os
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+from mlflow.entities import RunStatus
+
+from mlflow_adsp import CachedSubmittedRun, CheckpointStore, Job, Step
+from mlflow_adsp.common.checkpoint_store import CheckpointWriter, from_checkpoint_record, to_checkpoint_record
+from mlflow_adsp.common.work_queue import WorkQueue
+
+
+def test_write_and_read(tmp_path):
+    # Set up the test
+    store: CheckpointStore = CheckpointStore(path=os.path.join(str(tmp_path), "checkpoint.db"))
+
+    # Execute the test
+    store.write(records=[{"id": "one", "state": "todo"}, {"id": "two", "state": "todo"}])
+    store.write(records=[{"id": "two", "state": "complete"}, {"id": "three", "state": "blocked"}])
+
+    # Review the results
+    records: List[Dict] = store.read()
+    assert records == [
+        {"id": "one", "state": "todo"},
+        {"id": "two", "state": "complete"},
+        {"id": "three", "state": "blocked"},
+    ]
+
+
+def test_read_after_reopening(tmp_path):
+    # Set up the test
+    path: str = os.path.join(str(tmp_path), "checkpoint.db")
+    store: CheckpointStore = CheckpointStore(path=path)
+    store.write(records=[{"id": "one", "state": "inprogress"}])
+    store.close()
+
+    # Execute the test
+    records: List[Dict] = CheckpointStore(path=path).read()
+
+    # Review the results
+    assert records == [{"id": "one", "state": "inprogress"}]
+
+
+def test_clear(tmp_path):
+    # Set up the test
+    store: CheckpointStore = CheckpointStore(path=os.path.join(str(tmp_path), "checkpoint.db"))
+    store.write(records=[{"id": "one", "state": "todo"}])
+
+    # Execute the test
+    store.clear()
+
+    # Review the results
+    assert store.read() == []
+
+
+def test_checkpoint_record_round_trip():
+    # Set up the test
+    job: Job = Job(id="one", step=Step(name="one"), blocked_by="zero")
+    job.runs.append(CachedSubmittedRun(mlflow_run_id="cached-run"))
+    job.last_status = RunStatus.FINISHED
+
+    # Execute the test
+    record: Dict = to_checkpoint_record(job=job, state="blocked", waiting_on={"b", "a"})
+    restored: Job = from_checkpoint_record(record=record)
+
+    # Review the results
+    assert record["runs"] == [{"mlflow_run_id": "cached-run", "adsp_job_id": None, "cached": True}]
+    assert record["waiting_on"] == ["a", "b"]
+    assert restored.id == "one"
+    assert restored.step == job.step
+    assert restored.blocked_by == "zero"
+    assert restored.last_status == RunStatus.FINISHED
+    assert restored.runs == [CachedSubmittedRun(mlflow_run_id="cached-run")]
+    assert restored.failed_submissions == 0
+
+
+def test_checkpoint_record_drops_local_runs():
+    # Set up the test
+    local_run: MagicMock = MagicMock()
+    local_run.run_id = "local-run"
+    job: Job = Job(id="one", step=Step(name="one"), failed_submissions=1)
+    job.runs.append(local_run)
+
+    # Execute the test
+    record: Dict = to_checkpoint_record(job=job, state="inprogress", waiting_on=[])
+    restored: Job = from_checkpoint_record(record=record)
+
+    # Review the results
+    assert record["runs"] == [{"mlflow_run_id": "local-run", "adsp_job_id": None, "cached": False}]
+    # Runs which can not be reattached to are dropped, they are not failed submissions.
+    assert restored.runs == []
+    assert restored.failed_submissions == 1
+
+
+def test_checkpoint_writer_restore(tmp_path):
+    # Set up the test
+    store: CheckpointStore = CheckpointStore(path=os.path.join(str(tmp_path), "checkpoint.db"))
+    work_queue: WorkQueue = WorkQueue()
+    work_queue.build(steps=[Step(name="one"), Step(name="two", depends_on=["one"])])
+    one_id, two_id = list(work_queue.jobs.keys())
+    CheckpointWriter(store=store).start(work_queue=work_queue)
+
+    # Execute the test
+    restored: WorkQueue = WorkQueue()
+    CheckpointWriter(store=store).restore(work_queue=restored)
+
+    # Review the results
+    assert list(restored.jobs.keys()) == [one_id, two_id]
+    assert list(restored.todo) == [one_id]
+    assert restored.blocked == {two_id: {one_id}}
+    assert restored.dependents == {one_id: [two_id]}
+    assert [record["state"] for record in store.read()] == ["todo", "blocked"]
+
+
+def test_checkpoint_writer_restores_cached_runs_in_progress(tmp_path):
+    # Set up the test
+    store: CheckpointStore = CheckpointStore(path=os.path.join(str(tmp_path), "checkpoint.db"))
+    job: Job = Job(id="one", step=Step(name="one"), runs=[CachedSubmittedRun(mlflow_run_id="cached-run")])
+    store.write(records=[to_checkpoint_record(job=job, state="inprogress", waiting_on=[])])
+
+    # Execute the test
+    restored: WorkQueue = WorkQueue()
+    CheckpointWriter(store=store).restore(work_queue=restored)
+
+    # Review the results
+    assert list(restored.inprogress) == ["one"]
+    assert len(restored.todo) == 0
+    assert restored.jobs["one"].runs == [CachedSubmittedRun(mlflow_run_id="cached-run")]
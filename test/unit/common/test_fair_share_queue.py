@@ -0,0 +1,105 @@
+from typing import List
+
+import pytest
+
+from mlflow_adsp.common.fair_share_queue import FairShareQueue
+
+
+def drain(queue: FairShareQueue) -> List[str]:
+    return [queue.popleft() for _ in range(len(queue))]
+
+
+def test_fifo():
+    # Set up the test
+    queue: FairShareQueue = FairShareQueue()
+    for item in ["one", "two", "three"]:
+        queue.append(item)
+
+    # Execute the test
+    assert list(queue) == ["one", "two", "three"]
+    items: List[str] = drain(queue)
+
+    # Review the results
+    assert items == ["one", "two", "three"]
+    assert len(queue) == 0
+
+
+def test_priority():
+    # Set up the test
+    queue: FairShareQueue = FairShareQueue()
+    queue.append("low", priority=-1)
+    queue.append("normal")
+    queue.append("high", priority=5, group="other")
+    queue.append("normal_two")
+
+    # Execute the test
+    items: List[str] = drain(queue)
+
+    # Review the results
+    assert items == ["high", "normal", "normal_two", "low"]
+
+
+def test_fair_share():
+    # Set up the test
+    queue: FairShareQueue = FairShareQueue()
+    for index in range(4):
+        queue.append(f"a{index}", group="a")
+    queue.append("b0", group="b")
+    queue.append("b1", group="b")
+
+    # Execute the test
+    items: List[str] = drain(queue)
+
+    # Review the results
+    assert items == ["a0", "b0", "a1", "b1", "a2", "a3"]
+
+
+def test_weighted_fair_share():
+    # Set up the test
+    queue: FairShareQueue = FairShareQueue(weights={"a": 2})
+    for index in range(4):
+        queue.append(f"a{index}", group="a")
+        queue.append(f"b{index}", group="b")
+
+    # Execute the test
+    items: List[str] = drain(queue)[:6]
+
+    # Review the results
+    assert items == ["a0", "b0", "a1", "b1", "a2", "a3"]
+
+
+def test_rejoining_group_gets_no_credit():
+    # Scenario:
+    # Group "b" is idle while "a" is served, it then rejoins the queue
+
+    # Set up the test
+    queue: FairShareQueue = FairShareQueue()
+    queue.append("b0", group="b")
+    assert queue.popleft() == "b0"
+    for index in range(4):
+        queue.append(f"a{index}", group="a")
+    assert [queue.popleft() for _ in range(3)] == ["a0", "a1", "a2"]
+
+    queue.append("b1", group="b")
+    queue.append("b2", group="b")
+    queue.append("a4", group="a")
+
+    # Execute the test
+    items: List[str] = drain(queue)
+
+    # Review the results
+    assert items == ["a3", "b1", "b2", "a4"]
+
+
+def test_clear():
+    # Set up the test
+    queue: FairShareQueue = FairShareQueue()
+    queue.append("one")
+
+    # Execute the test
+    queue.clear()
+
+    # Review the results
+    assert len(queue) == 0
+    with pytest.raises(IndexError):
+        queue.popleft()
@@ -0,0 +1,83 @@
+import gzip
+import os
+
+from mlflow_adsp.common.log_archive import archive_log
+
+
+def test_archive_log(tmp_path):
+    # Set up the test
+    path: str = os.path.join(str(tmp_path), "job_log.txt")
+
+    # Execute the test
+    size, line_count = archive_log(chunks=["one\ntw", "o\nthree"], path=path)
+
+    # Review the results
+    with open(path, "rb") as log_file:
+        assert log_file.read() == b"one\ntwo\nthree"
+    assert size == 13
+    assert line_count == 3
+
+
+def test_archive_log_compressed(tmp_path):
+    # Set up the test
+    path: str = os.path.join(str(tmp_path), "job_log.txt.gz")
+
+    # Execute the test
+    size, line_count = archive_log(chunks=["line\n"] * 1000, path=path, compress=True)
+
+    # Review the results
+    with gzip.open(path, "rb") as log_file:
+        assert log_file.read() == b"line\n" * 1000
+    assert os.path.getsize(path) < size
+    assert (size, line_count) == (5000, 1000)
+
+
+def test_archive_log_size_capped(tmp_path):
+    # Set up the test
+    path: str = os.path.join(str(tmp_path), "job_log.txt")
+
+    # Execute the test
+    size, line_count = archive_log(chunks=["0123", "45678", "9abc", "def\n"], path=path, max_bytes=8)
+
+    # Review the results
+    with open(path, "rb") as log_file:
+        assert log_file.read() == b"0123\n... 9 bytes truncated ...\ndef\n"
+    assert (size, line_count) == (17, 1)
+
+
+def test_archive_log_under_size_cap(tmp_path):
+    # Set up the test
+    path: str = os.path.join(str(tmp_path), "job_log.txt")
+
+    # Execute the test
+    archive_log(chunks=["012", "345"], path=path, max_bytes=8)
+
+    # Review the results
+    with open(path, "rb") as log_file:
+        assert log_file.read() == b"012345"
+
+
+def test_archive_log_size_capped_on_character_boundaries(tmp_path):
+    # Set up the test
+    path: str = os.path.join(str(tmp_path), "job_log.txt")
+
+    # Execute the test
+    size, line_count = archive_log(chunks=["aé", "xyz", "\U0001f600\n"], path=path, max_bytes=4)
+
+    # Review the results
+    with open(path, "rb") as log_file:
+        assert log_file.read().decode(encoding="utf-8") == "a\n... 9 bytes truncated ...\n\n"
+    assert (size, line_count) == (11, 1)
+
+
+def test_archive_log_size_capped_to_a_few_bytes(tmp_path):
+    # Set up the test
+    path: str = os.path.join(str(tmp_path), "job_log.txt")
+
+    # Execute the test
+    size, _ = archive_log(chunks=["€€"], path=path, max_bytes=2)
+
+    # Review the results
+    with open(path, "rb") as log_file:
+        assert log_file.read().decode(encoding="utf-8") == "\n... 6 bytes truncated ...\n"
+    assert size == 6
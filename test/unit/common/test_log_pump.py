@@ -0,0 +1,74 @@
+import logging
+import subprocess
+import sys
+import time
+
+from mlflow_adsp.common.log_pump import LogPump, RateLimiter
+
+
+def launch(script: str) -> subprocess.Popen:
+    return subprocess.Popen(args=[sys.executable, "-c", script], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def test_forwards_lines_with_metadata(caplog):
+    process = launch("import sys; print('hello'); print('oops', file=sys.stderr)")
+    pump = LogPump(process=process, name="registry", version="7")
+
+    with caplog.at_level(logging.INFO, logger="mlflow_adsp.common.log_pump"):
+        pump.start()
+        process.wait()
+        pump.join(timeout=5)
+
+    records = {record.stream: record for record in caplog.records}
+    assert records["stdout"].getMessage() == f"[registry:7 pid={process.pid}] hello"
+    assert records["stderr"].getMessage() == f"[registry:7 pid={process.pid}] oops"
+    assert records["stdout"].model == "registry"
+    assert records["stdout"].model_version == "7"
+    assert records["stdout"].child_pid == process.pid
+    assert sorted(pump.tail()) == ["hello", "oops"]
+
+
+def test_ring_buffer_is_bounded():
+    process = launch("for i in range(100): print(i)")
+    pump = LogPump(process=process, name="registry", buffer_size=10, rate_limit=0)
+
+    pump.start()
+    process.wait()
+    pump.join(timeout=5)
+
+    assert pump.tail(lines=100) == [str(i) for i in range(90, 100)]
+    assert pump.tail(lines=2) == ["98", "99"]
+
+
+def test_rate_limit(caplog):
+    process = launch("for i in range(500): print(i)")
+    pump = LogPump(process=process, name="registry", rate_limit=10)
+
+    with caplog.at_level(logging.INFO, logger="mlflow_adsp.common.log_pump"):
+        pump.start()
+        process.wait()
+        pump.join(timeout=5)
+
+    forwarded = [record for record in caplog.records if record.levelno == logging.INFO]
+    suppressed = [record for record in caplog.records if record.levelno == logging.WARNING]
+    assert 10 <= len(forwarded) < 500
+    assert "Suppressed" in suppressed[-1].getMessage()
+    assert len(pump.buffer) == 500
+
+
+def test_rate_limiter(monkeypatch):
+    # Set up the test
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    limiter = RateLimiter(rate=2)
+
+    # Execute the test
+    burst = [limiter.acquire() for _ in range(3)]
+    now[0] += 0.5
+    refilled = limiter.acquire()
+
+    # Review the results
+    assert burst == [True, True, False]
+    assert refilled is True
+    assert limiter.take_suppressed() == 1
+    assert limiter.suppressed == 0
@@ -0,0 +1,82 @@
+import pytest
+
+from mlflow_adsp.common.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+def test_counter():
+    counter = Counter(name="requests_total", documentation="Requests.", label_names=["model"])
+
+    counter.inc(model="iris")
+    counter.inc(amount=2, model="iris")
+
+    assert counter.get(model="iris") == 3
+    assert counter.render() == (
+        "# HELP requests_total Requests.\n" "# TYPE requests_total counter\n" 'requests_total{model="iris"} 3.0\n'
+    )
+
+
+def test_counter_requires_labels():
+    counter = Counter(name="requests_total", documentation="Requests.", label_names=["model"])
+
+    with pytest.raises(ValueError):
+        counter.inc(route="iris")
+
+
+def test_gauge():
+    gauge = Gauge(name="memory_bytes", documentation="Memory.", label_names=["model"])
+
+    gauge.set(1024, model="iris")
+    gauge.set_function(lambda: 2048, model="wine")
+    gauge.set_function(lambda: None, model="churn")
+
+    assert gauge.get(model="wine") == 2048
+    assert gauge.samples() == ['memory_bytes{model="iris"} 1024.0', 'memory_bytes{model="wine"} 2048.0']
+
+    gauge.remove(model="iris")
+    assert gauge.samples() == ['memory_bytes{model="wine"} 2048.0']
+
+
+def test_histogram():
+    histogram = Histogram(name="duration_seconds", documentation="Duration.", label_names=["outcome"], buckets=(1, 5))
+
+    histogram.observe(0.5, outcome="success")
+    histogram.observe(3, outcome="success")
+
+    assert histogram.get_count(outcome="success") == 2
+    assert histogram.samples() == [
+        'duration_seconds_bucket{outcome="success",le="1.0"} 1.0',
+        'duration_seconds_bucket{outcome="success",le="5.0"} 2.0',
+        'duration_seconds_bucket{outcome="success",le="+Inf"} 2.0',
+        'duration_seconds_sum{outcome="success"} 3.5',
+        'duration_seconds_count{outcome="success"} 2.0',
+    ]
+
+
+def test_histogram_time_records_failures():
+    histogram = Histogram(name="duration_seconds", documentation="Duration.", label_names=["outcome"])
+
+    with pytest.raises(RuntimeError):
+        with histogram.time(outcome="success") as labels:
+            labels["outcome"] = "failure"
+            raise RuntimeError("Boom!")
+
+    assert histogram.get_count(outcome="failure") == 1
+    assert histogram.get_count(outcome="success") == 0
+
+
+def test_registry_render():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter(name="reloads_total", documentation="Reloads."))
+    registry.register(Gauge(name="version", documentation='The "served" version.', label_names=["model"])).set(
+        7, model='a"b'
+    )
+    counter.inc()
+
+    assert registry.render() == (
+        "# HELP reloads_total Reloads.\n"
+        "# TYPE reloads_total counter\n"
+        "reloads_total 1.0\n"
+        '# HELP version The "served" version.\n'
+        "# TYPE version gauge\n"
+        'version{model="a\\"b"} 7.0\n'
+    )
@@ -0,0 +1,153 @@
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from mlflow_adsp import ADSPMLFlowPluginError
+from mlflow_adsp.common.model_cache import ModelCache
+
+
+def mock_download(content: str, size: int = 0):
+    def download(path: str) -> None:
+        with open(os.path.join(path, "MLmodel"), "w") as model_file:
+            model_file.write(content)
+        os.makedirs(os.path.join(path, "data"))
+        with open(os.path.join(path, "data", "model.bin"), "wb") as data_file:
+            data_file.write(b"0" * size)
+
+    return MagicMock(side_effect=download)
+
+
+def test_resolve_cache_miss_then_hit(tmp_path):
+    cache = ModelCache(root=str(tmp_path), max_size=1024)
+    download = mock_download(content="model-one")
+
+    first_path: str = cache.resolve(registry="registry", version="1", source="source-one", download=download)
+    second_path: str = cache.resolve(registry="registry", version="1", source="source-one", download=download)
+
+    assert first_path == second_path
+    assert os.path.isfile(os.path.join(first_path, "data", "model.bin"))
+    download.assert_called_once()
+
+
+def test_resolve_changed_source_downloads_again(tmp_path):
+    cache = ModelCache(root=str(tmp_path), max_size=1024)
+    download = mock_download(content="model-one")
+
+    cache.resolve(registry="registry", version="1", source="source-one", download=download)
+    cache.resolve(registry="registry", version="1", source="source-two", download=download)
+
+    assert download.call_count == 2
+
+
+def test_resolve_identical_artifacts_are_shared(tmp_path):
+    cache = ModelCache(root=str(tmp_path), max_size=1024)
+
+    first_path: str = cache.resolve(
+        registry="registry", version="1", source="source-one", download=mock_download(content="same")
+    )
+    second_path: str = cache.resolve(
+        registry="registry", version="2", source="source-two", download=mock_download(content="same")
+    )
+    third_path: str = cache.resolve(
+        registry="registry", version="3", source="source-three", download=mock_download(content="different")
+    )
+
+    assert first_path == second_path
+    assert first_path != third_path
+    assert len(os.listdir(os.path.join(str(tmp_path), "objects"))) == 2
+
+
+def test_resolve_evicts_least_recently_used(tmp_path):
+    cache = ModelCache(root=str(tmp_path), max_size=2500)
+
+    path_one: str = cache.resolve(
+        registry="registry", version="1", source="one", download=mock_download(content="one", size=1000)
+    )
+    path_two: str = cache.resolve(
+        registry="registry", version="2", source="two", download=mock_download(content="two", size=1000)
+    )
+    os.utime(path_one, (0, 0))
+    os.utime(path_two, (1, 1))
+
+    path_three: str = cache.resolve(
+        registry="registry",
+        version="3",
+        source="three",
+        download=mock_download(content="three", size=1000),
+        pinned={path_one},
+    )
+
+    assert os.path.isdir(path_one)
+    assert not os.path.exists(path_two)
+    assert os.path.isdir(path_three)
+
+    # The evicted version is downloaded again.
+    download = mock_download(content="two", size=1000)
+    cache.resolve(registry="registry", version="2", source="two", download=download)
+    download.assert_called_once()
+
+
+def test_resolve_gracefully_fails(tmp_path):
+    cache = ModelCache(root=str(tmp_path), max_size=1024)
+
+    with pytest.raises(ADSPMLFlowPluginError):
+        cache.resolve(
+            registry="registry", version="1", source="one", download=MagicMock(side_effect=Exception("Boom!"))
+        )
+
+    assert os.listdir(os.path.join(str(tmp_path), "objects")) == []
+
+
+def test_evict_keeps_trees_leased_by_other_instances(tmp_path):
+    serving = ModelCache(root=str(tmp_path), max_size=1500)
+    other = ModelCache(root=str(tmp_path), max_size=1500)
+
+    path_one: str = serving.resolve(
+        registry="registry", version="1", source="one", download=mock_download(content="one", size=1000)
+    )
+    os.utime(path_one, (0, 0))
+    path_two: str = other.resolve(
+        registry="registry", version="2", source="two", download=mock_download(content="two", size=1000)
+    )
+
+    assert os.path.isdir(path_one)
+    assert os.path.isdir(path_two)
+
+    # Once released (e.g. the model was swapped out) the tree can be evicted.
+    serving.release(path=path_one)
+    other.evict()
+
+    assert not os.path.exists(path_one)
+    assert os.path.isdir(path_two)
+
+
+def test_evict_ignores_expired_leases(tmp_path):
+    failed = ModelCache(root=str(tmp_path), max_size=1500)
+    other = ModelCache(root=str(tmp_path), max_size=1500, lease_ttl=0)
+
+    path_one: str = failed.resolve(
+        registry="registry", version="1", source="one", download=mock_download(content="one", size=1000)
+    )
+    os.utime(path_one, (0, 0))
+    other.resolve(registry="registry", version="2", source="two", download=mock_download(content="two", size=1000))
+
+    assert not os.path.exists(path_one)
+    assert os.listdir(os.path.join(str(tmp_path), "leases", os.path.basename(path_one))) == []
+
+
+def test_leases_are_renewed_until_stopped(tmp_path):
+    cache = ModelCache(root=str(tmp_path), max_size=1024, lease_ttl=0.3)
+    path: str = cache.resolve(registry="registry", version="1", source="one", download=mock_download(content="one"))
+    lease_dir: str = os.path.join(str(tmp_path), "leases", os.path.basename(path))
+    (owner,) = os.listdir(lease_dir)
+    os.utime(os.path.join(lease_dir, owner), (0, 0))
+
+    cache.start()
+    time.sleep(0.3)
+    renewed: float = os.stat(os.path.join(lease_dir, owner)).st_mtime
+    cache.stop()
+
+    assert renewed > 0
+    assert os.listdir(lease_dir) == []
@@ -1,15 +1,33 @@
+import gzip
+import itertools
+import os
+import threading
 import time
 import uuid
-from typing import Optional
+from collections import deque
+from typing import Dict, List, Optional
 from unittest.mock import MagicMock
 
 import mlflow
 import pytest
 from mlflow.entities import RunStatus
+from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID
 
 import mlflow_adsp
 from ae5_tools.api import AEUserSession
-from mlflow_adsp import ADSPMLFlowPluginError, ADSPSubmittedRun, Job, Scheduler, Step
+from mlflow_adsp import (
+    ADSPMLFlowPluginError,
+    ADSPSubmittedRun,
+    AEProjectJobRunStateType,
+    CachedSubmittedRun,
+    CancellationToken,
+    CheckpointStore,
+    Job,
+    Scheduler,
+    SchedulerOptions,
+    Step,
+)
+from mlflow_adsp.common.log_archive import JOB_LOG_LINES_TAG, JOB_LOG_SIZE_TAG
 
 
 @pytest.fixture(scope="function")
@@ -45,7 +63,42 @@ def test_execute_step(monkeypatch):
 
     # Review the results
     mock: MagicMock = mlflow.projects.run
-    mock.assert_called_once_with(**mock_request.model_dump())
+    mock.assert_called_once_with(**mock_request.model_dump(exclude={"depends_on", "group", "name", "priority"}))
+
+
+def test_execute_cached_step(monkeypatch):
+    # Set up the test
+    mock_step: Step = Step()
+    monkeypatch.setattr(mlflow_adsp.common.scheduler, "launch_cached_step", MagicMock(return_value="new-run"))
+
+    # Execute the test
+    result = Scheduler.execute_cached_step(step=mock_step)
+
+    # Review the results
+    assert result == "new-run"
+    mlflow_adsp.common.scheduler.launch_cached_step.assert_called_once_with(
+        step=mock_step, launch=Scheduler.execute_step, work_dirs=None
+    )
+
+
+def test_process_work_queue_with_cached_steps(monkeypatch):
+    # Set up the test
+    monkeypatch.setattr(
+        mlflow_adsp.common.scheduler.Scheduler,
+        "execute_cached_step",
+        MagicMock(side_effect=lambda step, work_dirs: CachedSubmittedRun(mlflow_run_id=f"{step.name}-run")),
+    )
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", MagicMock())
+
+    # Execute the test
+    results: List[Job] = Scheduler(options=SchedulerOptions(cache_steps=True)).process_work_queue(
+        steps=[Step(name="one"), Step(name="two", depends_on=["one"])], disable_progress_bar=True
+    )
+
+    # Review the results
+    Scheduler.execute_step.assert_not_called()
+    assert [result.runs[0].run_id for result in results] == ["one-run", "two-run"]
+    assert all(result.last_status == RunStatus.FINISHED for result in results)
 
 
 ###############################################################################
@@ -83,7 +136,7 @@ def test_fill_processing_queue(monkeypatch):
     monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_run)
 
     scheduler: Scheduler = Scheduler()
-    scheduler.jobs.append(mock_job)
+    scheduler.jobs[job_id] = mock_job
     scheduler.todo.append(job_id)
 
     # Execute the test
@@ -121,8 +174,8 @@ def test_fill_processing_queue_more_jobs_than_workers(monkeypatch):
 
     scheduler: Scheduler = Scheduler()
     scheduler.max_workers = 1
-    scheduler.jobs.append(mock_job_one)
-    scheduler.jobs.append(mock_job_two)
+    scheduler.jobs[job_id_one] = mock_job_one
+    scheduler.jobs[job_id_two] = mock_job_two
     scheduler.todo.append(job_id_one)
     scheduler.todo.append(job_id_two)
 
@@ -132,21 +185,21 @@ def test_fill_processing_queue_more_jobs_than_workers(monkeypatch):
     # Review the results
     assert len(scheduler.todo) == 1
     assert len(scheduler.inprogress) == 1
-    assert scheduler.inprogress[0] == job_id_two
+    assert scheduler.inprogress[0] == job_id_one
 
     # Queues should not change
     scheduler._fill_processing_queue()
     assert len(scheduler.todo) == 1
     assert len(scheduler.inprogress) == 1
-    assert scheduler.inprogress[0] == job_id_two
+    assert scheduler.inprogress[0] == job_id_one
 
     # First item completes
-    scheduler.complete.append(scheduler.inprogress.pop())
+    scheduler.complete.add(scheduler.inprogress.pop())
 
     scheduler._fill_processing_queue()
     assert len(scheduler.todo) == 0
     assert len(scheduler.inprogress) == 1
-    assert scheduler.inprogress[0] == job_id_one
+    assert scheduler.inprogress[0] == job_id_two
 
 
 def test_fill_processing_queue_no_work(monkeypatch):
@@ -164,6 +217,196 @@ def test_fill_processing_queue_no_work(monkeypatch):
     assert len(scheduler.inprogress) == 0
 
 
+def test_fill_processing_queue_submits_concurrently(monkeypatch):
+    # Scenario:
+    # 3 jobs to process, 3 workers, each submission waits on the others
+
+    # Set up the test
+    barrier: threading.Barrier = threading.Barrier(parties=3, timeout=5)
+
+    def mock_execute_step(step: Step):
+        barrier.wait()
+        return MagicMock()
+
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+
+    scheduler: Scheduler = Scheduler()
+    scheduler.max_workers = 3
+    for _ in range(3):
+        job: Job = generate_adsp_meta_job()
+        scheduler.jobs[job.id] = job
+        scheduler.todo.append(job.id)
+
+    # Execute the test
+    scheduler._fill_processing_queue()
+
+    # Review the results
+    assert len(scheduler.todo) == 0
+    assert len(scheduler.inprogress) == 3
+    assert all(len(job.runs) == 1 for job in scheduler.jobs.values())
+
+
+def test_fill_processing_queue_nests_runs_under_active_run(monkeypatch):
+    # Scenario:
+    # 2 jobs launched from submission threads, while the caller has an active run
+
+    # Set up the test
+    caller_thread: int = threading.get_ident()
+    parent_run: MagicMock = MagicMock()
+    parent_run.info.run_id = "parent-run"
+    # MLFlow tracks the active run per thread.
+    monkeypatch.setattr(mlflow, "active_run", lambda: parent_run if threading.get_ident() == caller_thread else None)
+
+    run_tags: Dict[str, Dict[str, str]] = {}
+
+    def mock_execute_step(step: Step):
+        # As `mlflow.projects.run` does, the parent run is taken from the active run of the launching thread.
+        assert threading.get_ident() != caller_thread
+        active_run = mlflow.active_run()
+        run_tags[f"{step.name}-run"] = {MLFLOW_PARENT_RUN_ID: active_run.info.run_id} if active_run else {}
+        mock_run: MagicMock = MagicMock()
+        mock_run.run_id = f"{step.name}-run"
+        return mock_run
+
+    mock_client: MagicMock = MagicMock()
+    mock_client.set_tag = MagicMock(side_effect=lambda run_id, key, value: run_tags[run_id].update({key: value}))
+    monkeypatch.setattr(mlflow, "MlflowClient", MagicMock(return_value=mock_client))
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+
+    scheduler: Scheduler = Scheduler(max_workers=2)
+    for name in ["one", "two"]:
+        job: Job = generate_adsp_meta_job(request=Step(name=name))
+        scheduler.jobs[job.id] = job
+        scheduler.todo.append(job.id)
+
+    # Execute the test
+    scheduler._fill_processing_queue()
+
+    # Review the results
+    assert len(scheduler.inprogress) == 2
+    assert run_tags == {
+        "one-run": {MLFLOW_PARENT_RUN_ID: "parent-run"},
+        "two-run": {MLFLOW_PARENT_RUN_ID: "parent-run"},
+    }
+
+
+def test_fill_processing_queue_isolates_failed_submissions(monkeypatch):
+    # Scenario:
+    # 2 jobs to process, one submission fails
+
+    # Set up the test
+    job_one: Job = generate_adsp_meta_job(request=Step(entry_point="one"))
+    job_two: Job = generate_adsp_meta_job(request=Step(entry_point="two"))
+
+    def mock_execute_step(step: Step):
+        if step.entry_point == "two":
+            raise ADSPMLFlowPluginError("Boom!")
+        return "mock_new_run"
+
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+
+    scheduler: Scheduler = Scheduler()
+    scheduler.jobs = {job_one.id: job_one, job_two.id: job_two}
+    scheduler.todo.append(job_one.id)
+    scheduler.todo.append(job_two.id)
+
+    # Execute the test
+    scheduler._fill_processing_queue()
+
+    # Review the results
+    assert list(scheduler.inprogress) == [job_one.id]
+    assert list(scheduler.todo) == [job_two.id]
+    assert job_one.runs == ["mock_new_run"]
+    assert job_two.runs == []
+    assert job_two.failed_submissions == 1
+
+
+def test_fill_processing_queue_failed_submissions_exhaust_retries(monkeypatch):
+    # Set up the test
+    job: Job = generate_adsp_meta_job()
+    job.failed_submissions = 2
+
+    monkeypatch.setattr(
+        mlflow_adsp.common.scheduler.Scheduler, "execute_step", MagicMock(side_effect=ADSPMLFlowPluginError("Boom!"))
+    )
+
+    scheduler: Scheduler = Scheduler()
+    scheduler.jobs = {job.id: job}
+    scheduler.todo.append(job.id)
+
+    # Execute the test
+    scheduler._fill_processing_queue()
+
+    # Review the results
+    assert len(scheduler.todo) == 0
+    assert len(scheduler.inprogress) == 0
+    assert scheduler.complete == {job.id}
+    assert job.last_status == RunStatus.FAILED
+
+
+def test_fill_processing_queue_by_priority(monkeypatch):
+    # Scenario:
+    # 1 worker, a high priority step is queued behind low priority steps
+
+    # Set up the test
+    steps: List[Step] = [Step(name="train_one"), Step(name="train_two"), Step(name="validate", priority=10)]
+    launched: List[str] = []
+
+    def mock_execute_step(step: Step):
+        launched.append(step.name)
+        return MagicMock()
+
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+
+    scheduler: Scheduler = Scheduler(max_workers=1)
+    scheduler._build_jobs(steps=steps)
+
+    # Execute the test
+    for _ in steps:
+        scheduler._fill_processing_queue()
+        scheduler.inprogress.clear()
+
+    # Review the results
+    assert launched == ["validate", "train_one", "train_two"]
+
+
+def test_fill_processing_queue_by_group(monkeypatch):
+    # Scenario:
+    # 1 worker, a large sweep is queued ahead of another group's steps
+
+    # Set up the test
+    steps: List[Step] = [Step(name=f"sweep_{index}", group="sweep") for index in range(4)] + [
+        Step(name=f"adhoc_{index}", group="adhoc") for index in range(2)
+    ]
+    launched: List[str] = []
+
+    def mock_execute_step(step: Step):
+        launched.append(step.name)
+        return MagicMock()
+
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+
+    scheduler: Scheduler = Scheduler(max_workers=1)
+    scheduler._build_jobs(steps=steps)
+
+    # Execute the test
+    for _ in steps:
+        scheduler._fill_processing_queue()
+        scheduler.inprogress.clear()
+
+    # Review the results
+    assert launched == ["sweep_0", "adhoc_0", "sweep_1", "adhoc_1", "sweep_2", "sweep_3"]
+
+
+def test_scheduler_options():
+    # Execute the test
+    scheduler: Scheduler = Scheduler(max_workers=1, options=SchedulerOptions(group_weights={"adhoc": 2.0}))
+
+    # Review the results
+    assert scheduler.todo.weights == {"adhoc": 2.0}
+    assert Scheduler(max_workers=1).options == SchedulerOptions()
+
+
 ###############################################################################
 # _coerce_run_status Tests
 ###############################################################################
@@ -280,20 +523,21 @@ def test_review_in_progress_jobs_no_work(monkeypatch):
 
     # Set up the test
     scheduler = Scheduler()
-    scheduler.jobs = test_case["initial"]["jobs"]
-    scheduler.todo = test_case["initial"]["todo"]
-    scheduler.inprogress = test_case["initial"]["inprogress"]
-    scheduler.complete = test_case["initial"]["complete"]
+    scheduler.jobs = {job.id: job for job in test_case["initial"]["jobs"]}
+    for job_id in test_case["initial"]["todo"]:
+        scheduler.todo.append(job_id)
+    scheduler.inprogress = deque(test_case["initial"]["inprogress"])
+    scheduler.complete = set(test_case["initial"]["complete"])
     scheduler.max_workers = test_case["initial"]["max_workers"]
 
     # Execute the test
     scheduler._review_in_progress_jobs()
 
     # Review the results
-    assert scheduler.jobs == test_case["result"]["jobs"]
-    assert scheduler.todo == test_case["result"]["todo"]
-    assert scheduler.inprogress == test_case["result"]["inprogress"]
-    assert scheduler.complete == test_case["result"]["complete"]
+    assert list(scheduler.jobs.values()) == test_case["result"]["jobs"]
+    assert list(scheduler.todo) == test_case["result"]["todo"]
+    assert list(scheduler.inprogress) == test_case["result"]["inprogress"]
+    assert scheduler.complete == set(test_case["result"]["complete"])
 
 
 def test_review_in_progress_jobs_inprogress_and_running(monkeypatch):
@@ -314,19 +558,20 @@ def test_review_in_progress_jobs_inprogress_and_running(monkeypatch):
 
     # Set up the test
     scheduler = Scheduler()
-    scheduler.jobs = test_case["initial"]["jobs"]
-    scheduler.todo = test_case["initial"]["todo"]
-    scheduler.inprogress = test_case["initial"]["inprogress"]
-    scheduler.complete = test_case["initial"]["complete"]
+    scheduler.jobs = {job.id: job for job in test_case["initial"]["jobs"]}
+    for job_id in test_case["initial"]["todo"]:
+        scheduler.todo.append(job_id)
+    scheduler.inprogress = deque(test_case["initial"]["inprogress"])
+    scheduler.complete = set(test_case["initial"]["complete"])
     scheduler.max_workers = test_case["initial"]["max_workers"]
 
     # Execute the test
     scheduler._review_in_progress_jobs()
 
     # Review the results
-    assert scheduler.todo == test_case["result"]["todo"]
-    assert scheduler.inprogress == test_case["result"]["inprogress"]
-    assert scheduler.complete == test_case["result"]["complete"]
+    assert list(scheduler.todo) == test_case["result"]["todo"]
+    assert list(scheduler.inprogress) == test_case["result"]["inprogress"]
+    assert scheduler.complete == set(test_case["result"]["complete"])
 
 
 def test_review_in_progress_jobs_inprogress_and_finished(monkeypatch):
@@ -347,19 +592,20 @@ def test_review_in_progress_jobs_inprogress_and_finished(monkeypatch):
 
     # Set up the test
     scheduler = Scheduler()
-    scheduler.jobs = test_case["initial"]["jobs"]
-    scheduler.todo = test_case["initial"]["todo"]
-    scheduler.inprogress = test_case["initial"]["inprogress"]
-    scheduler.complete = test_case["initial"]["complete"]
+    scheduler.jobs = {job.id: job for job in test_case["initial"]["jobs"]}
+    for job_id in test_case["initial"]["todo"]:
+        scheduler.todo.append(job_id)
+    scheduler.inprogress = deque(test_case["initial"]["inprogress"])
+    scheduler.complete = set(test_case["initial"]["complete"])
     scheduler.max_workers = test_case["initial"]["max_workers"]
 
     # Execute the test
     scheduler._review_in_progress_jobs()
 
     # Review the results
-    assert scheduler.todo == test_case["result"]["todo"]
-    assert scheduler.inprogress == test_case["result"]["inprogress"]
-    assert scheduler.complete == test_case["result"]["complete"]
+    assert list(scheduler.todo) == test_case["result"]["todo"]
+    assert list(scheduler.inprogress) == test_case["result"]["inprogress"]
+    assert scheduler.complete == set(test_case["result"]["complete"])
 
 
 def test_review_in_progress_jobs_inprogress_and_failed(monkeypatch):
@@ -380,19 +626,20 @@ def test_review_in_progress_jobs_inprogress_and_failed(monkeypatch):
 
     # Set up the test
     scheduler = Scheduler()
-    scheduler.jobs = test_case["initial"]["jobs"]
-    scheduler.todo = test_case["initial"]["todo"]
-    scheduler.inprogress = test_case["initial"]["inprogress"]
-    scheduler.complete = test_case["initial"]["complete"]
+    scheduler.jobs = {job.id: job for job in test_case["initial"]["jobs"]}
+    for job_id in test_case["initial"]["todo"]:
+        scheduler.todo.append(job_id)
+    scheduler.inprogress = deque(test_case["initial"]["inprogress"])
+    scheduler.complete = set(test_case["initial"]["complete"])
     scheduler.max_workers = test_case["initial"]["max_workers"]
 
     # Execute the test
     scheduler._review_in_progress_jobs()
 
     # Review the results
-    assert scheduler.todo == test_case["result"]["todo"]
-    assert scheduler.inprogress == test_case["result"]["inprogress"]
-    assert scheduler.complete == test_case["result"]["complete"]
+    assert list(scheduler.todo) == test_case["result"]["todo"]
+    assert list(scheduler.inprogress) == test_case["result"]["inprogress"]
+    assert scheduler.complete == set(test_case["result"]["complete"])
 
 
 def test_review_in_progress_jobs_inprogress_and_failed_too_many_times(monkeypatch):
@@ -415,19 +662,20 @@ def test_review_in_progress_jobs_inprogress_and_failed_too_many_times(monkeypatc
 
     # Set up the test
     scheduler = Scheduler()
-    scheduler.jobs = test_case["initial"]["jobs"]
-    scheduler.todo = test_case["initial"]["todo"]
-    scheduler.inprogress = test_case["initial"]["inprogress"]
-    scheduler.complete = test_case["initial"]["complete"]
+    scheduler.jobs = {job.id: job for job in test_case["initial"]["jobs"]}
+    for job_id in test_case["initial"]["todo"]:
+        scheduler.todo.append(job_id)
+    scheduler.inprogress = deque(test_case["initial"]["inprogress"])
+    scheduler.complete = set(test_case["initial"]["complete"])
     scheduler.max_workers = test_case["initial"]["max_workers"]
 
     # Execute the test
     scheduler._review_in_progress_jobs()
 
     # Review the results
-    assert scheduler.todo == test_case["result"]["todo"]
-    assert scheduler.inprogress == test_case["result"]["inprogress"]
-    assert scheduler.complete == test_case["result"]["complete"]
+    assert list(scheduler.todo) == test_case["result"]["todo"]
+    assert list(scheduler.inprogress) == test_case["result"]["inprogress"]
+    assert scheduler.complete == set(test_case["result"]["complete"])
 
 
 def test_review_in_progress_gracefully_fails(monkeypatch):
@@ -442,10 +690,11 @@ def test_review_in_progress_gracefully_fails(monkeypatch):
 
     # Set up the test
     scheduler = Scheduler()
-    scheduler.jobs = test_case["initial"]["jobs"]
-    scheduler.todo = test_case["initial"]["todo"]
-    scheduler.inprogress = test_case["initial"]["inprogress"]
-    scheduler.complete = test_case["initial"]["complete"]
+    scheduler.jobs = {job.id: job for job in test_case["initial"]["jobs"]}
+    for job_id in test_case["initial"]["todo"]:
+        scheduler.todo.append(job_id)
+    scheduler.inprogress = deque(test_case["initial"]["inprogress"])
+    scheduler.complete = set(test_case["initial"]["complete"])
     scheduler.max_workers = test_case["initial"]["max_workers"]
 
     # Execute the test
@@ -454,6 +703,67 @@ def test_review_in_progress_gracefully_fails(monkeypatch):
         assert str(context.value) == "Unable to find job run to review"
 
 
+def test_review_in_progress_jobs_uses_status_snapshot(monkeypatch, get_ae_user_session):
+    # Set up the test
+    runs: List[ADSPSubmittedRun] = []
+    scheduler = Scheduler()
+    for _ in range(3):
+        job: Job = generate_adsp_meta_job()
+        run = ADSPSubmittedRun(
+            ae_session=get_ae_user_session, mlflow_run_id=str(uuid.uuid4()), adsp_job_id=str(uuid.uuid4()), response={}
+        )
+        job.runs.append(run)
+        runs.append(run)
+        scheduler.jobs[job.id] = job
+        scheduler.inprogress.append(job.id)
+
+    mock_get_statuses = MagicMock(
+        return_value={runs[0].adsp_job_id: RunStatus.FINISHED, runs[1].adsp_job_id: RunStatus.RUNNING}
+    )
+    mock_get_status = MagicMock(return_value=RunStatus.RUNNING)
+    monkeypatch.setattr(mlflow_adsp.ADSPSubmittedRun, "get_statuses", mock_get_statuses)
+    monkeypatch.setattr(mlflow_adsp.ADSPSubmittedRun, "get_status", mock_get_status)
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+
+    # Execute the test
+    scheduler._review_in_progress_jobs()
+
+    # Review the results
+    mock_get_statuses.assert_called_once_with(
+        ae_session=get_ae_user_session, adsp_job_ids=[run.adsp_job_id for run in runs]
+    )
+    # Only the run missing from the snapshot is looked up individually
+    mock_get_status.assert_called_once()
+    job_ids: List[str] = list(scheduler.jobs)
+    assert scheduler.complete == {job_ids[0]}
+    assert list(scheduler.inprogress) == job_ids[1:]
+
+
+def test_review_in_progress_jobs_status_snapshot_failure(monkeypatch, get_ae_user_session):
+    # Set up the test
+    scheduler = Scheduler()
+    job: Job = generate_adsp_meta_job()
+    job.runs.append(
+        ADSPSubmittedRun(
+            ae_session=get_ae_user_session, mlflow_run_id=str(uuid.uuid4()), adsp_job_id=str(uuid.uuid4()), response={}
+        )
+    )
+    scheduler.jobs[job.id] = job
+    scheduler.inprogress.append(job.id)
+
+    monkeypatch.setattr(
+        mlflow_adsp.ADSPSubmittedRun, "get_statuses", MagicMock(side_effect=ADSPMLFlowPluginError("Boom!"))
+    )
+    monkeypatch.setattr(mlflow_adsp.ADSPSubmittedRun, "get_status", MagicMock(return_value=RunStatus.RUNNING))
+
+    # Execute the test
+    scheduler._review_in_progress_jobs()
+
+    # Review the results
+    assert list(scheduler.inprogress) == [job.id]
+    assert job.last_status == RunStatus.RUNNING
+
+
 ###############################################################################
 # _mark_mlflow_run_as_failed Tests
 ###############################################################################
@@ -483,17 +793,25 @@ def test_add_log_to_run(monkeypatch, get_ae_user_session):
     mock_mlflow_run_id: str = str(uuid.uuid4())
     mock_adsp_job_id: str = str(uuid.uuid4())
     mock_start_run = MagicMock()
-    mock_log_text = MagicMock()
+    logged: List[str] = []
+
+    def mock_log_artifact(local_path: str):
+        # The log file only exists during the upload.
+        assert os.path.basename(local_path) == "job_log.txt"
+        with open(local_path, encoding="utf-8") as log_file:
+            logged.append(log_file.read())
+
     monkeypatch.setattr(mlflow, "start_run", mock_start_run)
-    monkeypatch.setattr(mlflow, "log_text", mock_log_text)
+    monkeypatch.setattr(mlflow, "log_artifact", MagicMock(side_effect=mock_log_artifact))
+    monkeypatch.setattr(mlflow, "log_text", MagicMock())
+    monkeypatch.setattr(mlflow, "set_tags", MagicMock())
     scheduler = Scheduler()
 
-    mock_log: str = "mock log data"
+    def mock_iter_log(run_id: str):
+        yield "mock log "
+        yield "data"
 
-    def mock_get_log(run_id: str):
-        return mock_log
-
-    monkeypatch.setattr(ADSPSubmittedRun, "get_log", mock_get_log)
+    monkeypatch.setattr(ADSPSubmittedRun, "iter_log", mock_iter_log)
     mock_run = ADSPSubmittedRun(
         ae_session=get_ae_user_session, mlflow_run_id=mock_mlflow_run_id, adsp_job_id=mock_adsp_job_id, response={}
     )
@@ -503,15 +821,40 @@ def test_add_log_to_run(monkeypatch, get_ae_user_session):
 
     # Review the results
     mock_start_run.assert_called_once_with(run_id=mock_mlflow_run_id, nested=True)
-    mock_log_text.assert_called_once_with(mock_log, artifact_file="job_log.txt")
+    assert logged == ["mock log data"]
+    mlflow.log_text.assert_not_called()
+    mlflow.set_tags.assert_called_once_with({JOB_LOG_SIZE_TAG: 13, JOB_LOG_LINES_TAG: 1})
+
+
+def test_add_log_to_run_compressed(monkeypatch, get_ae_user_session):
+    # Set up test
+    logged: List[bytes] = []
+
+    def mock_log_artifact(local_path: str):
+        assert os.path.basename(local_path) == "job_log.txt.gz"
+        with gzip.open(local_path, "rb") as log_file:
+            logged.append(log_file.read())
+
+    monkeypatch.setattr(mlflow, "start_run", MagicMock())
+    monkeypatch.setattr(mlflow, "log_artifact", MagicMock(side_effect=mock_log_artifact))
+    monkeypatch.setattr(mlflow, "set_tags", MagicMock())
+    monkeypatch.setattr(ADSPSubmittedRun, "iter_log", lambda run_id: iter(["0123456789\n"] * 4))
+    mock_run = ADSPSubmittedRun(ae_session=get_ae_user_session, mlflow_run_id="run", adsp_job_id="job", response={})
+
+    # Execute the test
+    Scheduler._add_log_to_run(run=mock_run, compress=True, max_bytes=22)
+
+    # Review the results
+    assert logged == [b"0123456789\n\n... 22 bytes truncated ...\n0123456789\n"]
+    mlflow.set_tags.assert_called_once_with({JOB_LOG_SIZE_TAG: 44, JOB_LOG_LINES_TAG: 4})
 
 
 def test_add_log_to_run_with_local_run(monkeypatch, get_ae_user_session):
     # Set up test
     mock_start_run = MagicMock()
-    mock_log_text = MagicMock()
+    mock_log_artifact = MagicMock()
     monkeypatch.setattr(mlflow, "start_run", mock_start_run)
-    monkeypatch.setattr(mlflow, "log_text", mock_log_text)
+    monkeypatch.setattr(mlflow, "log_artifact", mock_log_artifact)
     scheduler = Scheduler()
 
     # Execute the test
@@ -519,7 +862,7 @@ def test_add_log_to_run_with_local_run(monkeypatch, get_ae_user_session):
 
     # Review the results
     mock_start_run.assert_not_called()
-    mock_log_text.assert_not_called()
+    mock_log_artifact.assert_not_called()
 
 
 ###############################################################################
@@ -548,6 +891,7 @@ def test_process_work_queue(monkeypatch, get_ae_user_session):
     monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_mark_mlflow_run_as_failed", MagicMock())
     monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
 
+    monkeypatch.setattr(mlflow_adsp.ADSPSubmittedRun, "get_statuses", MagicMock(return_value={}))
     monkeypatch.setattr(mlflow_adsp.ADSPSubmittedRun, "get_status", MagicMock(return_value=RunStatus.FINISHED))
 
     mock_run = ADSPSubmittedRun(
@@ -584,6 +928,7 @@ def test_process_work_queue_with_wait(monkeypatch, get_ae_user_session):
     monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_mark_mlflow_run_as_failed", MagicMock())
     monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
 
+    monkeypatch.setattr(mlflow_adsp.ADSPSubmittedRun, "get_statuses", MagicMock(return_value={}))
     monkeypatch.setattr(
         mlflow_adsp.ADSPSubmittedRun, "get_status", MagicMock(side_effect=[RunStatus.RUNNING, RunStatus.FINISHED])
     )
@@ -625,6 +970,7 @@ def test_process_work_queue_with_multiple_requests(monkeypatch, get_ae_user_sess
     monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_mark_mlflow_run_as_failed", MagicMock())
     monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
 
+    monkeypatch.setattr(mlflow_adsp.ADSPSubmittedRun, "get_statuses", MagicMock(return_value={}))
     monkeypatch.setattr(
         mlflow_adsp.ADSPSubmittedRun,
         "get_status",
@@ -660,5 +1006,389 @@ def test_process_work_queue_with_multiple_requests(monkeypatch, get_ae_user_sess
     assert len(results[0].runs) == 1
     assert len(results[1].runs) == 1
 
-    assert results[0].runs[0] == mock_run_two
-    assert results[1].runs[0] == mock_run_one
+    # Jobs are processed in the order they were requested
+    assert results[0].runs[0] == mock_run_one
+    assert results[1].runs[0] == mock_run_two
+
+
+def test_process_work_queue_with_dependencies(monkeypatch):
+    # Scenario:
+    # prepare -> (train_a, train_b) -> evaluate
+
+    # Set up the test
+    steps: List[Step] = [
+        Step(name="evaluate", entry_point="evaluate", depends_on=["train_a", "train_b"]),
+        Step(name="train_a", entry_point="train", depends_on=["prepare"]),
+        Step(name="train_b", entry_point="train", depends_on=["prepare"]),
+        Step(name="prepare", entry_point="prepare"),
+    ]
+    launched: List[str] = []
+
+    def mock_execute_step(step: Step):
+        launched.append(step.name)
+        mock_run: MagicMock = MagicMock()
+        mock_run.get_status = MagicMock(return_value=RunStatus.FINISHED)
+        return mock_run
+
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+    monkeypatch.setattr(time, "sleep", MagicMock())
+
+    # Execute the test
+    results: List[Job] = Scheduler().process_work_queue(steps=steps)
+
+    # Review the results
+    assert launched == ["prepare", "train_a", "train_b", "evaluate"]
+    assert [result.step for result in results] == steps
+    assert all(result.last_status == RunStatus.FINISHED for result in results)
+
+
+def test_process_work_queue_with_failed_dependency(monkeypatch):
+    # Scenario:
+    # prepare -> train -> evaluate, independent: report; prepare fails
+
+    # Set up the test
+    steps: List[Step] = [
+        Step(name="prepare", entry_point="prepare"),
+        Step(name="train", entry_point="train", depends_on=["prepare"]),
+        Step(name="evaluate", entry_point="evaluate", depends_on=["train"]),
+        Step(name="report", entry_point="report"),
+    ]
+
+    def mock_execute_step(step: Step):
+        mock_run: MagicMock = MagicMock()
+        mock_run.get_status = MagicMock(return_value=RunStatus.FAILED if step.name == "prepare" else RunStatus.FINISHED)
+        return mock_run
+
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_mark_mlflow_run_as_failed", MagicMock())
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+    monkeypatch.setattr(time, "sleep", MagicMock())
+
+    # Execute the test
+    prepare, train, evaluate, report = Scheduler().process_work_queue(steps=steps)
+
+    # Review the results
+    assert prepare.last_status == RunStatus.FAILED
+    assert len(prepare.runs) == 3
+
+    assert train.runs == [] and train.last_status is None and train.blocked_by == prepare.id
+    assert evaluate.runs == [] and evaluate.last_status is None and evaluate.blocked_by == prepare.id
+
+    assert report.last_status == RunStatus.FINISHED
+    assert report.blocked_by is None
+
+
+def test_process_work_queue_with_invalid_dependencies():
+    # Set up the test
+    test_cases = [
+        {
+            "steps": [Step(name="one"), Step(name="one")],
+            "message": "Step name is not unique: (one)",
+        },
+        {
+            "steps": [Step(name="one", depends_on=["two"])],
+            "message": "Step (one) depends on an unknown step: (two)",
+        },
+        {
+            "steps": [Step(name="one", depends_on=["two"]), Step(name="two", depends_on=["one"]), Step(name="three")],
+            "message": "Step dependencies contain a cycle",
+        },
+    ]
+
+    for test_case in test_cases:
+        # Execute the test
+        with pytest.raises(ADSPMLFlowPluginError) as context:
+            Scheduler().process_work_queue(steps=test_case["steps"])
+
+        # Review the results
+        assert str(context.value) == test_case["message"]
+
+
+###############################################################################
+# iter_work_queue Tests
+###############################################################################
+
+
+def generate_finishing_step_executor(statuses: dict):
+    # Statuses are reported per step, across retries.
+    reported = {name: iter(step_statuses) for name, step_statuses in statuses.items()}
+
+    def mock_execute_step(step: Step):
+        mock_run: MagicMock = MagicMock()
+        mock_run.mlflow_run_id = f"{step.name}-run"
+        mock_run.get_status = MagicMock(side_effect=lambda: next(reported[step.name]))
+        return mock_run
+
+    return mock_execute_step
+
+
+def test_iter_work_queue(monkeypatch):
+    # Scenario:
+    # 3 jobs, they complete in reverse order
+
+    # Set up the test
+    steps: List[Step] = [Step(name="one"), Step(name="two"), Step(name="three")]
+    statuses = {
+        "one": [RunStatus.RUNNING, RunStatus.RUNNING, RunStatus.FINISHED],
+        "two": [RunStatus.RUNNING, RunStatus.FAILED, RunStatus.FINISHED],
+        "three": [RunStatus.FINISHED],
+    }
+    monkeypatch.setattr(
+        mlflow_adsp.common.scheduler.Scheduler, "execute_step", generate_finishing_step_executor(statuses=statuses)
+    )
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_mark_mlflow_run_as_failed", MagicMock())
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+    monkeypatch.setattr(time, "sleep", MagicMock())
+
+    # Execute the test
+    results: List[Job] = list(
+        Scheduler().iter_work_queue(steps=steps, options=SchedulerOptions(disable_progress_bar=True))
+    )
+
+    # Review the results
+    assert [result.step.name for result in results] == ["three", "one", "two"]
+    assert all(result.last_status == RunStatus.FINISHED for result in results)
+    assert [result.runs[-1].mlflow_run_id for result in results] == ["three-run", "one-run", "two-run"]
+    assert len(results[2].runs) == 2
+
+
+def test_iter_work_queue_stops_early(monkeypatch):
+    # Scenario:
+    # 1 worker, the caller stops after the first result
+
+    # Set up the test
+    steps: List[Step] = [Step(name="one"), Step(name="two")]
+    mock_execute_step = MagicMock(
+        side_effect=generate_finishing_step_executor(
+            statuses={"one": [RunStatus.FINISHED], "two": [RunStatus.FINISHED]}
+        )
+    )
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+
+    scheduler: Scheduler = Scheduler(max_workers=1)
+
+    # Execute the test
+    for result in scheduler.iter_work_queue(steps=steps, options=SchedulerOptions(disable_progress_bar=True)):
+        assert result.step.name == "one"
+        break
+
+    # Review the results
+    assert mock_execute_step.call_count == 1
+
+
+def test_iter_work_queue_without_retaining_jobs(monkeypatch):
+    # Set up the test
+    steps: List[Step] = [Step(name="one"), Step(name="two", depends_on=["one"])]
+    statuses = {"one": [RunStatus.FINISHED], "two": [RunStatus.FINISHED]}
+    monkeypatch.setattr(
+        mlflow_adsp.common.scheduler.Scheduler, "execute_step", generate_finishing_step_executor(statuses=statuses)
+    )
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+
+    scheduler: Scheduler = Scheduler()
+
+    # Execute the test
+    names: List[str] = []
+    options: SchedulerOptions = SchedulerOptions(disable_progress_bar=True, retain_jobs=False)
+    for result in scheduler.iter_work_queue(steps=steps, options=options):
+        names.append(result.step.name)
+
+    # Review the results
+    assert names == ["one", "two"]
+    assert scheduler.jobs == {}
+    assert len(scheduler.complete) == 2
+
+
+###############################################################################
+# Cancellation Tests
+###############################################################################
+
+
+def test_cancel_work_queue(monkeypatch):
+    # Set up the test
+    scheduler: Scheduler = Scheduler()
+    running: List[Job] = [generate_adsp_meta_job() for _ in range(2)]
+    waiting: Job = generate_adsp_meta_job()
+    blocked: Job = generate_adsp_meta_job()
+    barrier: threading.Barrier = threading.Barrier(parties=2, timeout=5)
+
+    def mock_cancel():
+        # Both cancellations must be in flight together.
+        barrier.wait()
+
+    def mock_failing_cancel():
+        barrier.wait()
+        raise ADSPMLFlowPluginError("Boom!")
+
+    for job, side_effect in zip(running, [mock_cancel, mock_failing_cancel]):
+        mock_run: MagicMock = MagicMock()
+        mock_run.cancel = MagicMock(side_effect=side_effect)
+        job.runs.append(mock_run)
+        scheduler.jobs[job.id] = job
+        scheduler.inprogress.append(job.id)
+
+    scheduler.jobs[waiting.id] = waiting
+    scheduler.todo.append(waiting.id)
+    scheduler.jobs[blocked.id] = blocked
+    scheduler.blocked[blocked.id] = {running[0].id}
+
+    # Execute the test
+    scheduler._cancel_work_queue(reason="mock reason")
+
+    # Review the results
+    assert not barrier.broken
+    for job in running:
+        job.runs[0].cancel.assert_called_once_with()
+        assert job.last_status == RunStatus.KILLED
+    assert waiting.last_status is None and blocked.last_status is None
+    assert all(job.cancelled for job in scheduler.jobs.values())
+
+    assert len(scheduler.todo) == 0 and len(scheduler.inprogress) == 0 and len(scheduler.blocked) == 0
+    assert scheduler.complete == set(scheduler.jobs)
+
+
+def test_process_work_queue_with_cancellation_token(monkeypatch):
+    # Set up the test
+    token: CancellationToken = CancellationToken()
+    token.cancel()
+    mock_execute_step = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+
+    # Execute the test
+    results: List[Job] = Scheduler().process_work_queue(steps=[Step(), Step()], cancellation_token=token)
+
+    # Review the results
+    mock_execute_step.assert_not_called()
+    assert all(result.cancelled and result.runs == [] for result in results)
+
+
+def test_iter_work_queue_with_cancel_when(monkeypatch):
+    # Scenario:
+    # 2 workers, 3 jobs, "fast" meets the condition while "slow" is still running
+
+    # Set up the test
+    steps: List[Step] = [Step(name="slow"), Step(name="fast"), Step(name="waiting")]
+    statuses = {"slow": [RunStatus.RUNNING], "fast": [RunStatus.FINISHED]}
+    mock_execute_step = MagicMock(side_effect=generate_finishing_step_executor(statuses=statuses))
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+
+    # Execute the test
+    results: List[Job] = list(
+        Scheduler(max_workers=2).iter_work_queue(
+            steps=steps,
+            options=SchedulerOptions(disable_progress_bar=True, cancel_when=lambda job: job.step.name == "fast"),
+        )
+    )
+
+    # Review the results
+    assert [result.step.name for result in results] == ["fast", "slow", "waiting"]
+    fast, slow, waiting = results
+    assert fast.last_status == RunStatus.FINISHED and not fast.cancelled
+    assert slow.last_status == RunStatus.KILLED and slow.cancelled
+    slow.runs[0].cancel.assert_called_once_with()
+    assert waiting.runs == [] and waiting.cancelled
+    assert mock_execute_step.call_count == 2
+
+
+###############################################################################
+# Checkpoint Tests
+###############################################################################
+
+
+def generate_adsp_step_executor(ae_session: AEUserSession, states: dict):
+    # Job run states are reported per step, the last state is repeated once reached.
+    reported = {
+        name: itertools.chain(step_states, itertools.repeat(step_states[-1])) for name, step_states in states.items()
+    }
+    submitted: List[str] = []
+
+    def mock_run_list(**kwargs):
+        return [{"id": f"{name}-run", "job_id": f"{name}-job", "state": next(reported[name])} for name in submitted]
+
+    def mock_execute_step(step: Step):
+        submitted.append(step.name)
+        return ADSPSubmittedRun(
+            ae_session=ae_session, mlflow_run_id=f"{step.name}-run", adsp_job_id=f"{step.name}-job", response={}
+        )
+
+    ae_session.run_list = MagicMock(side_effect=mock_run_list)
+    return MagicMock(side_effect=mock_execute_step)
+
+
+def test_process_work_queue_with_checkpoint_store(monkeypatch, get_ae_user_session, tmp_path):
+    # Set up the test
+    monkeypatch.setenv("TOOL_PROJECT_URL", "http://mock-storage/projects/mock-project-id")
+    store: CheckpointStore = CheckpointStore(path=os.path.join(str(tmp_path), "checkpoint.db"))
+    store.write(records=[{"id": "stale"}])
+    states = {"one": [AEProjectJobRunStateType.COMPLETED], "two": [AEProjectJobRunStateType.COMPLETED]}
+    monkeypatch.setattr(
+        mlflow_adsp.common.scheduler.Scheduler,
+        "execute_step",
+        generate_adsp_step_executor(ae_session=get_ae_user_session, states=states),
+    )
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+
+    # Execute the test
+    Scheduler().process_work_queue(
+        steps=[Step(name="one"), Step(name="two", depends_on=["one"])],
+        disable_progress_bar=True,
+        checkpoint_store=store,
+    )
+
+    # Review the results
+    records: List[Dict] = store.read()
+    assert [record["step"]["name"] for record in records] == ["one", "two"]
+    assert all(record["state"] == "complete" for record in records)
+    assert all(record["last_status"] == RunStatus.FINISHED for record in records)
+    assert records[1]["runs"] == [{"mlflow_run_id": "two-run", "adsp_job_id": "two-job", "cached": False}]
+
+
+def test_resume_work_queue(monkeypatch, get_ae_user_session, tmp_path):
+    # Scenario:
+    # The driver fails once "one" has finished, while "two" is still running and "three" is waiting on it.
+
+    # Set up the test
+    monkeypatch.setenv("TOOL_PROJECT_URL", "http://mock-storage/projects/mock-project-id")
+    path: str = os.path.join(str(tmp_path), "checkpoint.db")
+    states = {
+        "one": [AEProjectJobRunStateType.COMPLETED],
+        "two": [AEProjectJobRunStateType.RUNNING] * 3 + [AEProjectJobRunStateType.COMPLETED],
+        "three": [AEProjectJobRunStateType.COMPLETED],
+    }
+    mock_execute_step: MagicMock = generate_adsp_step_executor(ae_session=get_ae_user_session, states=states)
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "execute_step", mock_execute_step)
+    monkeypatch.setattr(mlflow_adsp.common.scheduler.Scheduler, "_add_log_to_run", MagicMock())
+    monkeypatch.setattr(time, "sleep", MagicMock())
+
+    steps: List[Step] = [Step(name="one"), Step(name="two"), Step(name="three", depends_on=["two"])]
+    for job in Scheduler().iter_work_queue(
+        steps=steps, options=SchedulerOptions(disable_progress_bar=True), checkpoint_store=CheckpointStore(path=path)
+    ):
+        assert job.step.name == "one"
+        break
+
+    # Execute the test
+    results: List[Job] = Scheduler().resume_work_queue(
+        checkpoint_store=CheckpointStore(path=path),
+        ae_session=get_ae_user_session,
+        options=SchedulerOptions(disable_progress_bar=True),
+    )
+
+    # Review the results
+    assert [call.kwargs["step"].name for call in mock_execute_step.call_args_list] == ["one", "two", "three"]
+    assert [result.step.name for result in results] == ["one", "two", "three"]
+    assert all(result.last_status == RunStatus.FINISHED for result in results)
+    assert results[1].runs[0].adsp_job_id == "two-job"
+    assert all(record["state"] == "complete" for record in CheckpointStore(path=path).read())
+
+
+def test_resume_work_queue_without_checkpoint(tmp_path):
+    # Set up the test
+    store: CheckpointStore = CheckpointStore(path=os.path.join(str(tmp_path), "checkpoint.db"))
+
+    # Execute the test
+    with pytest.raises(ADSPMLFlowPluginError):
+        Scheduler().resume_work_queue(checkpoint_store=store)
@@ -0,0 +1,200 @@
+import os
+from typing import Optional
+from unittest.mock import MagicMock
+
+import git
+import mlflow
+import pytest
+from mlflow.entities import RunStatus
+
+import mlflow_adsp
+from mlflow_adsp import CachedSubmittedRun, Step
+from mlflow_adsp.common.step_cache import STEP_FINGERPRINT_TAG, find_cached_run, fingerprint_step, launch_cached_step
+
+
+@pytest.fixture(scope="function")
+def mock_project(monkeypatch):
+    monkeypatch.setattr(mlflow_adsp.common.step_cache, "fetch_and_validate_project", MagicMock(return_value="work"))
+    mock_get_git_commit: MagicMock = MagicMock(return_value="commit-one")
+    monkeypatch.setattr(mlflow_adsp.common.step_cache, "get_git_commit", mock_get_git_commit)
+    monkeypatch.setattr(mlflow_adsp.common.step_cache, "_has_uncommitted_changes", MagicMock(return_value=False))
+    return mock_get_git_commit
+
+
+def test_fingerprint_step(mock_project):
+    # Set up the test
+    step: Step = Step(uri="project", entry_point="train", parameters={"alpha": 0.1}, name="one", priority=5)
+
+    # Execute the test
+    fingerprint: Optional[str] = fingerprint_step(step=step)
+
+    # Review the results
+    mlflow_adsp.common.step_cache.fetch_and_validate_project.assert_called_once_with(
+        "project", None, "train", {"alpha": 0.1}
+    )
+    # Scheduling fields do not change the result of a step, parameters are compared as MLFlow records them.
+    assert fingerprint == fingerprint_step(step=Step(uri="project", entry_point="train", parameters={"alpha": "0.1"}))
+    assert fingerprint != fingerprint_step(step=Step(uri="project", entry_point="train", parameters={"alpha": 0.2}))
+    assert fingerprint != fingerprint_step(step=Step(uri="project", entry_point="test", parameters={"alpha": 0.1}))
+
+    mock_project.return_value = "commit-two"
+    assert fingerprint != fingerprint_step(step=step)
+
+
+def test_fingerprint_step_reuses_work_dir(mock_project):
+    # Set up the test
+    work_dirs = {}
+
+    # Execute the test
+    fingerprint_step(step=Step(uri="project", entry_point="train"), work_dirs=work_dirs)
+    fingerprint_step(step=Step(uri="project", entry_point="test"), work_dirs=work_dirs)
+
+    # Review the results
+    mlflow_adsp.common.step_cache.fetch_and_validate_project.assert_called_once()
+    assert work_dirs == {("project", None): "work"}
+    assert mock_project.call_count == 2
+
+
+def test_fingerprint_step_without_git(mock_project):
+    # Set up the test
+    mock_project.return_value = None
+
+    # Execute the test
+    fingerprint: Optional[str] = fingerprint_step(step=Step())
+
+    # Review the results
+    assert fingerprint is None
+
+
+def test_fingerprint_step_with_uncommitted_changes(monkeypatch, tmp_path):
+    # Set up the test
+    repo: git.Repo = git.Repo.init(str(tmp_path))
+    with open(os.path.join(str(tmp_path), "train.py"), "w", encoding="utf-8") as train_file:
+        train_file.write("alpha = 0.1\n")
+    repo.index.add(["train.py"])
+    actor: git.Actor = git.Actor("test", "test@example.com")
+    repo.index.commit("Add training", author=actor, committer=actor)
+    monkeypatch.setattr(
+        mlflow_adsp.common.step_cache, "fetch_and_validate_project", MagicMock(return_value=str(tmp_path))
+    )
+    step: Step = Step(uri=str(tmp_path), entry_point="train")
+    clean_fingerprint: Optional[str] = fingerprint_step(step=step)
+
+    # Execute the test
+    with open(os.path.join(str(tmp_path), "train.py"), "w", encoding="utf-8") as train_file:
+        train_file.write("alpha = 0.2\n")
+    fingerprint: Optional[str] = fingerprint_step(step=step)
+
+    # Review the results
+    assert clean_fingerprint is not None
+    assert fingerprint is None
+
+
+def test_find_cached_run(monkeypatch):
+    # Set up the test
+    mock_run: MagicMock = MagicMock()
+    mock_run.info.run_id = "cached-run"
+    monkeypatch.setattr(mlflow, "search_runs", MagicMock(return_value=[mock_run]))
+
+    # Execute the test
+    run_id: Optional[str] = find_cached_run(step=Step(experiment_id="1"), fingerprint="mock-fingerprint")
+
+    # Review the results
+    assert run_id == "cached-run"
+    mock: MagicMock = mlflow.search_runs
+    mock.assert_called_once_with(
+        experiment_ids=["1"],
+        filter_string=f"tags.`{STEP_FINGERPRINT_TAG}` = 'mock-fingerprint' and attributes.status = 'FINISHED'",
+        max_results=1,
+        order_by=["attributes.start_time DESC"],
+        output_format="list",
+    )
+
+
+def test_find_cached_run_miss(monkeypatch):
+    # Set up the test
+    monkeypatch.setattr(mlflow_adsp.common.step_cache, "find_experiment", MagicMock(return_value="2"))
+    monkeypatch.setattr(mlflow, "search_runs", MagicMock(return_value=[]))
+
+    # Execute the test
+    run_id: Optional[str] = find_cached_run(step=Step(experiment_name="sweep"), fingerprint="mock-fingerprint")
+
+    # Review the results
+    assert run_id is None
+    mlflow_adsp.common.step_cache.find_experiment.assert_called_once_with(name="sweep")
+    assert mlflow.search_runs.call_args.kwargs["experiment_ids"] == ["2"]
+
+
+def test_find_cached_run_without_experiment(monkeypatch):
+    # Set up the test
+    monkeypatch.setattr(mlflow, "get_experiment_by_name", MagicMock(return_value=None))
+    monkeypatch.setattr(mlflow, "create_experiment", MagicMock())
+    monkeypatch.setattr(mlflow, "search_runs", MagicMock())
+
+    # Execute the test
+    run_id: Optional[str] = find_cached_run(step=Step(), fingerprint="mock-fingerprint")
+
+    # Review the results
+    assert run_id is None
+    mlflow.create_experiment.assert_not_called()
+    mlflow.search_runs.assert_not_called()
+
+
+def test_cached_submitted_run():
+    # Set up the test
+    run: CachedSubmittedRun = CachedSubmittedRun(mlflow_run_id="cached-run")
+
+    # Review the results
+    assert run.run_id == "cached-run"
+    assert run.wait() is True
+    assert run.get_status() == RunStatus.FINISHED
+    run.cancel()
+
+
+def test_launch_cached_step_hit(monkeypatch):
+    # Set up the test
+    mock_launch: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.common.step_cache, "fingerprint_step", MagicMock(return_value="mock-fingerprint"))
+    monkeypatch.setattr(mlflow_adsp.common.step_cache, "find_cached_run", MagicMock(return_value="cached-run"))
+
+    # Execute the test
+    result = launch_cached_step(step=Step(), launch=mock_launch)
+
+    # Review the results
+    assert isinstance(result, CachedSubmittedRun)
+    assert result.run_id == "cached-run"
+    mock_launch.assert_not_called()
+
+
+def test_launch_cached_step_miss(monkeypatch):
+    # Set up the test
+    mock_step: Step = Step()
+    mock_run: MagicMock = MagicMock()
+    mock_run.run_id = "new-run"
+    mock_launch: MagicMock = MagicMock(return_value=mock_run)
+    mock_client: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.common.step_cache, "fingerprint_step", MagicMock(return_value="mock-fingerprint"))
+    monkeypatch.setattr(mlflow_adsp.common.step_cache, "find_cached_run", MagicMock(return_value=None))
+    monkeypatch.setattr(mlflow, "MlflowClient", MagicMock(return_value=mock_client))
+
+    # Execute the test
+    result = launch_cached_step(step=mock_step, launch=mock_launch)
+
+    # Review the results
+    assert result == mock_run
+    mock_launch.assert_called_once_with(step=mock_step)
+    mock_client.set_tag.assert_called_once_with(run_id="new-run", key=STEP_FINGERPRINT_TAG, value="mock-fingerprint")
+
+
+def test_launch_cached_step_without_fingerprint(monkeypatch):
+    # Set up the test
+    mock_step: Step = Step()
+    monkeypatch.setattr(mlflow_adsp.common.step_cache, "fingerprint_step", MagicMock(return_value=None))
+    monkeypatch.setattr(mlflow_adsp.common.step_cache, "find_cached_run", MagicMock())
+
+    # Execute the test
+    result = launch_cached_step(step=mock_step, launch=MagicMock(return_value="new-run"))
+
+    # Review the results
+    assert result == "new-run"
+    mlflow_adsp.common.step_cache.find_cached_run.assert_not_called()
@@ -0,0 +1,66 @@
+from typing import Dict, List, Set
+
+import pytest
+
+from mlflow_adsp import ADSPMLFlowPluginError, Job, Step
+from mlflow_adsp.common.step_graph import link_steps, release_dependents, skip_dependents
+
+
+def test_link_steps():
+    # Set up the test
+    jobs: List[Job] = [
+        Job(id="a", step=Step(name="prepare")),
+        Job(id="b", step=Step(name="train", depends_on=["prepare", "prepare"])),
+        Job(id="c", step=Step(depends_on=["prepare", "train"])),
+    ]
+
+    # Execute the test
+    blocked, dependents = link_steps(jobs=jobs)
+
+    # Review the results
+    assert blocked == {"b": {"a"}, "c": {"a", "b"}}
+    assert dependents == {"a": ["b", "c"], "b": ["c"]}
+
+
+@pytest.mark.parametrize(
+    "steps, message",
+    [
+        ([Step(name="one"), Step(name="one")], "Step name is not unique: (one)"),
+        ([Step(name="one", depends_on=["two"])], "Step (one) depends on an unknown step: (two)"),
+        (
+            [Step(name="one", depends_on=["two"]), Step(name="two", depends_on=["one"])],
+            "Step dependencies contain a cycle",
+        ),
+    ],
+)
+def test_link_steps_invalid(steps: List[Step], message: str):
+    # Execute the test
+    with pytest.raises(ADSPMLFlowPluginError) as context:
+        link_steps(jobs=[Job(id=str(index), step=step) for index, step in enumerate(steps)])
+
+    # Review the results
+    assert str(context.value) == message
+
+
+def test_release_dependents():
+    # Set up the test
+    blocked: Dict[str, Set[str]] = {"b": {"a"}, "c": {"a", "d"}}
+
+    # Execute the test
+    released: List[str] = release_dependents(job_id="a", blocked=blocked, dependents={"a": ["b", "c"]})
+
+    # Review the results
+    assert released == ["b", "c"]
+    assert blocked == {"c": {"d"}}
+
+
+def test_skip_dependents():
+    # Set up the test
+    blocked: Dict[str, Set[str]] = {"b": {"a"}, "c": {"b"}, "e": {"d"}}
+
+    # Execute the test
+    skipped: List[str] = skip_dependents(job_id="a", blocked=blocked, dependents={"a": ["b"], "b": ["c"], "d": ["e"]})
+
+    # Review the results
+    assert skipped == ["b", "c"]
+    assert blocked == {"e": {"d"}}
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 import mlflow
 
 from mlflow_adsp import create_unique_name
-from mlflow_adsp.common.tracking import _resolve_experiment_name, upsert_experiment
+from mlflow_adsp.common.tracking import _resolve_experiment_name, find_experiment, upsert_experiment
 
 
 def test_create_unique_name():
@@ -55,3 +55,18 @@ def test_upsert_experiment(monkeypatch):
     monkeypatch.setattr(mlflow, "create_experiment", create_experiment_mock)
     id = upsert_experiment()
     assert id == "MOCK-ID-TWO"
+
+
+def test_find_experiment(monkeypatch):
+    # Scenario 1: Experiment exists
+    mock_experiment: MagicMock = MagicMock()
+    mock_experiment.experiment_id = "MOCK-ID"
+    monkeypatch.setattr(mlflow, "get_experiment_by_name", MagicMock(return_value=mock_experiment))
+    monkeypatch.setattr(mlflow, "create_experiment", MagicMock())
+    assert find_experiment(name="Mock-Name") == "MOCK-ID"
+    mlflow.get_experiment_by_name.assert_called_once_with(name="Mock-Name")
+
+    # Scenario 2: Experiment does not exist, and is not created
+    monkeypatch.setattr(mlflow, "get_experiment_by_name", MagicMock(return_value=None))
+    assert find_experiment() is None
+    mlflow.create_experiment.assert_not_called()
@@ -0,0 +1,83 @@
+from typing import List
+
+from mlflow_adsp import Job, Step
+from mlflow_adsp.common.work_queue import WorkQueue
+
+
+def test_build():
+    # Set up the test
+    work_queue: WorkQueue = WorkQueue()
+
+    # Execute the test
+    work_queue.build(steps=[Step(name="prepare"), Step(name="train", depends_on=["prepare"]), Step(priority=1)])
+
+    # Review the results
+    prepare_id, train_id, adhoc_id = list(work_queue.jobs.keys())
+    assert [work_queue.todo.popleft(), work_queue.todo.popleft()] == [adhoc_id, prepare_id]
+    assert work_queue.blocked == {train_id: {prepare_id}}
+    assert work_queue.dependents == {prepare_id: [train_id]}
+
+
+def test_mark_complete():
+    # Set up the test
+    work_queue: WorkQueue = WorkQueue()
+    work_queue.build(steps=[Step(name="prepare"), Step(name="train", depends_on=["prepare"])])
+    prepare_id, train_id = list(work_queue.jobs.keys())
+    work_queue.todo.popleft()
+
+    # Execute the test
+    changed: List[str] = work_queue.mark_complete(job_id=prepare_id, succeeded=True)
+
+    # Review the results
+    assert changed == [prepare_id, train_id]
+    assert list(work_queue.todo) == [train_id]
+    assert work_queue.blocked == {}
+    assert [job.id for job in work_queue.pop_unreported()] == [prepare_id]
+    assert len(work_queue.unreported) == 0
+
+
+def test_mark_complete_failed():
+    # Set up the test
+    work_queue: WorkQueue = WorkQueue()
+    work_queue.build(steps=[Step(name="prepare"), Step(name="train", depends_on=["prepare"])])
+    prepare_id, train_id = list(work_queue.jobs.keys())
+    work_queue.todo.popleft()
+
+    # Execute the test
+    changed: List[str] = work_queue.mark_complete(job_id=prepare_id, succeeded=False)
+
+    # Review the results
+    assert changed == [prepare_id, train_id]
+    assert len(work_queue.todo) == 0
+    assert work_queue.complete == {prepare_id, train_id}
+    assert work_queue.jobs[train_id].blocked_by == prepare_id
+
+
+def test_drain():
+    # Set up the test
+    work_queue: WorkQueue = WorkQueue()
+    work_queue.build(steps=[Step(name="prepare"), Step(name="train", depends_on=["prepare"]), Step()])
+    prepare_id, train_id, adhoc_id = list(work_queue.jobs.keys())
+    work_queue.inprogress.append(work_queue.todo.popleft())
+
+    # Execute the test
+    inprogress, pending = work_queue.drain()
+
+    # Review the results
+    assert inprogress == [prepare_id]
+    assert pending == [adhoc_id, train_id]
+    assert len(work_queue.todo) == 0 and len(work_queue.inprogress) == 0 and len(work_queue.blocked) == 0
+
+
+def test_get_state():
+    # Set up the test
+    work_queue: WorkQueue = WorkQueue()
+    work_queue.jobs = {job_id: Job(id=job_id, step=Step()) for job_id in ["a", "b", "c", "d"]}
+    work_queue.complete.add("a")
+    work_queue.blocked["b"] = {"a"}
+
+    # Execute the test
+    states: List[str] = [work_queue.get_state(job_id=job_id, inprogress={"c"}) for job_id in ["a", "b", "c", "d"]]
+
+    # Review the results
+    assert states == ["complete", "blocked", "inprogress", "todo"]
@@ -0,0 +1,69 @@
+import threading
+import time
+
+from mlflow_adsp.services.change_detector import (
+    AdaptiveChangeDetector,
+    ChangeDetector,
+    EventChangeDetector,
+    WebhookChangeDetector,
+)
+from mlflow_adsp.services.webhook_listener import WebhookListener
+
+
+def test_change_detector():
+    detector = ChangeDetector(interval=0.1)
+
+    detector.record(changed=False)
+    start: float = time.monotonic()
+    detector.wait()
+
+    assert detector.interval == 0.1
+    assert time.monotonic() - start >= 0.1
+
+
+def test_adaptive_change_detector_backs_off():
+    detector = AdaptiveChangeDetector(min_interval=5, max_interval=60)
+
+    intervals: list[float] = []
+    for _ in range(5):
+        detector.record(changed=False)
+        intervals.append(detector.interval)
+    assert intervals == [10, 20, 40, 60, 60]
+
+    detector.record(changed=True)
+    assert detector.interval == 5
+
+
+def test_webhook_change_detector():
+    listener = WebhookListener(host="127.0.0.1", port=0)
+    detector = WebhookChangeDetector(listener=listener, registry="registry", interval=5)
+    threading.Timer(0.2, listener.notify, kwargs={"registry": "registry"}).start()
+
+    start: float = time.monotonic()
+    detector.wait()
+
+    assert time.monotonic() - start < 5
+    assert not detector.event.is_set()
+
+
+def test_webhook_change_detector_times_out():
+    listener = WebhookListener(host="127.0.0.1", port=0)
+    detector = WebhookChangeDetector(listener=listener, registry="registry", interval=0.2)
+    listener.notify(registry="other")
+
+    start: float = time.monotonic()
+    detector.wait()
+
+    assert time.monotonic() - start >= 0.2
+
+
+def test_event_change_detector():
+    event = threading.Event()
+    detector = EventChangeDetector(event=event, interval=5)
+    event.set()
+
+    start: float = time.monotonic()
+    detector.wait()
+
+    assert time.monotonic() - start < 5
+    assert not event.is_set()
@@ -11,7 +11,19 @@ import pytest
 import requests
 
 import mlflow_adsp
-from mlflow_adsp import ADSPMLFlowPluginError, EndpointManager, EndpointManagerParameters
+from mlflow_adsp import (
+    ADSPMLFlowPluginError,
+    ChangeDetectionType,
+    EndpointManager,
+    EndpointManagerParameters,
+    ReloadStrategyType,
+)
+from mlflow_adsp.services.change_detector import (
+    AdaptiveChangeDetector,
+    ChangeDetector,
+    SharedChangeDetector,
+    WebhookChangeDetector,
+)
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
@@ -34,6 +46,9 @@ class MockPOpen:
     def communicate(self, *args, **kwargs):
         return self.stdout, self.stderr
 
+    def wait(self, *args, **kwargs):
+        return None
+
     def poll(self, *args, **kwargs):
         if self.terminated:
             return 1
@@ -47,6 +62,12 @@ class GetMock:
         pass
 
 
+@pytest.fixture(scope="function")
+def stage_in_place(monkeypatch):
+    # Launches reloadable models from their model URI rather than the model cache.
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stage", lambda self, version: self.params.model_uri)
+
+
 def test_non_reloadable_uri(monkeypatch):
     model_uri: str = "runs:/some_run/model"
     params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri)
@@ -54,7 +75,7 @@ def test_non_reloadable_uri(monkeypatch):
 
     mock_popen = MockPOpen()
 
-    def mock_it(args, cwd):
+    def mock_it(args, cwd, **kwargs):
         results = deepcopy(args)
         mock_popen.results = results
         return mock_popen
@@ -88,7 +109,7 @@ def test_non_reloadable_uri_mlserver(monkeypatch):
 
     mock_popen = MockPOpen()
 
-    def mock_it(args, cwd):
+    def mock_it(args, cwd, **kwargs):
         results = deepcopy(args)
         mock_popen.results = results
         return mock_popen
@@ -133,6 +154,7 @@ def test_update_is_not_reloadable(monkeypatch):
     manager._launch.assert_not_called()
 
 
+@pytest.mark.usefixtures("stage_in_place")
 def test_update_is_reloadable_does_not_need_to_reload(monkeypatch):
     model_uri: str = "models:/registry/Production"
     params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri)
@@ -156,6 +178,7 @@ def test_update_is_reloadable_does_not_need_to_reload(monkeypatch):
     assert client.get_latest_versions.call_count == 2
 
 
+@pytest.mark.usefixtures("stage_in_place")
 def test_update_is_reloadable_needs_to_reload(monkeypatch):
     model_uri: str = "models:/registry/Production"
     params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri)
@@ -187,6 +210,7 @@ def test_update_is_reloadable_needs_to_reload(monkeypatch):
     assert client.get_latest_versions.call_count == 2
 
 
+@pytest.mark.usefixtures("stage_in_place")
 def test_get_latest_version_with_stage(monkeypatch):
     model_uri: str = "models:/registry/Production"
     params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri)
@@ -239,6 +263,7 @@ def test_get_latest_version_with_stage_gracefully_fails_mlflow(monkeypatch):
         EndpointManager(client=client, params=params)
 
 
+@pytest.mark.usefixtures("stage_in_place")
 def test_get_latest_version_with_alias(monkeypatch):
     model_uri: str = "models:/registry@winner"
     params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri)
@@ -258,6 +283,7 @@ def test_get_latest_version_with_alias(monkeypatch):
     assert manager._get_latest_version() == "mock-version-alias"
 
 
+@pytest.mark.usefixtures("stage_in_place")
 def test_get_latest_version_fails_gracefully(monkeypatch):
     model_uri: str = "models:/registry/Production"
     params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri)
@@ -331,7 +357,7 @@ def test_process_launch_gracefully_fails(monkeypatch):
     params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri)
     client: MagicMock = MagicMock()
 
-    def mock_it(args, cwd):
+    def mock_it(args, cwd, **kwargs):
         raise ADSPMLFlowPluginError("Boom!")
 
     monkeypatch.setattr(subprocess, "Popen", mock_it)
@@ -346,7 +372,7 @@ def test_process_launch_gracefully_fails_with_other_exceptions(monkeypatch):
     params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri)
     client: MagicMock = MagicMock()
 
-    def mock_it(args, cwd):
+    def mock_it(args, cwd, **kwargs):
         raise Exception("Boom!")
 
     monkeypatch.setattr(subprocess, "Popen", mock_it)
@@ -404,7 +430,7 @@ def test_process_launch_wrapper_gracefully_fails(monkeypatch):
     mock_popen = MockPOpen()
     mock_popen.terminated = True
 
-    def mock_it(args, cwd):
+    def mock_it(args, cwd, **kwargs):
         results = deepcopy(args)
         mock_popen.results = results
         return mock_popen
@@ -437,3 +463,594 @@ def test_process_launch_wrapper_should_timeout(monkeypatch):
 
     with pytest.raises(ADSPMLFlowPluginError):
         EndpointManager(client=client, params=params)
+
+
+def test_process_launch_wrapper_probes_on_short_schedule(monkeypatch):
+    model_uri: str = "runs:/some_run/model"
+    params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri)
+
+    class LocalPOpen(MockPOpen):
+        timeouts: list[float] = []
+
+        def wait(self, *args, **kwargs):
+            LocalPOpen.timeouts.append(kwargs["timeout"])
+            return super().wait(*args, **kwargs)
+
+    class LocalGetMock:
+        status_code_mock = [200, 503, 503, 503]
+
+        def __init__(self, *args, **kwargs):
+            self.status_code = LocalGetMock.status_code_mock.pop()
+
+    monkeypatch.setattr(subprocess, "Popen", LocalPOpen)
+    monkeypatch.setattr(requests, "get", LocalGetMock)
+
+    # execute the test
+    EndpointManager(client=MagicMock(), params=params)
+
+    # review the results
+    assert len(LocalPOpen.timeouts) == 3
+    assert LocalPOpen.timeouts == sorted(LocalPOpen.timeouts)
+    assert all(timeout < params.timeout for timeout in LocalPOpen.timeouts)
+    assert LocalGetMock.status_code_mock == []
+
+
+def test_blue_green_requires_proxy():
+    model_uri: str = "models:/registry/Production"
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri=model_uri, reload_strategy=ReloadStrategyType.BLUE_GREEN
+    )
+
+    with pytest.raises(ADSPMLFlowPluginError):
+        EndpointManager(client=MagicMock(), params=params)
+
+
+def test_blue_green_launches_on_internal_port(monkeypatch):
+    model_uri: str = "runs:/some_run/model"
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri=model_uri, reload_strategy=ReloadStrategyType.BLUE_GREEN
+    )
+    proxy: MagicMock = MagicMock()
+
+    mock_popen = MockPOpen()
+
+    def mock_it(args, cwd, **kwargs):
+        mock_popen.results = deepcopy(args)
+        return mock_popen
+
+    monkeypatch.setattr(subprocess, "Popen", mock_it)
+    monkeypatch.setattr(requests, "get", GetMock)
+
+    # execute the test
+    manager = EndpointManager(client=MagicMock(), params=params, proxy=proxy)
+
+    # review the results
+    assert mock_popen.results[5:9] == ["--host", "127.0.0.1", "--port", "8087"]
+    assert manager.process == mock_popen
+    proxy.switch.assert_called_once_with(backend_port=8087, route=None)
+
+
+@pytest.mark.usefixtures("stage_in_place")
+def test_update_blue_green_swaps_to_standby_port(monkeypatch):
+    model_uri: str = "models:/registry/Production"
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri=model_uri, reload_strategy=ReloadStrategyType.BLUE_GREEN
+    )
+    client: MagicMock = MagicMock()
+    proxy: MagicMock = MagicMock()
+
+    class MockVersion:
+        def __init__(self, version_str: str):
+            self.version: str = version_str
+
+    client.get_latest_versions = MagicMock(
+        side_effect=[[MockVersion(version_str="mock-version-2")], [MockVersion(version_str="mock-version-3")]]
+    )
+
+    blue_process, green_process = MockPOpen(), MockPOpen()
+    monkeypatch.setattr(subprocess, "Popen", MagicMock(side_effect=[blue_process, green_process]))
+    monkeypatch.setattr(requests, "get", GetMock)
+
+    mock_stop: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stop", mock_stop)
+
+    manager = EndpointManager(client=client, params=params, proxy=proxy)
+
+    # execute the test
+    manager.update()
+
+    # review the results
+    assert manager.version == "mock-version-3"
+    assert manager.port == 8088
+    assert manager.process == green_process
+    assert proxy.switch.call_args_list[-1] == unittest.mock.call(backend_port=8088, route=None)
+    proxy.drain.assert_called_once_with(backend_port=8087, timeout=params.drain_timeout)
+    mock_stop.assert_called_once_with(processes=[blue_process])
+
+
+def test_update_blue_green_releases_previous_model(monkeypatch):
+    model_uri: str = "models:/registry/Production"
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri=model_uri, reload_strategy=ReloadStrategyType.BLUE_GREEN
+    )
+    client: MagicMock = MagicMock()
+
+    class MockVersion:
+        def __init__(self, version_str: str):
+            self.version: str = version_str
+
+    client.get_latest_versions = MagicMock(
+        side_effect=[[MockVersion(version_str="mock-version-2")], [MockVersion(version_str="mock-version-3")]]
+    )
+
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stage", lambda self, version: f"/cache/{version}")
+    monkeypatch.setattr(subprocess, "Popen", MockPOpen)
+    monkeypatch.setattr(requests, "get", GetMock)
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stop", MagicMock())
+
+    manager = EndpointManager(client=client, params=params, proxy=MagicMock())
+    manager.cache.stop()
+    manager.cache = MagicMock()
+
+    # execute the test
+    manager.update()
+
+    # review the results
+    assert manager.model_uri == "/cache/mock-version-3"
+    manager.cache.release.assert_called_once_with(path="/cache/mock-version-2")
+
+
+@pytest.mark.usefixtures("stage_in_place")
+def test_update_blue_green_keeps_serving_on_failure(monkeypatch):
+    model_uri: str = "models:/registry/Production"
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri=model_uri, reload_strategy=ReloadStrategyType.BLUE_GREEN
+    )
+    client: MagicMock = MagicMock()
+    proxy: MagicMock = MagicMock()
+
+    class MockVersion:
+        def __init__(self, version_str: str):
+            self.version: str = version_str
+
+    client.get_latest_versions = MagicMock(
+        side_effect=[[MockVersion(version_str="mock-version-2")], [MockVersion(version_str="mock-version-3")]]
+    )
+
+    monkeypatch.setattr(subprocess, "Popen", MockPOpen)
+    monkeypatch.setattr(requests, "get", GetMock)
+    manager = EndpointManager(client=client, params=params, proxy=proxy)
+    blue_process = manager.process
+
+    mock_stop: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stop", mock_stop)
+    manager._process_launch_wrapper = MagicMock(side_effect=ADSPMLFlowPluginError("Boom!"))
+
+    # execute the test
+    with pytest.raises(ADSPMLFlowPluginError):
+        manager.update()
+
+    # review the results
+    assert manager.version == "mock-version-2"
+    assert manager.port == 8087
+    assert manager.process == blue_process
+    proxy.drain.assert_not_called()
+    mock_stop.assert_not_called()
+
+
+@pytest.mark.usefixtures("stage_in_place")
+def test_update_restart_with_proxy_holds_and_drains(monkeypatch):
+    model_uri: str = "models:/registry/Production"
+    params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri, enable_proxy=True)
+    client: MagicMock = MagicMock()
+    proxy: MagicMock = MagicMock()
+
+    class MockVersion:
+        def __init__(self, version_str: str):
+            self.version: str = version_str
+
+    client.get_latest_versions = MagicMock(
+        side_effect=[[MockVersion(version_str="mock-version-2")], [MockVersion(version_str="mock-version-3")]]
+    )
+
+    monkeypatch.setattr(subprocess, "Popen", MockPOpen)
+    monkeypatch.setattr(requests, "get", GetMock)
+    mock_stop: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stop", mock_stop)
+
+    manager = EndpointManager(client=client, params=params, proxy=proxy, route="registry")
+    previous_process = manager.process
+
+    # execute the test
+    manager.update()
+
+    # review the results
+    assert proxy.switch.call_args_list == [
+        unittest.mock.call(backend_port=8087, route="registry"),
+        unittest.mock.call(backend_port=None, route="registry"),
+        unittest.mock.call(backend_port=8087, route="registry"),
+    ]
+    proxy.drain.assert_called_once_with(backend_port=8087, timeout=params.drain_timeout)
+    mock_stop.assert_called_once_with(processes=[previous_process])
+
+
+@pytest.mark.usefixtures("stage_in_place")
+def test_update_restart_relaunches_previous_version_on_failure(monkeypatch):
+    model_uri: str = "models:/registry/Production"
+    params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri, enable_proxy=True)
+    client: MagicMock = MagicMock()
+    proxy: MagicMock = MagicMock()
+
+    class MockVersion:
+        def __init__(self, version_str: str):
+            self.version: str = version_str
+
+    client.get_latest_versions = MagicMock(
+        side_effect=[[MockVersion(version_str="mock-version-2")], [MockVersion(version_str="mock-version-3")]]
+    )
+
+    monkeypatch.setattr(subprocess, "Popen", MockPOpen)
+    monkeypatch.setattr(requests, "get", GetMock)
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stop", MagicMock())
+
+    manager = EndpointManager(client=client, params=params, proxy=proxy)
+    relaunched_process = MockPOpen()
+    manager._process_launch_wrapper = MagicMock(side_effect=[ADSPMLFlowPluginError("Boom!"), relaunched_process])
+
+    # execute the test
+    with pytest.raises(ADSPMLFlowPluginError):
+        manager.update()
+
+    # review the results
+    assert manager.version == "mock-version-2"
+    assert manager.model_uri == model_uri
+    assert manager.process == relaunched_process
+    assert proxy.switch.call_args_list[-1] == unittest.mock.call(backend_port=8087, route=None)
+
+
+def test_stage_without_prefetch(monkeypatch, tmp_path):
+    model_uri: str = "models:/registry/Production"
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri=model_uri, env_manager="conda", model_cache_dir=str(tmp_path)
+    )
+    client: MagicMock = MagicMock()
+
+    class MockVersion:
+        version: str = "7"
+        source: str = "mlflow-artifacts:/0/mock-run/artifacts/model"
+
+    client.get_latest_versions = MagicMock(return_value=[MockVersion()])
+    client.get_model_version = MagicMock(return_value=MockVersion())
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_launch", MagicMock())
+    mock_download: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow.artifacts, "download_artifacts", mock_download)
+    mock_process_launch_wait: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.services.endpoint_manager, "process_launch_wait", mock_process_launch_wait)
+
+    # execute the test
+    manager = EndpointManager(client=client, params=params)
+
+    # review the results
+    # The version is still served from the model cache, only the environment preparation is left to `mlflow serve`.
+    assert os.path.dirname(manager.model_uri) == os.path.join(str(tmp_path), "objects")
+    mock_download.assert_called_once()
+    mock_process_launch_wait.assert_not_called()
+
+
+@pytest.mark.parametrize("prefetch, staged_while_serving", [(True, True), (False, False)])
+def test_update_restart_stages_before_stop_when_prefetching(monkeypatch, prefetch, staged_while_serving):
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri="models:/registry/Production", prefetch=prefetch
+    )
+    client: MagicMock = MagicMock()
+
+    class MockVersion:
+        def __init__(self, version_str: str):
+            self.version: str = version_str
+
+    client.get_latest_versions = MagicMock(
+        side_effect=[[MockVersion(version_str="mock-version-2")], [MockVersion(version_str="mock-version-3")]]
+    )
+    events: list = []
+    monkeypatch.setattr(
+        mlflow_adsp.EndpointManager, "_stage", lambda self, version: events.append(f"stage-{version}") or version
+    )
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_launch", MagicMock())
+    monkeypatch.setattr(
+        mlflow_adsp.EndpointManager, "_stop", MagicMock(side_effect=lambda processes: events.append("stop"))
+    )
+
+    manager = EndpointManager(client=client, params=params)
+    events.clear()
+
+    # execute the test
+    manager.update()
+
+    # review the results
+    expected: list = ["stage-mock-version-3", "stop"] if staged_while_serving else ["stop", "stage-mock-version-3"]
+    assert events == expected
+    assert manager.model_uri == "mock-version-3"
+
+
+def test_stage_with_prefetch(monkeypatch, tmp_path):
+    model_uri: str = "models:/registry/Production"
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri=model_uri, prefetch=True, model_cache_dir=str(tmp_path)
+    )
+    client: MagicMock = MagicMock()
+
+    class MockVersion:
+        version: str = "7"
+        source: str = "mlflow-artifacts:/0/mock-run/artifacts/model"
+
+    def mock_download(artifact_uri, dst_path):
+        with open(os.path.join(dst_path, "MLmodel"), "w") as model_file:
+            model_file.write(artifact_uri)
+
+    client.get_latest_versions = MagicMock(return_value=[MockVersion()])
+    client.get_model_version = MagicMock(return_value=MockVersion())
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_launch", MagicMock())
+    monkeypatch.setattr(mlflow.artifacts, "download_artifacts", MagicMock(side_effect=mock_download))
+
+    # execute the test
+    manager = EndpointManager(client=client, params=params)
+    model_path: str = manager._stage(version="7")
+
+    # review the results
+    assert manager.model_uri == model_path
+    assert os.path.dirname(model_path) == os.path.join(str(tmp_path), "objects")
+    with open(os.path.join(model_path, "MLmodel")) as model_file:
+        assert model_file.read() == "models:/registry/7"
+    mlflow.artifacts.download_artifacts.assert_called_once()
+    client.get_model_version.assert_called_with(name="registry", version="7")
+
+
+def test_stage_with_prefetch_gracefully_fails(monkeypatch, tmp_path):
+    model_uri: str = "models:/registry/Production"
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri=model_uri, prefetch=True, model_cache_dir=str(tmp_path)
+    )
+    client: MagicMock = MagicMock()
+
+    class MockVersion:
+        version: str = "7"
+        source: str = "mlflow-artifacts:/0/mock-run/artifacts/model"
+
+    client.get_latest_versions = MagicMock(return_value=[MockVersion()])
+    client.get_model_version = MagicMock(return_value=MockVersion())
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_launch", MagicMock())
+    monkeypatch.setattr(mlflow.artifacts, "download_artifacts", MagicMock(side_effect=Exception("Boom!")))
+
+    with pytest.raises(ADSPMLFlowPluginError):
+        EndpointManager(client=client, params=params)
+    assert os.listdir(os.path.join(str(tmp_path), "objects")) == []
+
+
+def test_warm_up(monkeypatch, tmp_path):
+    payload_path = tmp_path / "serving_input_example.json"
+    payload_path.write_text('{"inputs": [[1, 2, 3]]}')
+    model_uri: str = "runs:/some_run/model"
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri=model_uri, warm_up_requests=2, warm_up_payload=str(payload_path)
+    )
+
+    monkeypatch.setattr(subprocess, "Popen", MockPOpen)
+    monkeypatch.setattr(requests, "get", GetMock)
+    mock_post: MagicMock = MagicMock(return_value=GetMock())
+    monkeypatch.setattr(requests, "post", mock_post)
+
+    # execute the test
+    EndpointManager(client=MagicMock(), params=params)
+
+    # review the results
+    assert mock_post.call_count == 2
+    assert mock_post.call_args[1]["url"] == "http://0.0.0.0:8086/invocations"
+    assert mock_post.call_args[1]["data"] == b'{"inputs": [[1, 2, 3]]}'
+
+
+def test_warm_up_timeout_keeps_process(monkeypatch, tmp_path):
+    payload_path = tmp_path / "serving_input_example.json"
+    payload_path.write_text('{"inputs": [[1, 2, 3]]}')
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri="runs:/some_run/model",
+        warm_up_requests=2,
+        warm_up_payload=str(payload_path),
+        warm_up_timeout=120,
+    )
+
+    monkeypatch.setattr(subprocess, "Popen", MockPOpen)
+    monkeypatch.setattr(requests, "get", GetMock)
+    mock_post: MagicMock = MagicMock(side_effect=requests.exceptions.Timeout("Slow!"))
+    monkeypatch.setattr(requests, "post", mock_post)
+    mock_stop: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stop", mock_stop)
+
+    # execute the test
+    manager: EndpointManager = EndpointManager(client=MagicMock(), params=params)
+
+    # review the results
+    assert mock_post.call_count == 1
+    assert mock_post.call_args[1]["timeout"] == 120
+    mock_stop.assert_not_called()
+    assert manager.process is not None
+
+
+def test_get_routes():
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uris=["models:/iris@champion", "models:/wine/Production", "churn=runs:/some_run/model"]
+    )
+
+    assert EndpointManager._get_routes(params=params) == {
+        "iris": "models:/iris@champion",
+        "wine": "models:/wine/Production",
+        "churn": "runs:/some_run/model",
+    }
+
+
+@pytest.mark.parametrize(
+    "model_uris",
+    [
+        ["runs:/some_run/model"],
+        ["models:/iris@champion", "models:/iris/Production"],
+    ],
+)
+def test_get_routes_gracefully_fails(model_uris):
+    params: EndpointManagerParameters = EndpointManagerParameters(model_uris=model_uris)
+
+    with pytest.raises(ADSPMLFlowPluginError):
+        EndpointManager._get_routes(params=params)
+
+
+def test_serve_multiple_models(monkeypatch):
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uris=["models:/iris@champion", "models:/wine/Production"]
+    )
+    mock_proxy: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.services.endpoint_manager, "EndpointProxy", mock_proxy)
+    mock_serve_model: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_serve_model", mock_serve_model)
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stop", MagicMock())
+
+    # execute the test
+    EndpointManager.serve(params)
+
+    # review the results
+    assert mock_proxy.call_args[1]["routes"] == ["iris", "wine"]
+    served = sorted(
+        (call[1]["route"], call[1]["params"].model_uri, call[1]["params"].internal_port)
+        for call in mock_serve_model.call_args_list
+    )
+    assert served == [("iris", "models:/iris@champion", 8087), ("wine", "models:/wine/Production", 8089)]
+
+
+@pytest.mark.usefixtures("stage_in_place")
+def test_update_conditional_check(monkeypatch):
+    model_uri: str = "models:/registry@champion"
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri=model_uri, change_detection=ChangeDetectionType.ADAPTIVE
+    )
+    client: MagicMock = MagicMock()
+
+    class MockVersion:
+        def __init__(self, version_str: str):
+            self.version: str = version_str
+
+    class MockRegisteredModel:
+        def __init__(self, timestamp: int, version_str: str):
+            self.last_updated_timestamp: int = timestamp
+            self.aliases: dict = {"champion": version_str}
+
+    client.get_model_version_by_alias = MagicMock(
+        side_effect=[MockVersion(version_str="1"), MockVersion(version_str="1"), MockVersion(version_str="2")]
+    )
+    client.get_registered_model = MagicMock(
+        side_effect=[MockRegisteredModel(1, "1"), MockRegisteredModel(1, "1"), MockRegisteredModel(1, "2")]
+    )
+    mock_launch: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_launch", mock_launch)
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stop", MagicMock())
+
+    manager = EndpointManager(client=client, params=params)
+
+    # execute the test
+    results: list[bool] = [manager.update(), manager.update(), manager.update()]
+
+    # review the results
+    assert results == [False, False, True]
+    assert manager.version == "2"
+    # The unchanged registered model skips the version lookup.
+    assert client.get_model_version_by_alias.call_count == 3
+    assert mock_launch.call_count == 2
+
+
+def test_get_change_detector():
+    model_uri: str = "models:/registry/Production"
+    listener: MagicMock = MagicMock()
+
+    detector = EndpointManager._get_change_detector(params=EndpointManagerParameters(model_uri=model_uri))
+    assert type(detector) is ChangeDetector
+
+    detector = EndpointManager._get_change_detector(
+        params=EndpointManagerParameters(model_uri=model_uri, change_detection=ChangeDetectionType.ADAPTIVE)
+    )
+    assert isinstance(detector, AdaptiveChangeDetector)
+
+    detector = EndpointManager._get_change_detector(
+        params=EndpointManagerParameters(model_uri=model_uri, change_detection=ChangeDetectionType.WEBHOOK),
+        listener=listener,
+    )
+    assert isinstance(detector, WebhookChangeDetector)
+    listener.subscribe.assert_called_once_with(registry="registry")
+
+    watcher: MagicMock = MagicMock()
+    detector = EndpointManager._get_change_detector(
+        params=EndpointManagerParameters(model_uri=model_uri, change_detection=ChangeDetectionType.SHARED),
+        watcher=watcher,
+    )
+    assert isinstance(detector, SharedChangeDetector)
+    watcher.subscribe.assert_called_once()
+
+
+@pytest.mark.usefixtures("stage_in_place")
+def test_get_latest_version_from_watcher(monkeypatch):
+    model_uri: str = "models:/registry@champion"
+    params: EndpointManagerParameters = EndpointManagerParameters(
+        model_uri=model_uri, change_detection=ChangeDetectionType.SHARED
+    )
+    client: MagicMock = MagicMock()
+    watcher: MagicMock = MagicMock()
+    watcher.get_version = MagicMock(side_effect=[None, "3"])
+
+    class MockVersion:
+        version: str = "2"
+
+    client.get_model_version_by_alias = MagicMock(return_value=MockVersion())
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_launch", MagicMock())
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stop", MagicMock())
+
+    # execute the test
+    manager = EndpointManager(client=client, params=params, watcher=watcher)
+    assert manager.version == "2"
+    assert manager.update() is True
+
+    # review the results
+    assert manager.version == "3"
+    client.get_model_version_by_alias.assert_called_once()
+    client.get_registered_model.assert_not_called()
+
+
+@pytest.mark.usefixtures("stage_in_place")
+def test_metrics(monkeypatch):
+    model_uri: str = "models:/metrics-registry/Production"
+    params: EndpointManagerParameters = EndpointManagerParameters(model_uri=model_uri)
+    client: MagicMock = MagicMock()
+
+    class MockVersion:
+        def __init__(self, version_str: str):
+            self.version: str = version_str
+
+    client.get_latest_versions = MagicMock(
+        side_effect=[
+            [MockVersion(version_str="2")],
+            [MockVersion(version_str="3")],
+            mlflow.exceptions.MlflowException("Boom!"),
+        ]
+    )
+    monkeypatch.setattr(subprocess, "Popen", MockPOpen)
+    monkeypatch.setattr(requests, "get", GetMock)
+    monkeypatch.setattr(mlflow_adsp.EndpointManager, "_stop", MagicMock())
+
+    # execute the test
+    manager = EndpointManager(client=client, params=params)
+    manager.update()
+    with pytest.raises(ADSPMLFlowPluginError):
+        manager.update()
+
+    # review the results
+    labels = {"model": "metrics-registry"}
+    assert EndpointManager.STARTUP_DURATION.get_count(**labels, outcome="success") == 2
+    assert EndpointManager.REGISTRY_LOOKUP_DURATION.get_count(**labels, designation="stage", outcome="success") == 2
+    assert EndpointManager.REGISTRY_LOOKUP_DURATION.get_count(**labels, designation="stage", outcome="failure") == 1
+    assert EndpointManager.RELOADS.get(**labels, strategy="restart") == 1
+    assert EndpointManager.SERVED_VERSION.get(**labels) == 3
+    assert "mlflow_adsp_reloads_total" in EndpointManager.METRICS.render()
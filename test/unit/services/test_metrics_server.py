@@ -0,0 +1,53 @@
+import socket
+
+import pytest
+import requests
+
+from mlflow_adsp import ADSPMLFlowPluginError
+from mlflow_adsp.common.metrics import Counter, MetricsRegistry
+from mlflow_adsp.services.metrics_server import MetricsServer
+
+
+def get_free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def test_metrics_endpoint():
+    registry = MetricsRegistry()
+    registry.register(Counter(name="reloads_total", documentation="Reloads.")).inc()
+    server = MetricsServer(registry=registry, host="127.0.0.1", port=get_free_port())
+    server.start()
+
+    try:
+        response = requests.get(url=f"http://127.0.0.1:{server.port}/metrics", timeout=5)
+        assert response.status_code == 200
+        assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "reloads_total 1.0" in response.text
+
+        response = requests.get(url=f"http://127.0.0.1:{server.port}/invocations", timeout=5)
+        assert response.status_code == 404
+    finally:
+        server.stop()
+
+
+def test_start_gracefully_fails():
+    with socket.socket() as occupied:
+        occupied.bind(("127.0.0.1", 0))
+        occupied.listen()
+        server = MetricsServer(registry=MetricsRegistry(), host="127.0.0.1", port=occupied.getsockname()[1])
+
+        with pytest.raises(ADSPMLFlowPluginError):
+            server.start()
+
+
+def test_unsupported_method():
+    server = MetricsServer(registry=MetricsRegistry(), host="127.0.0.1", port=get_free_port())
+    server.start()
+
+    try:
+        response = requests.post(url=f"http://127.0.0.1:{server.port}/metrics", timeout=5)
+        assert response.status_code == 501
+    finally:
+        server.stop()
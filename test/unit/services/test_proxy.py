@@ -0,0 +1,270 @@
+import http.client
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mlflow_adsp import ADSPMLFlowPluginError
+from mlflow_adsp.services.proxy import EndpointProxy
+
+
+class MockBackendHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body: bytes = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.server.delay)
+        payload: bytes = self.server.name + b":" + body
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_backend(name: bytes, delay: float = 0) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockBackendHandler)
+    server.name = name
+    server.delay = delay
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def get_free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def post(connection: http.client.HTTPConnection, payload: bytes) -> tuple[int, bytes]:
+    connection.request("POST", "/invocations", body=payload)
+    response: http.client.HTTPResponse = connection.getresponse()
+    return response.status, response.read()
+
+
+@pytest.fixture(scope="function")
+def proxy():
+    proxy = EndpointProxy(host="127.0.0.1", port=get_free_port(), backend_host="127.0.0.1", hold_timeout=2)
+    proxy.start()
+    yield proxy
+    proxy.stop()
+
+
+def test_forward_and_switch(proxy):
+    blue = start_backend(name=b"blue")
+    green = start_backend(name=b"green")
+    connection = http.client.HTTPConnection("127.0.0.1", proxy.port, timeout=5)
+
+    try:
+        proxy.switch(backend_port=blue.server_address[1])
+        assert post(connection=connection, payload=b"ping") == (200, b"blue:ping")
+        assert post(connection=connection, payload=b"ping") == (200, b"blue:ping")
+
+        # The client connection is kept alive across the switch.
+        proxy.switch(backend_port=green.server_address[1])
+        assert post(connection=connection, payload=b"ping") == (200, b"green:ping")
+
+        assert proxy.drain(backend_port=blue.server_address[1], timeout=1) is True
+    finally:
+        connection.close()
+        blue.shutdown()
+        green.shutdown()
+
+
+def test_requests_are_held_until_routable(proxy):
+    backend = start_backend(name=b"backend")
+    connection = http.client.HTTPConnection("127.0.0.1", proxy.port, timeout=5)
+    threading.Timer(0.5, proxy.switch, kwargs={"backend_port": backend.server_address[1]}).start()
+
+    try:
+        assert post(connection=connection, payload=b"ping") == (200, b"backend:ping")
+    finally:
+        connection.close()
+        backend.shutdown()
+
+
+def test_hold_times_out(proxy):
+    proxy.hold_timeout = 0.2
+    connection = http.client.HTTPConnection("127.0.0.1", proxy.port, timeout=5)
+
+    try:
+        assert post(connection=connection, payload=b"ping") == (503, b"")
+    finally:
+        connection.close()
+
+
+def test_unreachable_backend(proxy):
+    proxy.switch(backend_port=get_free_port())
+    connection = http.client.HTTPConnection("127.0.0.1", proxy.port, timeout=5)
+
+    try:
+        assert post(connection=connection, payload=b"ping") == (502, b"")
+    finally:
+        connection.close()
+
+
+def start_dropping_backend() -> tuple[socket.socket, list]:
+    # Reads each request, then closes the connection without responding.
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    received: list = []
+
+    def serve():
+        while True:
+            try:
+                client, _ = listener.accept()
+            except OSError:
+                return
+            with client:
+                received.append(client.recv(65536))
+
+    threading.Thread(target=serve, daemon=True).start()
+    return listener, received
+
+
+@pytest.mark.parametrize("method, attempts", [("POST", 1), ("GET", 2)])
+def test_only_idempotent_requests_are_resent(proxy, method, attempts):
+    listener, received = start_dropping_backend()
+    proxy.switch(backend_port=listener.getsockname()[1])
+    connection = http.client.HTTPConnection("127.0.0.1", proxy.port, timeout=5)
+
+    try:
+        connection.request(method, "/invocations", body=b"ping" if method == "POST" else None)
+        response: http.client.HTTPResponse = connection.getresponse()
+        assert response.status == 502
+        assert len(received) == attempts
+    finally:
+        connection.close()
+        listener.close()
+
+
+def start_closing_backend() -> tuple[socket.socket, list]:
+    # Answers the first request on each connection (keeping it alive), then closes it on the next request unanswered.
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    received: list = []
+
+    def handle(client: socket.socket):
+        with client:
+            for index in range(2):
+                request: bytes = client.recv(65536)
+                if not request:
+                    return
+                received.append(request)
+                if index == 0:
+                    client.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+
+    def serve():
+        while True:
+            try:
+                client, _ = listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=handle, args=(client,), daemon=True).start()
+
+    threading.Thread(target=serve, daemon=True).start()
+    return listener, received
+
+
+def test_stale_pooled_connections_are_resent(proxy):
+    # Set up the test
+    listener, received = start_closing_backend()
+    proxy.switch(backend_port=listener.getsockname()[1])
+    connection = http.client.HTTPConnection("127.0.0.1", proxy.port, timeout=5)
+
+    try:
+        # Execute the test
+        first: tuple[int, bytes] = post(connection=connection, payload=b"one")
+        second: tuple[int, bytes] = post(connection=connection, payload=b"two")
+
+        # Review the results
+        assert first == (200, b"ok")
+        assert second == (200, b"ok")
+        assert len(received) == 3
+    finally:
+        connection.close()
+        listener.close()
+
+
+def test_drain_waits_for_in_flight_requests(proxy):
+    backend = start_backend(name=b"backend", delay=0.5)
+    proxy.switch(backend_port=backend.server_address[1])
+    results = []
+
+    def send():
+        connection = http.client.HTTPConnection("127.0.0.1", proxy.port, timeout=5)
+        results.append(post(connection=connection, payload=b"ping"))
+        connection.close()
+
+    client = threading.Thread(target=send)
+    client.start()
+
+    try:
+        time.sleep(0.2)
+        assert proxy.drain(backend_port=backend.server_address[1], timeout=0.01) is False
+        assert proxy.drain(backend_port=backend.server_address[1], timeout=2) is True
+        client.join()
+        assert results == [(200, b"backend:ping")]
+    finally:
+        backend.shutdown()
+
+
+def test_start_gracefully_fails():
+    with socket.socket() as occupied:
+        occupied.bind(("127.0.0.1", 0))
+        occupied.listen()
+        proxy = EndpointProxy(host="127.0.0.1", port=occupied.getsockname()[1], backend_host="127.0.0.1")
+
+        with pytest.raises(ADSPMLFlowPluginError):
+            proxy.start()
+
+
+class MockPathHandler(MockBackendHandler):
+    def do_GET(self):
+        payload: bytes = self.server.name + b":" + self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def test_routes():
+    proxy = EndpointProxy(
+        host="127.0.0.1", port=get_free_port(), backend_host="127.0.0.1", hold_timeout=0.2, routes=["iris", "wine"]
+    )
+    proxy.start()
+    iris = ThreadingHTTPServer(("127.0.0.1", 0), MockPathHandler)
+    iris.name = b"iris"
+    iris.delay = 0
+    threading.Thread(target=iris.serve_forever, daemon=True).start()
+    connection = http.client.HTTPConnection("127.0.0.1", proxy.port, timeout=5)
+
+    try:
+        proxy.switch(backend_port=iris.server_address[1], route="iris")
+
+        connection.request("GET", "/iris/version?verbose=1")
+        response: http.client.HTTPResponse = connection.getresponse()
+        assert (response.status, response.read()) == (200, b"iris:/version?verbose=1")
+
+        # Routes are held independently.
+        connection.request("GET", "/wine/version")
+        response = connection.getresponse()
+        assert (response.status, response.read()) == (503, b"")
+        connection.close()
+
+        connection.request("GET", "/unknown/version")
+        response = connection.getresponse()
+        assert (response.status, response.read()) == (404, b"")
+
+        with pytest.raises(ADSPMLFlowPluginError):
+            proxy.switch(backend_port=iris.server_address[1], route="unknown")
+    finally:
+        connection.close()
+        iris.shutdown()
+        proxy.stop()
@@ -0,0 +1,121 @@
+from unittest.mock import MagicMock
+
+import mlflow_adsp
+from mlflow_adsp import TargetMetadata
+from mlflow_adsp.services.registry_watcher import RegistryWatcher
+
+
+class MockModelVersion:
+    def __init__(self, version: str, current_stage: str):
+        self.version: str = version
+        self.current_stage: str = current_stage
+
+
+class MockRegisteredModel:
+    def __init__(self, aliases: dict, latest_versions: list):
+        self.aliases: dict = aliases
+        self.latest_versions: list = latest_versions
+
+
+def test_poll_fans_in_lookups():
+    client: MagicMock = MagicMock()
+    client.get_registered_model = MagicMock(
+        side_effect=[
+            MockRegisteredModel(aliases={"champion": "2"}, latest_versions=[MockModelVersion("1", "Production")]),
+            MockRegisteredModel(aliases={"champion": "3"}, latest_versions=[MockModelVersion("1", "Production")]),
+        ]
+    )
+    watcher = RegistryWatcher(client=client, interval=5)
+    alias = TargetMetadata(model_uri="models:/registry@champion")
+    stage = TargetMetadata(model_uri="models:/registry/production")
+    alias_event = watcher.subscribe(metadata=alias)
+    stage_event = watcher.subscribe(metadata=stage)
+
+    # execute the test
+    watcher.poll()
+
+    # review the results
+    client.get_registered_model.assert_called_once_with(name="registry")
+    assert watcher.get_version(metadata=alias) == "2"
+    assert watcher.get_version(metadata=stage) == "1"
+    assert alias_event.is_set() and stage_event.is_set()
+
+    alias_event.clear()
+    stage_event.clear()
+    watcher.poll()
+
+    assert watcher.get_version(metadata=alias) == "3"
+    assert alias_event.is_set()
+    assert not stage_event.is_set()
+
+
+def test_poll_isolates_failures():
+    client: MagicMock = MagicMock()
+
+    def get_registered_model(name: str):
+        if name == "broken":
+            raise Exception("Boom!")
+        return MockRegisteredModel(aliases={"champion": "7"}, latest_versions=[])
+
+    client.get_registered_model = MagicMock(side_effect=get_registered_model)
+    watcher = RegistryWatcher(client=client, interval=5)
+    broken = TargetMetadata(model_uri="models:/broken@champion")
+    working = TargetMetadata(model_uri="models:/working@champion")
+    watcher.subscribe(metadata=broken)
+    watcher.subscribe(metadata=working)
+
+    # execute the test
+    watcher.poll()
+
+    # review the results
+    assert watcher.get_version(metadata=broken) is None
+    assert watcher.get_version(metadata=working) == "7"
+
+
+def test_poll_survives_secret_loading_failures(monkeypatch):
+    client: MagicMock = MagicMock()
+    monkeypatch.setattr(
+        mlflow_adsp.services.registry_watcher, "load_ae5_user_secrets", MagicMock(side_effect=Exception("Boom!"))
+    )
+    watcher = RegistryWatcher(client=client, interval=5)
+    metadata = TargetMetadata(model_uri="models:/registry@champion")
+    watcher.subscribe(metadata=metadata)
+
+    # execute the test
+    watcher.poll()
+
+    # review the results
+    client.get_registered_model.assert_not_called()
+    assert watcher.get_version(metadata=metadata) is None
+
+
+def test_unassigned_designation():
+    client: MagicMock = MagicMock()
+    client.get_registered_model = MagicMock(return_value=MockRegisteredModel(aliases={}, latest_versions=[]))
+    watcher = RegistryWatcher(client=client, interval=5)
+    metadata = TargetMetadata(model_uri="models:/registry@champion")
+    event = watcher.subscribe(metadata=metadata)
+
+    watcher.poll()
+
+    assert watcher.get_version(metadata=metadata) is None
+    assert not event.is_set()
+
+
+def test_removed_designation_is_forgotten():
+    client: MagicMock = MagicMock()
+    client.get_registered_model = MagicMock(
+        side_effect=[
+            MockRegisteredModel(aliases={"champion": "2"}, latest_versions=[]),
+            MockRegisteredModel(aliases={}, latest_versions=[]),
+        ]
+    )
+    watcher = RegistryWatcher(client=client, interval=5)
+    metadata = TargetMetadata(model_uri="models:/registry@champion")
+    watcher.subscribe(metadata=metadata)
+
+    watcher.poll()
+    assert watcher.get_version(metadata=metadata) == "2"
+
+    watcher.poll()
+    assert watcher.get_version(metadata=metadata) is None
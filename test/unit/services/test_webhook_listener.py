@@ -0,0 +1,83 @@
+import json
+import socket
+
+import pytest
+import requests
+
+from mlflow_adsp import ADSPMLFlowPluginError
+from mlflow_adsp.services.webhook_listener import WebhookListener
+
+
+def get_free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+@pytest.fixture(scope="function")
+def listener():
+    listener = WebhookListener(host="127.0.0.1", port=get_free_port(), token="secret")
+    listener.start()
+    yield listener
+    listener.stop()
+
+
+def test_notify_subscribers(listener):
+    registry_event = listener.subscribe(registry="registry")
+    other_event = listener.subscribe(registry="other")
+
+    response = requests.post(
+        url=f"http://127.0.0.1:{listener.port}/",
+        data=json.dumps({"entity": "model_version_alias", "action": "created", "data": {"name": "registry"}}),
+        headers={"Authorization": "Bearer secret"},
+        timeout=5,
+    )
+
+    assert response.status_code == 202
+    assert registry_event.is_set()
+    assert not other_event.is_set()
+
+
+def test_notify_all_subscribers(listener):
+    events = [listener.subscribe(registry="registry"), listener.subscribe(registry="other")]
+
+    response = requests.post(
+        url=f"http://127.0.0.1:{listener.port}/", headers={"Authorization": "Bearer secret"}, timeout=5
+    )
+
+    assert response.status_code == 202
+    assert all(event.is_set() for event in events)
+
+
+def test_unauthorized(listener):
+    event = listener.subscribe(registry="registry")
+
+    response = requests.post(url=f"http://127.0.0.1:{listener.port}/", json={"name": "registry"}, timeout=5)
+
+    assert response.status_code == 401
+    assert not event.is_set()
+
+
+@pytest.mark.parametrize(
+    "body, registry",
+    [
+        (b'{"data": {"name": "registry"}}', "registry"),
+        (b'{"name": "registry"}', "registry"),
+        (b'{"model_name": "registry"}', "registry"),
+        (b"[]", None),
+        (b"not json", None),
+        (b"", None),
+    ],
+)
+def test_get_registry(body, registry):
+    assert WebhookListener.get_registry(body=body) == registry
+
+
+def test_start_gracefully_fails():
+    with socket.socket() as occupied:
+        occupied.bind(("127.0.0.1", 0))
+        occupied.listen()
+        listener = WebhookListener(host="127.0.0.1", port=occupied.getsockname()[1])
+
+        with pytest.raises(ADSPMLFlowPluginError):
+            listener.start()
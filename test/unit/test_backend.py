@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+import mlflow_adsp
 from ae5_tools.api import AEUserSession
 from mlflow_adsp import ADSPProjectBackend, ADSPSubmittedRun
 
@@ -68,6 +69,7 @@ def test_run(get_ae_user_session):
 
     # Review the results
     assert submitted_run.adsp_job_id == "MOCK-JOB-ID"
+    assert submitted_run.wait_interval == 2 and submitted_run.wait_timeout is None
 
     mock: MagicMock = mock_session.job_create
     call_arguments = mock.call_args[1]
@@ -84,3 +86,72 @@ def test_run(get_ae_user_session):
         },
         "run": True,
     }
+
+
+def test_run_with_wait_config(get_ae_user_session):
+    # Set up test
+    mock_session = get_ae_user_session
+    mock_session.job_create = MagicMock(return_value={"id": "MOCK-JOB-ID"})
+    backend = ADSPProjectBackend(ae_session=mock_session)
+
+    params: Dict = {
+        "project_uri": "./test/fixtures/consumer",
+        "entry_point": "main",
+        "params": {"param_one": "MOCK-PARAM-VALUE"},
+        "version": "2d0335398980b62e556a79b9d2198bbec7964a7b",  # `git rev-parse HEAD` of the project repo
+        "backend_config": {
+            "PROJECT_STORAGE_DIR": "./test/fixtures/consumer",
+            "STORAGE_DIR": "./test/fixtures/consumer",
+            "wait_interval": 1,
+            "wait_interval_max": 300,
+            "wait_timeout": 3600,
+        },
+        "tracking_uri": "MOCK-TRACKING-URI",
+        "experiment_id": "0",
+    }
+
+    # Execute test
+    submitted_run = backend.run(**params)
+
+    # Review the results
+    assert submitted_run.wait_interval == 1
+    assert submitted_run.wait_interval_max == 300
+    assert submitted_run.wait_backoff_factor == 1.5
+    assert submitted_run.wait_timeout == 3600
+
+
+def test_submit_job_retries_rejected_session(monkeypatch, get_ae_user_session):
+    # Set up test
+    monkeypatch.setenv("TOOL_PROJECT_URL", "http://mock-storage/projects/mock-project-id")
+    get_ae_user_session.job_create = MagicMock(side_effect=Exception("Unexpected response: 401 Unauthorized"))
+    renewed_session: AEUserSession = AEUserSession(
+        hostname="MOCK-HOSTNAME", username="MOCK-AE-USERNAME", password="MOCK-AE-USER-PASSWORD"
+    )
+    renewed_session.job_create = MagicMock(return_value={"id": "MOCK-JOB-ID"})
+    mock_refresh_session: MagicMock = MagicMock(return_value=renewed_session)
+    monkeypatch.setattr(mlflow_adsp.backend, "refresh_session", mock_refresh_session)
+    backend = ADSPProjectBackend(ae_session=get_ae_user_session)
+
+    # Execute test
+    result: Dict = backend._submit_job(mlflow_run_id="MOCK-RUN-ID")
+
+    # Review the results
+    assert result == {"id": "MOCK-JOB-ID"}
+    mock_refresh_session.assert_called_once_with(ae_session=get_ae_user_session)
+    assert backend.ae_session is renewed_session
+
+
+def test_submit_job_raises_other_errors(monkeypatch, get_ae_user_session):
+    # Set up test
+    monkeypatch.setenv("TOOL_PROJECT_URL", "http://mock-storage/projects/mock-project-id")
+    get_ae_user_session.job_create = MagicMock(side_effect=Exception("Unexpected response: 500 Server Error"))
+    mock_refresh_session: MagicMock = MagicMock()
+    monkeypatch.setattr(mlflow_adsp.backend, "refresh_session", mock_refresh_session)
+    backend = ADSPProjectBackend(ae_session=get_ae_user_session)
+
+    # Execute test
+    with pytest.raises(Exception):
+        backend._submit_job(mlflow_run_id="MOCK-RUN-ID")
+
+    # Review the results
+    mock_refresh_session.assert_not_called()
@@ -1,3 +1,5 @@
+import random
+import time
 import uuid
 from typing import Dict, List
 from unittest.mock import MagicMock
@@ -5,6 +7,7 @@ from unittest.mock import MagicMock
 import pytest
 from mlflow.entities import RunStatus
 
+import mlflow_adsp
 from ae5_tools.api import AEUserSession
 from mlflow_adsp import ADSPMLFlowPluginError, ADSPSubmittedRun, AEProjectJobRunStateType
 
@@ -69,6 +72,38 @@ def test_get_log(submitted_run):
     submitted_run.ae_session.run_log.assert_called_once_with(ident=mock_job_runs[0]["id"])
 
 
+def test_iter_log(submitted_run):
+    # Set up the scenario
+    mock_job_runs: List[Dict] = [{"id": str(uuid.uuid4()), "state": AEProjectJobRunStateType.COMPLETED}]
+    submitted_run.ae_session.job_runs = MagicMock(return_value=mock_job_runs)
+    submitted_run.ae_session.run_log = MagicMock(return_value="0123456789")
+
+    # Execute the test
+    chunks: List[str] = list(submitted_run.iter_log(offset=2, chunk_size=3))
+
+    # Review the results
+    assert chunks == ["234", "567", "89"]
+    submitted_run.ae_session.run_log.assert_called_once_with(ident=mock_job_runs[0]["id"])
+
+
+def test_iter_log_follow(monkeypatch, submitted_run):
+    # Set up the scenario
+    run_id: str = str(uuid.uuid4())
+    states: List[str] = [AEProjectJobRunStateType.RUNNING] * 3 + [AEProjectJobRunStateType.COMPLETED]
+    submitted_run.ae_session.job_runs = MagicMock(side_effect=[[{"id": run_id, "state": state}] for state in states])
+    submitted_run.ae_session.run_log = MagicMock(side_effect=["one\n", "one\n", "one\ntwo\n", "one\ntwo\nthree\n"])
+    monkeypatch.setattr(random, "uniform", MagicMock(return_value=1.0))
+    monkeypatch.setattr(time, "sleep", MagicMock())
+
+    # Execute the test
+    chunks: List[str] = list(submitted_run.iter_log(follow=True))
+
+    # Review the results
+    assert chunks == ["one\n", "two\n", "three\n"]
+    # The wait backs off while there is no new output, and returns to the initial interval once there is.
+    assert [call.args[0] for call in time.sleep.call_args_list] == [2, 3, 2]
+
+
 def test_wait_on_job_run(submitted_run):
     # Set up the scenario
     mock_job_runs: List[Dict] = [{"id": str(uuid.uuid4()), "state": AEProjectJobRunStateType.FAILED}]
@@ -95,6 +130,47 @@ def test_wait_on_job_run_with_a_wait(submitted_run):
     assert submitted_run.ae_session.job_runs.call_count == 2
 
 
+def test_wait_on_job_run_backs_off(monkeypatch, submitted_run):
+    # Set up the scenario
+    submitted_run.wait_interval = 1
+    submitted_run.wait_interval_max = 5
+    submitted_run.wait_backoff_factor = 2
+    running: List[Dict] = [{"id": str(uuid.uuid4()), "state": AEProjectJobRunStateType.RUNNING}]
+    completed: List[Dict] = [{"id": str(uuid.uuid4()), "state": AEProjectJobRunStateType.COMPLETED}]
+    submitted_run.ae_session.job_runs = MagicMock(side_effect=[running] * 5 + [completed])
+    monkeypatch.setattr(random, "uniform", MagicMock(return_value=1.1))
+    monkeypatch.setattr(time, "sleep", MagicMock())
+
+    # Execute the test
+    submitted_run._wait_on_job_run()
+
+    # Review the results
+    delays: List[float] = [call.args[0] for call in time.sleep.call_args_list]
+    assert delays == pytest.approx([1.1, 2.2, 4.4, 5.5, 5.5])
+    random.uniform.assert_called_with(0.9, 1.1)
+
+
+def test_wait_on_job_run_timeout(monkeypatch, submitted_run):
+    # Set up the scenario
+    submitted_run.wait_interval = 10
+    submitted_run.wait_timeout = 15
+    running: List[Dict] = [{"id": str(uuid.uuid4()), "state": AEProjectJobRunStateType.RUNNING}]
+    submitted_run.ae_session.job_runs = MagicMock(return_value=running)
+    clock: List[float] = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(time, "sleep", MagicMock(side_effect=lambda delay: clock.__setitem__(0, clock[0] + delay)))
+    monkeypatch.setattr(random, "uniform", MagicMock(return_value=1.0))
+
+    # Execute the test
+    with pytest.raises(ADSPMLFlowPluginError):
+        submitted_run._wait_on_job_run()
+
+    # Review the results
+    # The last wait is cut short at the deadline.
+    assert [call.args[0] for call in time.sleep.call_args_list] == [10, 5]
+    assert submitted_run.ae_session.job_runs.call_count == 3
+
+
 def test_wait_success(submitted_run):
     # Set up the scenario
     mock_job_runs: List[Dict] = [{"id": str(uuid.uuid4()), "state": AEProjectJobRunStateType.COMPLETED}]
@@ -134,13 +210,67 @@ def test_get_status(submitted_run):
         mock_job_runs: List[Dict] = [{"id": test_case["id"], "state": test_case["state"]}]
         submitted_run.ae_session.job_runs = MagicMock(return_value=mock_job_runs)
 
-        # Execute the test
-        status = submitted_run.get_status()
+        # Execute the test (on a run without a cached status)
+        status = submitted_run.model_copy().get_status()
 
         # Review the results
         assert status == test_case["expected_result"]
 
 
+def test_get_status_reuses_fresh_status(monkeypatch, submitted_run):
+    # Set up the scenario
+    clock: List[float] = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    running: List[Dict] = [{"id": str(uuid.uuid4()), "state": AEProjectJobRunStateType.RUNNING}]
+    completed: List[Dict] = [{"id": str(uuid.uuid4()), "state": AEProjectJobRunStateType.COMPLETED}]
+    submitted_run.ae_session.job_runs = MagicMock(side_effect=[running, completed])
+
+    # Execute the test
+    statuses: List[RunStatus] = [submitted_run.get_status()]
+    clock[0] += submitted_run.status_ttl - 1
+    statuses.append(submitted_run.get_status())
+    clock[0] += 1
+    statuses.append(submitted_run.get_status())
+    # Finished runs are reused indefinitely.
+    clock[0] += 1000
+    statuses.append(submitted_run.get_status())
+
+    # Review the results
+    assert statuses == [RunStatus.RUNNING, RunStatus.RUNNING, RunStatus.FINISHED, RunStatus.FINISHED]
+    assert submitted_run.ae_session.job_runs.call_count == 2
+
+
+def test_wait_reuses_finished_status(submitted_run):
+    # Set up the scenario
+    mock_job_runs: List[Dict] = [{"id": str(uuid.uuid4()), "state": AEProjectJobRunStateType.COMPLETED}]
+    submitted_run.ae_session.job_runs = MagicMock(return_value=mock_job_runs)
+    submitted_run.ae_session.run_log = MagicMock(return_value="mock logs")
+
+    # Execute the test
+    result: bool = submitted_run.wait()
+    status: RunStatus = submitted_run.get_status()
+    logs: List[str] = [submitted_run.get_log(), submitted_run.get_log()]
+
+    # Review the results
+    assert result is True and status == RunStatus.FINISHED and logs == ["mock logs", "mock logs"]
+    submitted_run.ae_session.job_runs.assert_called_once_with(ident=submitted_run.adsp_job_id)
+    submitted_run.ae_session.run_log.assert_called_once_with(ident=mock_job_runs[0]["id"])
+
+
+def test_get_log_of_running_job(submitted_run):
+    # Set up the scenario
+    submitted_run.status_ttl = 0
+    mock_job_runs: List[Dict] = [{"id": str(uuid.uuid4()), "state": AEProjectJobRunStateType.RUNNING}]
+    submitted_run.ae_session.job_runs = MagicMock(return_value=mock_job_runs)
+    submitted_run.ae_session.run_log = MagicMock(side_effect=["mock logs", "mock logs, more"])
+
+    # Execute the test
+    logs: List[str] = [submitted_run.get_log(), submitted_run.get_log()]
+
+    # Review the results
+    assert logs == ["mock logs", "mock logs, more"]
+
+
 def test_get_status_gracefully_fails(submitted_run):
     # Set up the scenario
     mock_job_runs: List[Dict] = [{"id": str(uuid.uuid4()), "state": "MOCK-STATE"}]
@@ -151,6 +281,75 @@ def test_get_status_gracefully_fails(submitted_run):
         submitted_run.get_status()
 
 
+def test_get_status_retries_rejected_session(monkeypatch, submitted_run):
+    # Set up the scenario
+    rejected_session: AEUserSession = submitted_run.ae_session
+    rejected_session.job_runs = MagicMock(side_effect=Exception("Unexpected response: 401 Unauthorized"))
+    renewed_session: AEUserSession = AEUserSession(
+        hostname="MOCK-HOSTNAME", username="MOCK-AE-USERNAME", password="MOCK-AE-USER-PASSWORD"
+    )
+    renewed_session.job_runs = MagicMock(
+        return_value=[{"id": "MOCK-RUN-ID", "state": AEProjectJobRunStateType.RUNNING}]
+    )
+    mock_refresh_session: MagicMock = MagicMock(return_value=renewed_session)
+    monkeypatch.setattr(mlflow_adsp.submitted_run, "refresh_session", mock_refresh_session)
+
+    # Execute the test
+    status: RunStatus = submitted_run.get_status()
+
+    # Review the results
+    assert status == RunStatus.RUNNING
+    mock_refresh_session.assert_called_once_with(ae_session=rejected_session)
+    assert submitted_run.ae_session is renewed_session
+
+
+def test_get_statuses(monkeypatch, get_ae_user_session):
+    # Set up the scenario
+    monkeypatch.setenv("TOOL_PROJECT_URL", "http://mock-storage/projects/mock-project-id")
+    job_ids: List[str] = [str(uuid.uuid4()) for _ in range(3)]
+    mock_run_list: List[Dict] = [
+        {"id": str(uuid.uuid4()), "job_id": job_ids[0], "state": AEProjectJobRunStateType.COMPLETED},
+        {"id": str(uuid.uuid4()), "job_id": job_ids[1], "state": AEProjectJobRunStateType.RUNNING},
+        {"id": str(uuid.uuid4()), "job_id": job_ids[2], "state": AEProjectJobRunStateType.RUNNING},
+        {"id": str(uuid.uuid4()), "job_id": job_ids[2], "state": AEProjectJobRunStateType.FAILED},
+        {"id": str(uuid.uuid4()), "job_id": str(uuid.uuid4()), "state": "MOCK-STATE"},
+    ]
+    get_ae_user_session.run_list = MagicMock(return_value=mock_run_list)
+
+    # Execute the test
+    statuses: Dict[str, RunStatus] = ADSPSubmittedRun.get_statuses(ae_session=get_ae_user_session, adsp_job_ids=job_ids)
+
+    # Review the results
+    get_ae_user_session.run_list.assert_called_once_with(filter="project_id=a0-mock-project-id")
+    # Jobs outside the request are ignored, jobs with an ambiguous run listing are omitted.
+    assert statuses == {job_ids[0]: RunStatus.FINISHED, job_ids[1]: RunStatus.RUNNING}
+
+
+def test_get_run_statuses(monkeypatch, get_ae_user_session):
+    # Set up the scenario
+    failing_session: MagicMock = MagicMock()
+    runs: List[ADSPSubmittedRun] = [
+        ADSPSubmittedRun(ae_session=get_ae_user_session, mlflow_run_id="one", adsp_job_id="job-one", response={}),
+        ADSPSubmittedRun(ae_session=get_ae_user_session, mlflow_run_id="two", adsp_job_id="job-two", response={}),
+    ]
+    runs.append(runs[0].model_copy(update={"ae_session": failing_session, "adsp_job_id": "job-three"}))
+
+    def mock_get_statuses(ae_session, adsp_job_ids: List[str]) -> Dict[str, RunStatus]:
+        if ae_session is failing_session:
+            raise ADSPMLFlowPluginError("Boom!")
+        return {adsp_job_id: RunStatus.RUNNING for adsp_job_id in adsp_job_ids}
+
+    monkeypatch.setattr(ADSPSubmittedRun, "get_statuses", MagicMock(side_effect=mock_get_statuses))
+
+    # Execute the test
+    statuses: Dict[str, RunStatus] = ADSPSubmittedRun.get_run_statuses(runs=runs)
+
+    # Review the results
+    # One listing per session, the runs of a failed listing are omitted.
+    assert ADSPSubmittedRun.get_statuses.call_count == 2
+    assert statuses == {"job-one": RunStatus.RUNNING, "job-two": RunStatus.RUNNING}
+
+
 def test_cancel(submitted_run):
     # Set up the scenario
     submitted_run.ae_session.run_stop = MagicMock()